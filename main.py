@@ -3,14 +3,16 @@
 Main entry point for running the Agentic Newsroom workflow.
 
 This script runs the complete editorial pipeline from article idea to publication.
-"""
 
-from dotenv import load_dotenv
-load_dotenv()
+The package is imported only once the arguments are parsed, inside the code paths
+that use it, so `--help` and argument errors don't wait for langgraph and the agents.
+Importing it also loads `.env`.
+"""
 
 import argparse
-from agentic_newsroom.workflows.newsroom_workflow import build_newsroom_workflow
-from agentic_newsroom.utils.newsroom_logging import setup_logging
+import asyncio
+import hashlib
+import sys
 
 
 def main():
@@ -21,38 +23,299 @@ def main():
 Examples:
   python main.py "The mysterious dragon blood trees of Socotra Island"
   python main.py "Deep sea hydrothermal vents and their unique ecosystems"
+  python main.py --stream "The mysterious dragon blood trees of Socotra Island"
+  python main.py --batch ideas.jsonl --output results.jsonl --concurrency 8
+  cat ideas.jsonl | python main.py --batch - > results.jsonl
+  python main.py --batch ideas.jsonl --async --concurrency 32
+  python main.py --resume deep-sea-hydrothermal-vents
+  python main.py --resume deep-sea-hydrothermal-vents --from-stage reporter
         """
     )
     parser.add_argument(
         "article_idea",
+        nargs="?",
         help="The article idea to process through the full editorial pipeline"
     )
+    parser.add_argument(
+        "--batch",
+        metavar="PATH",
+        help="Process article ideas from a JSONL file ('-' for stdin) instead of a single idea"
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="SLUG",
+        help="Continue an earlier run from the artifacts saved under artifacts/SLUG/"
+    )
+    parser.add_argument(
+        "--from-stage",
+        metavar="STAGE",
+        help="With --resume, rerun this stage (e.g. reporter) and everything after it"
+    )
+    parser.add_argument(
+        "--output",
+        metavar="PATH",
+        default="-",
+        help="JSONL file to append batch results to (default: stdout)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="Max articles processed at once in batch mode (default: 4)"
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Run the workflow with ainvoke on a single event loop instead of threads"
+    )
+    parser.add_argument(
+        "--parallel-review",
+        action="store_true",
+        help="Reporter runs fact and style reviews concurrently and revises once"
+    )
+    parser.add_argument(
+        "--patch-revisions",
+        action="store_true",
+        help="Reporter revises only the paragraphs the reviews flagged instead of rewriting the draft"
+    )
+    parser.add_argument(
+        "--sectioned-draft",
+        action="store_true",
+        help="Reporter writes a Full Feature section by section in parallel, then stitches the sections"
+    )
+    parser.add_argument(
+        "--pipelined-research",
+        action="store_true",
+        help="Research assistant plans the next turn's queries while pages are extracted"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk Tavily search/extract cache"
+    )
+    parser.add_argument(
+        "--llm-cache",
+        action="store_true",
+        help="Replay identical LLM calls from the on-disk response cache"
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Print each stage as it finishes and the draft and article text as it is generated"
+    )
+    parser.add_argument(
+        "--otel",
+        action="store_true",
+        help="Also emit OpenTelemetry spans for every node and LLM call (needs opentelemetry-api)"
+    )
 
     args = parser.parse_args()
 
+    if sum(map(bool, (args.article_idea, args.batch, args.resume))) != 1:
+        parser.error("provide exactly one of an article idea, --batch or --resume")
+    if args.from_stage and not args.resume:
+        parser.error("--from-stage requires --resume")
+    if args.stream and args.batch:
+        parser.error("--stream can't be used with --batch")
+    if args.from_stage:
+        from agentic_newsroom.workflows.newsroom_workflow import STAGES
+
+        if args.from_stage not in STAGES[1:]:
+            parser.error(f"--from-stage must be one of: {', '.join(STAGES[1:])}")
+
+    from agentic_newsroom.utils.newsroom_logging import setup_logging
+
     setup_logging()
 
-    article_idea = args.article_idea
+    config = build_config(args)
+
+    if args.batch:
+        run_batch_mode(args.batch, args.output, args.concurrency, args.use_async, config, args.otel)
+    elif args.resume:
+        run_resume(args.resume, args.from_stage, args.use_async, config, args.otel, args.stream)
+    else:
+        run_single(args.article_idea, args.use_async, config, args.otel, args.stream)
+
+
+def build_config(args) -> dict:
+    """Translate CLI flags into the workflow's configurable options."""
+    configurable = {}
+    if args.parallel_review:
+        configurable["review_mode"] = "parallel"
+    if args.patch_revisions:
+        configurable["revision_mode"] = "patch"
+    if args.sectioned_draft:
+        configurable["draft_mode"] = "sectioned"
+    if args.pipelined_research:
+        configurable["research_mode"] = "pipelined"
+    if args.no_cache:
+        configurable["tavily_cache"] = False
+    if args.llm_cache:
+        configurable["llm_cache"] = True
+    return {"configurable": configurable}
+
+
+def run_batch_mode(input_path: str, output_path: str, concurrency: int = None, use_async: bool = False,
+                   config: dict = None, otel: bool = False):
+    """Run many article ideas concurrently and stream results as JSONL."""
+    from agentic_newsroom.workflows.batch import DEFAULT_CONCURRENCY, run_batch, arun_batch, open_input, open_output
+
+    concurrency = concurrency or DEFAULT_CONCURRENCY
+    print(f"Agentic Newsroom: Batch processing (concurrency={concurrency})...", file=sys.stderr)
+
+    source = open_input(input_path)
+    output = open_output(output_path)
+    try:
+        if use_async:
+            counts = asyncio.run(arun_batch(source, output, concurrency=concurrency, config=config, otel=otel))
+        else:
+            counts = run_batch(source, output, concurrency=concurrency, config=config, otel=otel)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+
+    print(f"Batch complete: {counts['ok']} ok, {counts['error']} failed, {counts['total']} total", file=sys.stderr)
+    if counts["error"]:
+        sys.exit(1)
+
+
+def _with_thread_id(config: dict, thread_id: str) -> dict:
+    """Add the checkpoint thread_id to a config."""
+    config = config or {}
+    return {**config, "configurable": {**config.get("configurable", {}), "thread_id": thread_id}}
+
+
+def _run_streamed(workflow, workflow_input, config: dict) -> dict:
+    """Run the workflow printing its stream as it goes, and return the final state."""
+    from agentic_newsroom.utils.streaming import STREAM_MODES, StreamPrinter
+
+    printer = StreamPrinter()
+    for chunk in workflow.stream(workflow_input, config, stream_mode=STREAM_MODES, subgraphs=True):
+        printer.handle(chunk)
+    return workflow.get_state(config).values
+
+
+async def _arun_streamed(workflow, workflow_input, config: dict) -> dict:
+    """Async version of _run_streamed."""
+    from agentic_newsroom.utils.streaming import STREAM_MODES, StreamPrinter
+
+    printer = StreamPrinter()
+    async for chunk in workflow.astream(workflow_input, config, stream_mode=STREAM_MODES, subgraphs=True):
+        printer.handle(chunk)
+    return (await workflow.aget_state(config)).values
+
+
+def _invoke_checkpointed(workflow, initial_state: dict, config: dict, continue_pending: bool,
+                         stream: bool = False) -> dict:
+    """Invoke the workflow, continuing the thread's interrupted run if there is one."""
+    workflow_input = initial_state
+    if continue_pending and workflow.get_state(config).next:
+        print("Continuing interrupted run from its last checkpoint...\n")
+        workflow_input = None
+    if stream:
+        return _run_streamed(workflow, workflow_input, config)
+    return workflow.invoke(workflow_input, config)
+
+
+async def _ainvoke_checkpointed(workflow, initial_state: dict, config: dict, continue_pending: bool,
+                                stream: bool = False) -> dict:
+    """Async version of _invoke_checkpointed."""
+    workflow_input = initial_state
+    if continue_pending and (await workflow.aget_state(config)).next:
+        print("Continuing interrupted run from its last checkpoint...\n")
+        workflow_input = None
+    if stream:
+        return await _arun_streamed(workflow, workflow_input, config)
+    return await workflow.ainvoke(workflow_input, config)
+
+
+def run_workflow(initial_state: dict, thread_id: str, use_async: bool = False, config: dict = None,
+                 continue_pending: bool = True, stream: bool = False) -> dict:
+    """Run the workflow with a SQLite checkpointer so an interrupted run can be picked up again.
+
+    When `continue_pending` is set and the thread's last run stopped before
+    reaching END, it continues from that checkpoint instead of starting over.
+    With `stream`, progress and the draft and article text are printed live.
+    """
+    from agentic_newsroom.workflows.newsroom_workflow import build_newsroom_workflow, sqlite_checkpointer, async_sqlite_checkpointer
+
+    config = _with_thread_id(config, thread_id)
+
+    if use_async:
+        async def arun():
+            async with async_sqlite_checkpointer() as checkpointer:
+                workflow = build_newsroom_workflow(checkpointer=checkpointer)
+                return await _ainvoke_checkpointed(workflow, initial_state, config, continue_pending, stream)
+        return asyncio.run(arun())
+
+    with sqlite_checkpointer() as checkpointer:
+        workflow = build_newsroom_workflow(checkpointer=checkpointer)
+        return _invoke_checkpointed(workflow, initial_state, config, continue_pending, stream)
+
+
+def run_with_metrics(initial_state: dict, thread_id: str, use_async: bool = False, config: dict = None,
+                     continue_pending: bool = True, otel: bool = False, stream: bool = False) -> dict:
+    """run_workflow() with a MetricsCollector attached; saves and prints the breakdown."""
+    from agentic_newsroom.utils.metrics import MetricsCollector, format_breakdown
+
+    metrics = MetricsCollector(otel=otel)
+    config = {**(config or {}), "callbacks": [metrics]}
+    result = run_workflow(initial_state, thread_id, use_async, config, continue_pending, stream)
+
+    story_brief = result.get("story_brief")
+    if story_brief:
+        metrics.save(story_brief.slug)
+    print("\n" + format_breakdown(metrics.summary()) + "\n")
+    return result
+
+
+def run_single(article_idea: str, use_async: bool = False, config: dict = None, otel: bool = False,
+               stream: bool = False):
+    """Run the full workflow for one article idea and print a summary."""
     print(f"Agentic Newsroom: Processing article idea...")
     print(f"   Idea: {article_idea}\n")
 
-    # Build the workflow
-    workflow = build_newsroom_workflow()
-
-    # Run the workflow
+    # Later stages are listed as None so a rerun of a finished thread starts over
     initial_state = {
         "article_idea": article_idea,
+        **{key: None for key in ("story_brief", "research_package", "draft_package",
+                                 "final_article", "hero_image_path", "approval")},
     }
+    thread_id = "idea-" + hashlib.sha256(article_idea.encode("utf-8")).hexdigest()[:16]
 
     print("Running workflow...")
-    print("   -> Assignment Editor: Creating story brief...")
-    print("   -> Research Assistant: Gathering research...")
-    print("   -> Reporter: Writing draft...")
-    print("   -> Copy Editor: Polishing article...")
-    print("   -> Graphic Desk: Generating hero image...")
-    print("   -> Editor-in-Chief: Reviewing and approving...\n")
-
-    result = workflow.invoke(initial_state)
+    if not stream:
+        print("   -> Assignment Editor: Creating story brief...")
+        print("   -> Research Assistant: Gathering research...")
+        print("   -> Reporter: Writing draft...")
+        print("   -> Copy Editor: Polishing article...")
+        print("   -> Graphic Desk + Editor-in-Chief (in parallel): Generating hero image, reviewing and approving...\n")
+
+    result = run_with_metrics(initial_state, thread_id, use_async, config, otel=otel, stream=stream)
+    print_results(result)
+
+
+def run_resume(slug: str, from_stage: str = None, use_async: bool = False, config: dict = None, otel: bool = False,
+               stream: bool = False):
+    """Continue a run from the artifacts saved for `slug` and print a summary."""
+    from agentic_newsroom.workflows.newsroom_workflow import load_resume_state
+
+    initial_state = load_resume_state(slug, from_stage)
+    done = [key for key, value in initial_state.items() if value is not None and key != "article_idea"]
+
+    print(f"Agentic Newsroom: Resuming {slug}...")
+    print(f"   Loaded: {', '.join(done)}\n")
+
+    # The artifacts define the starting point, so don't replay a pending checkpoint
+    result = run_with_metrics(initial_state, f"resume-{slug}", use_async, config, continue_pending=False, otel=otel,
+                              stream=stream)
+    print_results(result)
+
+
+def print_results(result: dict):
+    """Print a summary of a finished workflow run."""
 
     # Extract results
     story_brief = result.get("story_brief")
@@ -1,21 +1,15 @@
-from dotenv import load_dotenv
-load_dotenv()
-
 import logging
 from langchain_core.messages import SystemMessage, HumanMessage
-from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables import RunnableConfig, RunnableLambda
 from langgraph.graph import START, END, StateGraph
 
 from agentic_newsroom.schemas.models import StoryBrief
 from agentic_newsroom.schemas.states import NewsroomState
 from agentic_newsroom.prompts.common import article_types
-from agentic_newsroom.llm.openai import get_smart_model
+from agentic_newsroom.llm.openai import get_smart_model, invoke_structured, ainvoke_structured
 
 logger = logging.getLogger(__name__)
 
-# Initialize model (uses reasoning model in reasoning mode, mini in mini mode)
-default_model = get_smart_model()
-
 article_categories = """<Categories>
 Choose the single best-fit category for the article:
 - Science: Scientific discoveries, research, technology, space, medicine, physics, biology
@@ -63,31 +57,48 @@ When you receive a article idea, follow these steps:
 
 """.format(article_types=article_types, article_categories=article_categories)
 
-def create_story_brief(state: NewsroomState, config: RunnableConfig = None):
-    logger.info("→ create_story_brief")
-
+def _story_brief_messages(state: NewsroomState) -> list:
     article_idea = state['article_idea']
     logger.debug(f"  Article idea: {article_idea[:100]}...")  # Truncate for logging
 
-    configuration = config.get("configurable", {}) if config else {}
-    model = configuration.get("model", default_model)
-
-    system_msg = SystemMessage(content=assignment_editor_prompt)
-    structured_model = model.with_structured_output(StoryBrief)
-
-    response = structured_model.invoke([
-        system_msg,
+    return [
+        SystemMessage(content=assignment_editor_prompt),
         HumanMessage(content=f"Write a story brief for the following article idea: {article_idea}")
-    ])
-
-    story_brief = response
-    story_brief.save(story_brief.slug)
+    ]
 
+def _log_story_brief(story_brief: StoryBrief):
     logger.info(f"  Created story brief: {story_brief.topic}")
     logger.info(f"  Category: {story_brief.category.value}")
     logger.info(f"  Article type: {story_brief.article_type}")
     logger.info(f"  Slug: {story_brief.slug}")
 
+def create_story_brief(state: NewsroomState, config: RunnableConfig = None):
+    logger.info("→ create_story_brief")
+
+    configuration = config.get("configurable", {}) if config else {}
+    model = configuration.get("model") or get_smart_model()
+
+    story_brief = invoke_structured(model, StoryBrief, _story_brief_messages(state), config)
+    story_brief.save(story_brief.slug)
+
+    _log_story_brief(story_brief)
+
+    return {
+        "story_brief": story_brief
+    }
+
+async def acreate_story_brief(state: NewsroomState, config: RunnableConfig = None):
+    """Async version of create_story_brief."""
+    logger.info("→ create_story_brief")
+
+    configuration = config.get("configurable", {}) if config else {}
+    model = configuration.get("model") or get_smart_model()
+
+    story_brief = await ainvoke_structured(model, StoryBrief, _story_brief_messages(state), config)
+    await story_brief.asave(story_brief.slug)
+
+    _log_story_brief(story_brief)
+
     return {
         "story_brief": story_brief
     }
@@ -96,7 +107,7 @@ def build_assignment_editor_graph():
     graph = StateGraph(NewsroomState)
     
     # Single node: assignment editor
-    graph.add_node("create_story_brief", create_story_brief)
+    graph.add_node("create_story_brief", RunnableLambda(create_story_brief, afunc=acreate_story_brief))
     
     # Simple flow: START → assignment_editor → END
     graph.add_edge(START, "create_story_brief")
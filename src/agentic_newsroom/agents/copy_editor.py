@@ -1,19 +1,15 @@
-from dotenv import load_dotenv
-load_dotenv()
-
 import logging
 from datetime import date
 from langchain_core.messages import SystemMessage, HumanMessage
-from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables import RunnableConfig, RunnableLambda
 from langgraph.graph import START, END, StateGraph
 
 from agentic_newsroom.schemas.states import CopyEditorState
 from agentic_newsroom.schemas.models import FinalArticle, DraftPackage, StoryBrief
-from agentic_newsroom.llm.openai import get_smart_model
+from agentic_newsroom.llm.openai import get_smart_model, invoke_structured, ainvoke_structured
 
 logger = logging.getLogger(__name__)
 
-default_model = get_smart_model()
 
 copy_editor_prompt = """You are a copy editor. Polish the draft into a publication-ready article.
 
@@ -44,31 +40,33 @@ Convert any bullet points or lists into flowing narrative prose. Magazine articl
 </Output Format>
 """
 
-def polish_article(state: CopyEditorState, config: RunnableConfig = None):
-    """Polish draft into final publication-ready article."""
-    logger.info("-> polish_article")
-
-    story_brief = state["story_brief"]
+def _polish_messages(state: CopyEditorState) -> list:
     draft_package = state["draft_package"]
-
-    configuration = config.get("configurable", {}) if config else {}
-    model = configuration.get("model", default_model)
-
-    messages = [
+    return [
         SystemMessage(content=copy_editor_prompt),
         HumanMessage(content=f"Draft to polish:\n\n{draft_package.full_draft}")
     ]
 
-    logger.info("  Polishing draft...")
-    structured_model = model.with_structured_output(FinalArticle)
-    final_article = structured_model.invoke(messages)
-
+def _finish_article(final_article: FinalArticle) -> FinalArticle:
     # Set publication date programmatically
     final_article.published_date = date.today()
 
     logger.info(f"  Title: {final_article.title}")
     logger.info(f"  Published date: {final_article.published_date}")
     logger.info(f"  Polish complete: {len(final_article.article.split())} words")
+    return final_article
+
+def polish_article(state: CopyEditorState, config: RunnableConfig = None):
+    """Polish draft into final publication-ready article."""
+    logger.info("-> polish_article")
+
+    story_brief = state["story_brief"]
+
+    configuration = config.get("configurable", {}) if config else {}
+    model = configuration.get("model") or get_smart_model()
+
+    logger.info("  Polishing draft...")
+    final_article = _finish_article(invoke_structured(model, FinalArticle, _polish_messages(state), config))
 
     # Save final article to artifacts folder
     final_article.save(story_brief.slug)
@@ -76,9 +74,26 @@ def polish_article(state: CopyEditorState, config: RunnableConfig = None):
 
     return {"final_article": final_article}
 
+async def apolish_article(state: CopyEditorState, config: RunnableConfig = None):
+    """Async version of polish_article."""
+    logger.info("-> polish_article")
+
+    story_brief = state["story_brief"]
+
+    configuration = config.get("configurable", {}) if config else {}
+    model = configuration.get("model") or get_smart_model()
+
+    logger.info("  Polishing draft...")
+    final_article = _finish_article(await ainvoke_structured(model, FinalArticle, _polish_messages(state), config))
+
+    await final_article.asave(story_brief.slug)
+    logger.info(f"  Saved to: artifacts/{story_brief.slug}/")
+
+    return {"final_article": final_article}
+
 def build_copy_editor_graph():
     builder = StateGraph(CopyEditorState)
-    builder.add_node("polish_article", polish_article)
+    builder.add_node("polish_article", RunnableLambda(polish_article, afunc=apolish_article))
     builder.add_edge(START, "polish_article")
     builder.add_edge("polish_article", END)
     return builder.compile()
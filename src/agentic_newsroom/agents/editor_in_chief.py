@@ -1,21 +1,15 @@
-from dotenv import load_dotenv
-load_dotenv()
-
 import logging
 from langchain_core.messages import SystemMessage, HumanMessage
-from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables import RunnableConfig, RunnableLambda
 from langgraph.graph import START, END, StateGraph
 
 from agentic_newsroom.schemas.models import StoryBrief, FinalArticle, PublicationApproval
 from agentic_newsroom.schemas.states import EditorInChiefState
-from agentic_newsroom.llm.openai import get_smart_model, get_mini_model
+from agentic_newsroom.llm.openai import get_smart_model, get_mini_model, invoke_structured, ainvoke_structured
 from agentic_newsroom.prompts.common import magazine_guardrails
 
 logger = logging.getLogger(__name__)
 
-# Default model
-default_model = get_smart_model()
-
 # =============================================================================
 # PROMPT
 # =============================================================================
@@ -40,36 +34,44 @@ Provide brief notes if you have any observations about the article.
 # NODES
 # =============================================================================
 
-def review_and_approve(state: EditorInChiefState, config: RunnableConfig = None):
-    """Review final article against guardrails and approve for publication."""
-    logger.info("-> review_and_approve")
-
+def _review_messages(state: EditorInChiefState) -> list:
     story_brief = state["story_brief"]
     final_article = state["final_article"]
 
-    configuration = config.get("configurable", {}) if config else {}
-    model = configuration.get("model", default_model)
-
     logger.info(f"  Article: {final_article.title}")
     logger.info(f"  Topic: {story_brief.topic}")
 
     # Build article context for review
     article_md = final_article.to_markdown()
 
-    messages = [
+    return [
         SystemMessage(content=review_prompt),
         HumanMessage(content=f"Review this article:\n\n{article_md}")
     ]
 
-    logger.info("  Reviewing against guardrails...")
-    structured_model = model.with_structured_output(PublicationApproval)
-    approval = structured_model.invoke(messages)
 
+def _log_approval(approval: PublicationApproval):
     status = "APPROVED" if approval.approved else "NOT APPROVED"
     logger.info(f"  Decision: {status}")
     if approval.notes:
         logger.info(f"  Notes: {len(approval.notes)} items")
 
+
+def review_and_approve(state: EditorInChiefState, config: RunnableConfig = None):
+    """Review final article against guardrails and approve for publication."""
+    logger.info("-> review_and_approve")
+
+    story_brief = state["story_brief"]
+
+    configuration = config.get("configurable", {}) if config else {}
+    model = configuration.get("model") or get_smart_model()
+
+    messages = _review_messages(state)
+
+    logger.info("  Reviewing against guardrails...")
+    approval = invoke_structured(model, PublicationApproval, messages, config)
+    _log_approval(approval)
+
     # Save approval to slug directory
     approval.save(story_brief.slug)
     logger.info(f"  Saved: artifacts/{story_brief.slug}/publication_approval.json")
@@ -77,6 +79,27 @@ def review_and_approve(state: EditorInChiefState, config: RunnableConfig = None)
     return {"approval": approval}
 
 
+async def areview_and_approve(state: EditorInChiefState, config: RunnableConfig = None):
+    """Async version of review_and_approve."""
+    logger.info("-> review_and_approve")
+
+    story_brief = state["story_brief"]
+
+    configuration = config.get("configurable", {}) if config else {}
+    model = configuration.get("model") or get_smart_model()
+
+    messages = _review_messages(state)
+
+    logger.info("  Reviewing against guardrails...")
+    approval = await ainvoke_structured(model, PublicationApproval, messages, config)
+    _log_approval(approval)
+
+    await approval.asave(story_brief.slug)
+    logger.info(f"  Saved: artifacts/{story_brief.slug}/publication_approval.json")
+
+    return {"approval": approval}
+
+
 # =============================================================================
 # GRAPH
 # =============================================================================
@@ -87,7 +110,7 @@ def build_editor_in_chief_graph():
     START -> review_and_approve -> END
     """
     builder = StateGraph(EditorInChiefState)
-    builder.add_node("review_and_approve", review_and_approve)
+    builder.add_node("review_and_approve", RunnableLambda(review_and_approve, afunc=areview_and_approve))
     builder.add_edge(START, "review_and_approve")
     builder.add_edge("review_and_approve", END)
     return builder.compile()
@@ -1,24 +1,37 @@
-from dotenv import load_dotenv
-load_dotenv()
-
+import asyncio
 import logging
 import base64
-from openai import OpenAI
+from functools import lru_cache
 from langchain_core.messages import SystemMessage, HumanMessage
-from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables import RunnableConfig, RunnableLambda
 from langgraph.graph import START, END, StateGraph
 
 from agentic_newsroom.schemas.states import GraphicDeskState
 from agentic_newsroom.schemas.models import FinalArticle, StoryBrief
 from agentic_newsroom.schemas.base import get_project_root
-from agentic_newsroom.llm.openai import get_smart_model
+from agentic_newsroom.llm.openai import get_smart_model, invoke_text, ainvoke_text
+from agentic_newsroom.utils.metrics import record_usage
 
 logger = logging.getLogger(__name__)
 
-# Initialize client
-openai_client = OpenAI()
 
-default_model = get_smart_model()
+# The openai SDK is slow to import, so it's only loaded when an image is generated
+
+@lru_cache(maxsize=None)
+def get_openai_client():
+    """Image API client, created on first use."""
+    from openai import OpenAI
+
+    return OpenAI()
+
+
+@lru_cache(maxsize=None)
+def get_async_openai_client():
+    """Async image API client, created on first use."""
+    from openai import AsyncOpenAI
+
+    return AsyncOpenAI()
+
 
 graphic_desk_prompt = """You are a photo editor. Your task is to generate a minimalist, realistic image prompt based on the article provided.
 
@@ -63,16 +76,10 @@ Article:
 """
 
 
-def generate_image_prompt(state: GraphicDeskState, config: RunnableConfig = None):
-    """Generate an image prompt based on the final article."""
-    logger.info("-> generate_image_prompt")
-
+def _image_prompt_messages(state: GraphicDeskState) -> list:
     story_brief = state["story_brief"]
     final_article = state["final_article"]
 
-    configuration = config.get("configurable", {}) if config else {}
-    model = configuration.get("model", default_model)
-
     article_context = f"""Title: {final_article.title}
 Subtitle: {final_article.subtitle or 'None'}
 Topic: {story_brief.topic}
@@ -83,30 +90,78 @@ PEOPLE INSTRUCTION: {story_brief.people_in_graphics}
 """
     logger.info(f"  People in graphics: {story_brief.people_in_graphics}")
 
-    messages = [
+    return [
         SystemMessage(content=graphic_desk_prompt),
         HumanMessage(content=article_context)
     ]
 
+
+def _get_graphics_dir(slug: str):
+    output_dir = get_project_root() / "artifacts" / slug / "graphics"
+    output_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir
+
+
+def _save_image_prompt(slug: str, image_prompt: str):
+    with open(_get_graphics_dir(slug) / "hero_prompt.txt", "w") as f:
+        f.write(image_prompt)
+    logger.info(f"  Saved to: artifacts/{slug}/graphics/hero_prompt.txt")
+
+
+def generate_image_prompt(state: GraphicDeskState, config: RunnableConfig = None):
+    """Generate an image prompt based on the final article."""
+    logger.info("-> generate_image_prompt")
+
+    story_brief = state["story_brief"]
+
+    configuration = config.get("configurable", {}) if config else {}
+    model = configuration.get("model") or get_smart_model()
+
     logger.info("  Generating image prompt...")
-    response = model.invoke(messages)
-    image_prompt = response.content.strip()
+    image_prompt = invoke_text(model, _image_prompt_messages(state), config).strip()
 
     logger.info(f"  Prompt: {image_prompt[:100]}...")
 
     # Save to graphics subfolder
-    output_dir = get_project_root() / "artifacts" / story_brief.slug / "graphics"
-    output_dir.mkdir(parents=True, exist_ok=True)
-    with open(output_dir / "hero_prompt.txt", "w") as f:
-        f.write(image_prompt)
-    logger.info(f"  Saved to: artifacts/{story_brief.slug}/graphics/hero_prompt.txt")
+    _save_image_prompt(story_brief.slug, image_prompt)
+
+    return {"image_prompt": image_prompt}
+
+
+async def agenerate_image_prompt(state: GraphicDeskState, config: RunnableConfig = None):
+    """Async version of generate_image_prompt."""
+    logger.info("-> generate_image_prompt")
+
+    story_brief = state["story_brief"]
+
+    configuration = config.get("configurable", {}) if config else {}
+    model = configuration.get("model") or get_smart_model()
+
+    logger.info("  Generating image prompt...")
+    image_prompt = (await ainvoke_text(model, _image_prompt_messages(state), config)).strip()
+
+    logger.info(f"  Prompt: {image_prompt[:100]}...")
+
+    await asyncio.to_thread(_save_image_prompt, story_brief.slug, image_prompt)
 
     return {"image_prompt": image_prompt}
 
 
 def _generate_image_openai(prompt: str, model: str, quality: str) -> bytes:
     """Generate image using OpenAI's image API."""
-    result = openai_client.images.generate(
+    result = get_openai_client().images.generate(
+        model=model,
+        prompt=prompt,
+        size="1536x1024",  # Close to 16:9
+        quality=quality,
+        n=1
+    )
+    return base64.b64decode(result.data[0].b64_json)
+
+
+async def _agenerate_image_openai(prompt: str, model: str, quality: str) -> bytes:
+    """Async version of _generate_image_openai."""
+    result = await get_async_openai_client().images.generate(
         model=model,
         prompt=prompt,
         size="1536x1024",  # Close to 16:9
@@ -116,6 +171,23 @@ def _generate_image_openai(prompt: str, model: str, quality: str) -> bytes:
     return base64.b64decode(result.data[0].b64_json)
 
 
+def _image_options(config: RunnableConfig = None) -> tuple:
+    # Get config options with defaults
+    configuration = config.get("configurable", {}) if config else {}
+    image_model = configuration.get("image_model", "gpt-image-1.5")
+    image_quality = configuration.get("image_quality", "high")
+    return image_model, image_quality
+
+
+def _save_hero_image(slug: str, image_bytes: bytes) -> str:
+    image_path = _get_graphics_dir(slug) / "hero_image.png"
+    with open(image_path, "wb") as f:
+        f.write(image_bytes)
+
+    logger.info(f"  Saved to: artifacts/{slug}/graphics/hero_image.png")
+    return str(image_path)
+
+
 def generate_hero_image(state: GraphicDeskState, config: RunnableConfig = None):
     """Generate hero image from prompt using OpenAI's image API.
 
@@ -127,11 +199,7 @@ def generate_hero_image(state: GraphicDeskState, config: RunnableConfig = None):
 
     story_brief = state["story_brief"]
     image_prompt = state["image_prompt"]
-
-    # Get config options with defaults
-    configuration = config.get("configurable", {}) if config else {}
-    image_model = configuration.get("image_model", "gpt-image-1.5")
-    image_quality = configuration.get("image_quality", "high")
+    image_model, image_quality = _image_options(config)
 
     logger.info(f"  Prompt: {image_prompt}")
     logger.info(f"  Model: {image_model}, Quality: {image_quality}")
@@ -139,17 +207,32 @@ def generate_hero_image(state: GraphicDeskState, config: RunnableConfig = None):
     # Generate image
     logger.info("  Calling OpenAI image API...")
     image_bytes = _generate_image_openai(image_prompt, image_model, image_quality)
+    record_usage("image", model=image_model, quality=image_quality)
 
     # Save image
-    output_dir = get_project_root() / "artifacts" / story_brief.slug / "graphics"
-    output_dir.mkdir(parents=True, exist_ok=True)
-    image_path = output_dir / "hero_image.png"
-    with open(image_path, "wb") as f:
-        f.write(image_bytes)
+    image_path = _save_hero_image(story_brief.slug, image_bytes)
+
+    return {"hero_image_path": image_path}
+
+
+async def agenerate_hero_image(state: GraphicDeskState, config: RunnableConfig = None):
+    """Async version of generate_hero_image."""
+    logger.info("-> generate_hero_image")
+
+    story_brief = state["story_brief"]
+    image_prompt = state["image_prompt"]
+    image_model, image_quality = _image_options(config)
+
+    logger.info(f"  Prompt: {image_prompt}")
+    logger.info(f"  Model: {image_model}, Quality: {image_quality}")
+
+    logger.info("  Calling OpenAI image API...")
+    image_bytes = await _agenerate_image_openai(image_prompt, image_model, image_quality)
+    record_usage("image", model=image_model, quality=image_quality)
 
-    logger.info(f"  Saved to: artifacts/{story_brief.slug}/graphics/hero_image.png")
+    image_path = await asyncio.to_thread(_save_hero_image, story_brief.slug, image_bytes)
 
-    return {"hero_image_path": str(image_path)}
+    return {"hero_image_path": image_path}
 
 
 def build_graphic_desk_graph():
@@ -158,8 +241,8 @@ def build_graphic_desk_graph():
     START → generate_image_prompt → generate_hero_image → END
     """
     builder = StateGraph(GraphicDeskState)
-    builder.add_node("generate_image_prompt", generate_image_prompt)
-    builder.add_node("generate_hero_image", generate_hero_image)
+    builder.add_node("generate_image_prompt", RunnableLambda(generate_image_prompt, afunc=agenerate_image_prompt))
+    builder.add_node("generate_hero_image", RunnableLambda(generate_hero_image, afunc=agenerate_hero_image))
     builder.add_edge(START, "generate_image_prompt")
     builder.add_edge("generate_image_prompt", "generate_hero_image")
     builder.add_edge("generate_hero_image", END)
@@ -1,36 +1,79 @@
-from dotenv import load_dotenv
-from langchain_core.runnables import RunnableConfig
-
-load_dotenv()
-
+import asyncio
 import logging
+import re
+from collections import defaultdict
+from typing import List, Literal, Optional
 from langchain_core.messages import SystemMessage, HumanMessage
+from langchain_core.runnables import RunnableConfig, RunnableLambda
+from langchain_core.runnables.config import get_executor_for_config
 from langgraph.graph import START, END, StateGraph
-
-from agentic_newsroom.schemas.models import DraftPackage, FactReview, StyleReview, RevisedDraft
-from agentic_newsroom.schemas.states import ReporterState
-from agentic_newsroom.llm.openai import get_smart_model, get_mini_model
+from langgraph.types import Send
+
+from agentic_newsroom.schemas.models import (
+    DraftPackage, FactReview, StyleReview, RevisedDraft, ResearchPackage, DraftOutline, DraftSection, StitchEdits,
+    AnchoredReview, ParagraphIssue, RevisedParagraph, SearchResult,
+)
+from agentic_newsroom.schemas.states import ReporterState, SectionTaskState
+from agentic_newsroom.llm.openai import get_smart_model, get_mini_model, invoke_structured, ainvoke_structured
 from agentic_newsroom.prompts.common import magazine_profile, magazine_guardrails
 from agentic_newsroom.utils.content import count_words
+from agentic_newsroom.utils.research_context import RESEARCH_TOKEN_BUDGET, select_research
 
 logger = logging.getLogger(__name__)
 
-# Default models per node type
-# - Creative/revision tasks: smart model (quality critical)
-# - Review/analytical tasks: mini model (structured output, cost-effective)
-smart_model = get_smart_model()
-mini_model = get_mini_model()
+# Review flows selectable via the `review_mode` config option
+REVIEW_MODES = ("sequential", "parallel")
+
+# Research items kept per query when the research package is over the
+# `research_token_budget` (see utils.research_context): per key question for
+# the draft, per key question or draft paragraph for the fact review
+DRAFT_ITEMS_PER_QUESTION = 8
+REVIEW_ITEMS_PER_QUERY = 3
+
+# Revision flows selectable via the `revision_mode` config option: "full" rewrites
+# the whole draft, "patch" rewrites only the paragraphs the reviews flagged
+REVISION_MODES = ("full", "patch")
+
+# Paragraphs are separated by blank lines. The capture group keeps the exact
+# separators, so the draft can be reassembled byte for byte.
+PARAGRAPH_BREAK = re.compile(r"(\n[ \t]*\n\s*)")
+
+# Drafting flows selectable via the `draft_mode` config option
+DRAFT_MODES = ("single", "sectioned")
+
+# Article types long enough to be drafted section by section in sectioned mode.
+# A Web Daily is written in one call either way.
+SECTIONED_ARTICLE_TYPES = ("Full Feature",)
 
 # =============================================================================
 # PROMPTS
 # =============================================================================
 
-reporter_write_draft_prompt = f"""You are a science journalist writing for Agentic Newsroom.
+reporter_voice = """<Voice>
+- Short, punchy sentences. Vary rhythm.
+- Use concrete numbers and specifics, not vague claims.
+- Lead with what's surprising or at stake.
+- No jargon. Explain technical terms naturally. 
+- Build toward the discovery. Set up the mystery before the answer.
+- When researchers appear, show them as people with motivations, not just names.
+</Voice>
+"""
+
+# --- SHARED CONTEXT ---
+# Leads every reporter call that reads the research, followed by the brief and
+# the research package. These messages are identical across those calls, so
+# the provider's prompt cache can serve them, and the task prompt comes after.
+reporter_context_prompt = f"""You work for Agentic Newsroom.
 
 {magazine_profile}
 
 {magazine_guardrails}
 
+The Story Brief and Research Material of the article you are working on follow. Your task comes after them.
+"""
+
+reporter_write_draft_prompt = f"""You are a science journalist writing for Agentic Newsroom.
+
 <Task>
 Write a complete article draft based on the Story Brief and Research Material.
 </Task>
@@ -53,15 +96,7 @@ Write a complete article draft based on the Story Brief and Research Material.
 10. No bullet points or lists. Write in flowing narrative prose throughout.
 </Writing Rules>
 
-<Voice>
-- Short, punchy sentences. Vary rhythm.
-- Use concrete numbers and specifics, not vague claims.
-- Lead with what's surprising or at stake.
-- No jargon. Explain technical terms naturally. 
-- Build toward the discovery. Set up the mystery before the answer.
-- When researchers appear, show them as people with motivations, not just names.
-</Voice>
-
+{reporter_voice}
 <Output>
 - full_draft: The article text (no sources section in the draft)
 - sources: List of full URLs used
@@ -69,6 +104,75 @@ Write a complete article draft based on the Story Brief and Research Material.
 </Output>
 """
 
+# --- SECTIONED DRAFT PROMPTS ---
+outline_draft_prompt = """You are a science journalist planning a feature article for Agentic Newsroom.
+
+<Task>
+Plan the article as a sequence of ## sections, based on the Story Brief and Research Material.
+Each section is then written separately, by a writer who follows the outline and works from the research items you assign to it.
+</Task>
+
+<Rules>
+1. 4-7 sections. Section target lengths add up to 1500-2000 words.
+2. The first section is the lead and opens with a scene or vivid moment.
+3. Each section covers one aspect. Together the sections answer every Key Question.
+4. Build toward the discovery. Set up the mystery before the answer.
+5. Assign each section the numbers of the research items it needs. An item may serve several sections.
+</Rules>
+
+<Output>
+- sections: heading, purpose, research_items and target_words of each section, in reading order
+</Output>
+"""
+
+write_section_prompt = f"""You are a science journalist writing one section of a feature article for Agentic Newsroom.
+
+<Task>
+Write the section you are assigned, following the Outline. Work from the research items assigned to the section,
+numbered as in the Research Material. The other sections are written at the same time,
+so cover only this section's purpose and leave the other sections' material to them.
+</Task>
+
+<Writing Rules>
+1. Write about the section's target length. This is critical.
+2. Write only the section body, without its ## heading.
+3. If this is the first section, open with a scene or vivid moment that pulls readers in. Otherwise pick up where the previous section of the Outline leaves off, without re-introducing the topic.
+4. Ground abstract concepts in tangible details: places, numbers, sensory images.
+5. Write in your own voice. NEVER copy-paste from sources.
+6. No em dashes (—). Use commas, colons, or separate sentences.
+7. No narrative quotes ("Dr. X said..."). You have no interviews.
+8. Attribute non-obvious facts to their sources.
+9. Stick to facts from the Research Material only.
+10. No bullet points or lists. Write in flowing narrative prose throughout.
+</Writing Rules>
+
+{reporter_voice}
+<Output>
+- text: The section body
+- sources: List of full URLs used
+</Output>
+"""
+
+stitch_draft_prompt = """You are an editor joining a feature article whose sections were written separately.
+
+<Task>
+Smooth the transitions between sections. Where a section opens abruptly, repeats what an earlier section
+already said, or re-introduces the topic, rewrite that section's opening paragraph so it follows on from the section before.
+</Task>
+
+<Rules>
+- Rewrite ONLY opening paragraphs that need it. Often that is few or none.
+- Refer to sections by the numbers shown in the draft.
+- Keep the facts, attributions and approximate length of each rewritten paragraph.
+- No em dashes (—). No narrative quotes ("Dr. X said...").
+</Rules>
+
+<Output>
+- openings: The rewritten opening paragraphs with their section numbers
+- sources_section: Prose paragraph describing sources for end of article
+</Output>
+"""
+
 # --- FACT REVIEW PROMPT ---
 fact_review_prompt = """You are a fact-checker. Review this draft against the Research Material.
 
@@ -114,6 +218,30 @@ revision_prompt = """Fix the listed issues. Preserve everything else.
 </Rules>
 """
 
+# --- PATCH REVISION PROMPTS ---
+anchored_issues_prompt = """
+<Paragraph Anchors>
+The draft's paragraphs are numbered [P1], [P2], ... Tie every issue to the one paragraph that has to change to fix it.
+- If a fix needs changes in several paragraphs, list the issue once per paragraph.
+- For a gap such as an unanswered Key Question, pick the paragraph where the answer fits best.
+</Paragraph Anchors>
+"""
+
+revise_paragraph_prompt = """Fix the listed issues in one paragraph of an article. Preserve everything else.
+
+<Issues>
+{issues}
+</Issues>
+
+<Rules>
+- Fix ONLY listed issues
+- Return only the revised paragraph, as one paragraph
+- If the paragraph is a ## heading, return a ## heading
+- Keep about the same length
+- It must still follow on from the paragraph before and lead into the one after
+</Rules>
+"""
+
 # =============================================================================
 # NODES
 # =============================================================================
@@ -126,165 +254,602 @@ def _get_reporter_dir(slug: str):
     return output_dir
 
 
-def write_draft(state: ReporterState, config: RunnableConfig = None):
-    """Write the initial draft."""
-    logger.info("-> write_draft")
+def _save_reporter_file(slug: str, filename: str, content: str):
+    """Write an intermediate reporter artifact."""
+    output_dir = _get_reporter_dir(slug)
+    with open(output_dir / filename, "w") as f:
+        f.write(content)
+    logger.info(f"  Saved: {filename}")
+
+
+async def _asave_reporter_file(slug: str, filename: str, content: str):
+    """Write an intermediate reporter artifact without blocking the event loop."""
+    await asyncio.to_thread(_save_reporter_file, slug, filename, content)
+
 
+def _get_model(config: RunnableConfig, default):
+    """Model from the config, else `default()`.
+
+    Default models per node type:
+    - Creative/revision tasks: get_smart_model (quality critical)
+    - Review/analytical tasks: get_mini_model (structured output, cost-effective)
+    """
+    configuration = config.get("configurable", {}) if config else {}
+    return configuration.get("model") or default()
+
+
+def _research_token_budget(config: RunnableConfig = None) -> int:
+    configuration = config.get("configurable", {}) if config else {}
+    return configuration.get("research_token_budget") or RESEARCH_TOKEN_BUDGET
+
+
+def _draft_research(state: ReporterState, config: RunnableConfig = None) -> ResearchPackage:
+    """The research items relevant to the brief, within the research token budget."""
     story_brief = state["story_brief"]
-    research_package = state["research_package"]
+    queries = [f"{story_brief.topic} {story_brief.angle}", *story_brief.key_questions]
+    results = select_research(state["research_package"].results, queries, DRAFT_ITEMS_PER_QUESTION,
+                              _research_token_budget(config))
+    return ResearchPackage(results=results)
+
+
+def select_draft_research(state: ReporterState, config: RunnableConfig = None):
+    """Pick the research items every call of this draft reads, once per run."""
+    logger.info("-> select_research")
+    return {"draft_research": _draft_research(state, config)}
+
+
+async def aselect_draft_research(state: ReporterState, config: RunnableConfig = None):
+    """Async version of select_draft_research. Ranking is CPU work, so it runs in a thread."""
+    logger.info("-> select_research")
+    return {"draft_research": await asyncio.to_thread(_draft_research, state, config)}
+
+
+def _research_context_messages(state: ReporterState, config: RunnableConfig = None) -> list:
+    """Leading messages of every call that reads the research: shared context, brief, research package."""
+    story_brief = state["story_brief"]
+    research_package = state["draft_research"]
 
     logger.debug(f"  Topic: {story_brief.topic}")
     logger.debug(f"  Article type: {story_brief.article_type}")
     logger.debug(f"  Research items: {len(research_package.results)}")
 
-    configuration = config.get("configurable", {}) if config else {}
-    model = configuration.get("model", smart_model)  # Creative task: use smart model
-
     story_brief_md = story_brief.to_markdown()
     research_md = research_package.to_markdown()
 
-    messages = [
-        SystemMessage(content=reporter_write_draft_prompt),
+    return [
+        SystemMessage(content=reporter_context_prompt),
         HumanMessage(content=f"This is the story brief:\n\n{story_brief_md}"),
         HumanMessage(content=f"Here is the research package:\n\n{research_md}")
     ]
 
-    logger.info("  Generating draft...")
-    structured_model = model.with_structured_output(DraftPackage)
-    draft_package = structured_model.invoke(messages)
 
+def _write_draft_messages(state: ReporterState, config: RunnableConfig = None) -> list:
+    return [
+        *_research_context_messages(state, config),
+        SystemMessage(content=reporter_write_draft_prompt)
+    ]
+
+
+def _log_draft(draft_package: DraftPackage):
     word_count = count_words(draft_package.full_draft)
     logger.info(f"  Draft complete: {word_count} words")
     logger.info(f"  Sources used: {len(draft_package.sources)}")
 
+
+def write_draft(state: ReporterState, config: RunnableConfig = None):
+    """Write the initial draft."""
+    logger.info("-> write_draft")
+
+    model = _get_model(config, get_smart_model)  # Creative task: use smart model
+
+    logger.info("  Generating draft...")
+    draft_package = invoke_structured(model, DraftPackage, _write_draft_messages(state, config), config)
+    _log_draft(draft_package)
+
     # Save initial draft
-    output_dir = _get_reporter_dir(story_brief.slug)
-    with open(output_dir / "1_initial_draft.md", "w") as f:
-        f.write(draft_package.to_markdown())
-    logger.info("  Saved: 1_initial_draft.md")
+    _save_reporter_file(state["story_brief"].slug, "1_initial_draft.md", draft_package.to_markdown())
 
     return {"draft_package": draft_package}
 
 
-def review_facts(state: ReporterState, config: RunnableConfig = None):
-    """Review draft for factual accuracy, attribution, completeness."""
-    logger.info("-> review_facts")
+async def awrite_draft(state: ReporterState, config: RunnableConfig = None):
+    """Async version of write_draft."""
+    logger.info("-> write_draft")
 
-    story_brief = state["story_brief"]
-    draft_package = state["draft_package"]
-    research_package = state["research_package"]
+    model = _get_model(config, get_smart_model)
 
-    configuration = config.get("configurable", {}) if config else {}
-    model = configuration.get("model", mini_model)  # Analytical task: use mini model
+    logger.info("  Generating draft...")
+    draft_package = await ainvoke_structured(model, DraftPackage, _write_draft_messages(state, config), config)
+    _log_draft(draft_package)
+
+    await _asave_reporter_file(state["story_brief"].slug, "1_initial_draft.md", draft_package.to_markdown())
+
+    return {"draft_package": draft_package}
+
+
+def _outline_draft_messages(state: ReporterState, config: RunnableConfig = None) -> list:
+    return [
+        *_research_context_messages(state, config),
+        SystemMessage(content=outline_draft_prompt)
+    ]
+
+
+def _log_outline(draft_outline: DraftOutline):
+    target = sum(section.target_words for section in draft_outline.sections)
+    logger.info(f"  Outline complete: {len(draft_outline.sections)} sections, {target} words planned")
+
+
+def outline_draft(state: ReporterState, config: RunnableConfig = None):
+    """Plan the draft's sections and assign research items to each (sectioned draft mode)."""
+    logger.info("-> outline_draft")
+
+    model = _get_model(config, get_smart_model)  # Creative task: use smart model
+
+    logger.info("  Planning sections...")
+    draft_outline = invoke_structured(model, DraftOutline, _outline_draft_messages(state, config), config)
+    _log_outline(draft_outline)
+
+    _save_reporter_file(state["story_brief"].slug, "1_draft_outline.md", draft_outline.to_markdown())
+
+    return {"draft_outline": draft_outline}
+
+
+async def aoutline_draft(state: ReporterState, config: RunnableConfig = None):
+    """Async version of outline_draft."""
+    logger.info("-> outline_draft")
+
+    model = _get_model(config, get_smart_model)
+
+    logger.info("  Planning sections...")
+    draft_outline = await ainvoke_structured(model, DraftOutline, _outline_draft_messages(state, config), config)
+    _log_outline(draft_outline)
+
+    await _asave_reporter_file(state["story_brief"].slug, "1_draft_outline.md", draft_outline.to_markdown())
+
+    return {"draft_outline": draft_outline}
+
+
+def _write_section_messages(state: SectionTaskState, config: RunnableConfig = None) -> list:
+    draft_outline = state["draft_outline"]
+    section = state["section"]
+    outline_md = "\n".join(
+        f"{i}. {s.heading}: {s.purpose}" for i, s in enumerate(draft_outline.sections, 1)
+    )
+    # Item numbers refer to the research package the outline was given
+    item_count = len(state["draft_research"].results)
+    numbers = [str(n) for n in dict.fromkeys(section.research_items) if 1 <= n <= item_count]
+    assignment = (
+        f"Write section {state['index'] + 1} of {len(draft_outline.sections)}: {section.heading}\n\n"
+        f"Purpose: {section.purpose}\n\n"
+        f"Target length: about {section.target_words} words\n\n"
+        # A section the outline left without (valid) items works from the whole package
+        f"Research items: {', '.join(numbers) or 'none assigned, use the whole Research Material'}"
+    )
+
+    # Same leading messages as outline_draft, so every section reads the research from the prompt cache
+    return [
+        *_research_context_messages(state, config),
+        SystemMessage(content=write_section_prompt),
+        HumanMessage(content=f"Outline:\n\n{outline_md}"),
+        HumanMessage(content=assignment)
+    ]
+
+
+def _section_update(state: SectionTaskState, section: DraftSection) -> dict:
+    logger.info(f"  Section {state['index'] + 1} complete: {count_words(section.text)} words")
+    return {"draft_sections": [{"index": state["index"], "heading": state["section"].heading, "section": section}]}
+
+
+def write_section(state: SectionTaskState, config: RunnableConfig = None):
+    """Write one outline section from its assigned research items."""
+    logger.info("-> write_section")
+
+    model = _get_model(config, get_smart_model)  # Creative task: use smart model
+
+    section = invoke_structured(model, DraftSection, _write_section_messages(state, config), config)
+    return _section_update(state, section)
+
+
+async def awrite_section(state: SectionTaskState, config: RunnableConfig = None):
+    """Async version of write_section."""
+    logger.info("-> write_section")
+
+    model = _get_model(config, get_smart_model)
+
+    section = await ainvoke_structured(model, DraftSection, _write_section_messages(state, config), config)
+    return _section_update(state, section)
+
+
+def _ordered_sections(state: ReporterState) -> List[dict]:
+    return sorted(state.get("draft_sections", []), key=lambda s: s["index"])
+
+
+def _stitch_draft_messages(state: ReporterState) -> list:
+    numbered_draft = "\n\n".join(
+        f"[Section {i}] ## {s['heading']}\n\n{s['section'].text}" for i, s in enumerate(_ordered_sections(state), 1)
+    )
+    return [
+        SystemMessage(content=stitch_draft_prompt),
+        HumanMessage(content=f"Article Type: {state['story_brief'].article_type}"),
+        HumanMessage(content=f"Draft:\n\n{numbered_draft}")
+    ]
+
+
+def _stitched_draft(state: ReporterState, edits: StitchEdits) -> DraftPackage:
+    """Join the sections under their headings, with the stitch pass's rewritten openings swapped in."""
+    sections = _ordered_sections(state)
+    texts = [s["section"].text.strip() for s in sections]
+    for opening in edits.openings:
+        if not 1 <= opening.section <= len(texts):
+            logger.warning(f"  Ignoring rewritten opening for unknown section {opening.section}")
+            continue
+        paragraphs = texts[opening.section - 1].split("\n\n")
+        paragraphs[0] = opening.paragraph.strip()
+        texts[opening.section - 1] = "\n\n".join(paragraphs)
+    logger.info(f"  Stitched {len(sections)} sections, {len(edits.openings)} openings rewritten")
+
+    return DraftPackage(
+        full_draft="\n\n".join(f"## {s['heading']}\n\n{text}" for s, text in zip(sections, texts)),
+        sources=list(dict.fromkeys(url for s in sections for url in s["section"].sources)),
+        sources_section=edits.sources_section
+    )
+
+
+def stitch_draft(state: ReporterState, config: RunnableConfig = None):
+    """Join the separately written sections and smooth the transitions between them."""
+    logger.info("-> stitch_draft")
+
+    model = _get_model(config, get_smart_model)  # Creative task: use smart model
+
+    logger.info("  Stitching sections...")
+    edits = invoke_structured(model, StitchEdits, _stitch_draft_messages(state), config)
+    draft_package = _stitched_draft(state, edits)
+    _log_draft(draft_package)
+
+    _save_reporter_file(state["story_brief"].slug, "1_initial_draft.md", draft_package.to_markdown())
+
+    return {"draft_package": draft_package}
+
+
+async def astitch_draft(state: ReporterState, config: RunnableConfig = None):
+    """Async version of stitch_draft."""
+    logger.info("-> stitch_draft")
+
+    model = _get_model(config, get_smart_model)
+
+    logger.info("  Stitching sections...")
+    edits = await ainvoke_structured(model, StitchEdits, _stitch_draft_messages(state), config)
+    draft_package = _stitched_draft(state, edits)
+    _log_draft(draft_package)
+
+    await _asave_reporter_file(state["story_brief"].slug, "1_initial_draft.md", draft_package.to_markdown())
+
+    return {"draft_package": draft_package}
+
+
+def _paragraph_positions(parts: List[str]) -> List[int]:
+    """Indexes of the non-blank paragraphs in PARAGRAPH_BREAK.split() output (separators sit at odd indexes)."""
+    return [i for i in range(0, len(parts), 2) if parts[i].strip()]
+
+
+def _numbered_paragraphs(text: str) -> str:
+    """The draft with its paragraphs marked [P1], [P2], ... for anchored reviews."""
+    parts = PARAGRAPH_BREAK.split(text)
+    return "\n\n".join(f"[P{n}] {parts[i]}" for n, i in enumerate(_paragraph_positions(parts), 1))
+
+
+def _draft_to_review(state: ReporterState, config: RunnableConfig = None) -> str:
+    full_draft = state["draft_package"].full_draft
+    return _numbered_paragraphs(full_draft) if _revision_mode(config) == "patch" else full_draft
+
+
+def _review_prompt(prompt: str, config: RunnableConfig = None) -> str:
+    return prompt + anchored_issues_prompt if _revision_mode(config) == "patch" else prompt
+
+
+def _review_schema(schema, config: RunnableConfig = None):
+    """Reviewers anchor their issues to paragraphs in patch revision mode."""
+    return AnchoredReview if _revision_mode(config) == "patch" else schema
+
+
+def _as_review(result, schema):
+    """The review to record. Anchored issues are listed as 'Paragraph N: ...'."""
+    if isinstance(result, AnchoredReview):
+        return schema(issues=[str(issue) for issue in result.issues], rubric=result.rubric)
+    return result
+
+
+def _anchored_issues(result) -> Optional[List[ParagraphIssue]]:
+    return result.issues if isinstance(result, AnchoredReview) else None
 
-    # Tight context: key questions + research + draft
-    key_questions_md = "\n".join(f"- {q}" for q in story_brief.key_questions)
 
+def _claim_research(state: ReporterState, config: RunnableConfig = None) -> List[SearchResult]:
+    """Research items behind the draft's claims and the key questions that the
+    shared research context (see _draft_research) doesn't already include."""
+    shared = {(r.source, r.content) for r in state["draft_research"].results}
+    remaining = [r for r in state["research_package"].results if (r.source, r.content) not in shared]
+    if not remaining:
+        return []
+
+    parts = PARAGRAPH_BREAK.split(state["draft_package"].full_draft)
+    claims = [parts[i] for i in _paragraph_positions(parts) if not parts[i].lstrip().startswith("#")]
+    queries = [*state["story_brief"].key_questions, *claims]
+    return select_research(remaining, queries, REVIEW_ITEMS_PER_QUERY, _research_token_budget(config))
+
+
+def _review_facts_messages(state: ReporterState, config: RunnableConfig = None) -> list:
+    story_brief = state["story_brief"]
+
+    # Shared context first (cacheable), then key questions + claim evidence + draft
+    key_questions_md = "\n".join(f"- {q}" for q in story_brief.key_questions)
     messages = [
-        SystemMessage(content=fact_review_prompt),
-        HumanMessage(content=f"Key Questions to Answer:\n{key_questions_md}"),
-        HumanMessage(content=f"Research Material:\n\n{research_package.to_markdown()}"),
-        HumanMessage(content=f"Draft to Review:\n\n{draft_package.full_draft}")
+        *_research_context_messages(state, config),
+        SystemMessage(content=_review_prompt(fact_review_prompt, config)),
+        HumanMessage(content=f"Key Questions to Answer:\n{key_questions_md}")
     ]
+    claim_research = _claim_research(state, config)
+    if claim_research:
+        research_md = ResearchPackage(results=claim_research).to_markdown()
+        messages.append(HumanMessage(content=f"More Research Material for the draft's claims:\n\n{research_md}"))
+    messages.append(HumanMessage(content=f"Draft to Review:\n\n{_draft_to_review(state, config)}"))
+    return messages
+
+
+def review_facts(state: ReporterState, config: RunnableConfig = None):
+    """Review draft for factual accuracy, attribution, completeness."""
+    logger.info("-> review_facts")
+
+    # Same model as the drafting call, so the shared research prefix is read from its prompt cache
+    model = _get_model(config, get_smart_model)
 
     logger.info("  Reviewing facts...")
-    structured_model = model.with_structured_output(FactReview)
-    fact_review = structured_model.invoke(messages)
+    result = invoke_structured(model, _review_schema(FactReview, config), _review_facts_messages(state, config), config)
+    fact_review = _as_review(result, FactReview)
 
     logger.info(f"  Fact review complete: {len(fact_review.issues)} issues found")
 
     # Save fact review
-    output_dir = _get_reporter_dir(story_brief.slug)
-    with open(output_dir / "2_fact_review.md", "w") as f:
-        f.write(fact_review.to_markdown())
-    logger.info("  Saved: 2_fact_review.md")
+    _save_reporter_file(state["story_brief"].slug, "2_fact_review.md", fact_review.to_markdown())
 
-    return {"fact_review": fact_review}
+    return {"fact_review": fact_review, "fact_issues": _anchored_issues(result)}
 
 
-def revise_facts(state: ReporterState, config: RunnableConfig = None):
-    """Revise draft to fix factual issues."""
-    logger.info("-> revise_facts")
+async def areview_facts(state: ReporterState, config: RunnableConfig = None):
+    """Async version of review_facts."""
+    logger.info("-> review_facts")
 
-    story_brief = state["story_brief"]
-    draft_package = state["draft_package"]
-    fact_review = state["fact_review"]
+    model = _get_model(config, get_smart_model)
 
-    if not fact_review.issues:
-        logger.info("  No factual issues to fix, skipping revision")
-        return {}
+    logger.info("  Reviewing facts...")
+    result = await ainvoke_structured(model, _review_schema(FactReview, config), _review_facts_messages(state, config), config)
+    fact_review = _as_review(result, FactReview)
 
-    configuration = config.get("configurable", {}) if config else {}
-    model = configuration.get("model", smart_model)  # Revision task: use smart model
+    logger.info(f"  Fact review complete: {len(fact_review.issues)} issues found")
 
-    issues_str = "\n".join(f"- {issue}" for issue in fact_review.issues)
+    await _asave_reporter_file(state["story_brief"].slug, "2_fact_review.md", fact_review.to_markdown())
+
+    return {"fact_review": fact_review, "fact_issues": _anchored_issues(result)}
+
+
+def _revision_messages(draft_package: DraftPackage, issues: List[str]) -> list:
+    issues_str = "\n".join(f"- {issue}" for issue in issues)
     prompt = revision_prompt.format(issues=issues_str)
 
-    messages = [
+    return [
         SystemMessage(content=prompt),
         HumanMessage(content=f"Current Draft:\n\n{draft_package.full_draft}")
     ]
 
-    logger.info(f"  Revising {len(fact_review.issues)} factual issues...")
-    structured_model = model.with_structured_output(RevisedDraft)
-    revised = structured_model.invoke(messages)
 
-    # Update only full_draft, preserve sources
-    updated_package = DraftPackage(
+def _apply_revision(draft_package: DraftPackage, revised: RevisedDraft) -> DraftPackage:
+    """Update only full_draft, preserve sources."""
+    return DraftPackage(
         full_draft=revised.full_draft,
         sources=draft_package.sources,
         sources_section=draft_package.sources_section
     )
 
+
+def _patch_plan(draft_package: DraftPackage, issues: List[ParagraphIssue]) -> tuple:
+    """Split the draft and group the issues by paragraph.
+
+    Returns (parts, targets): PARAGRAPH_BREAK.split() output of the draft, and
+    {index in parts: [issue, ...]} for every paragraph that has issues.
+    """
+    parts = PARAGRAPH_BREAK.split(draft_package.full_draft)
+    positions = _paragraph_positions(parts)
+    targets = defaultdict(list)
+    for issue in issues:
+        if not 1 <= issue.paragraph <= len(positions):
+            logger.warning(f"  Ignoring issue for unknown paragraph {issue.paragraph}: {issue.issue}")
+            continue
+        targets[positions[issue.paragraph - 1]].append(issue.issue)
+    logger.info(f"  Patching {len(targets)} of {len(positions)} paragraphs for {len(issues)} issues...")
+    return parts, dict(targets)
+
+
+def _revise_paragraph_messages(parts: List[str], position: int, issues: List[str]) -> list:
+    positions = _paragraph_positions(parts)
+    at = positions.index(position)
+    issues_str = "\n".join(f"- {issue}" for issue in issues)
+
+    messages = [SystemMessage(content=revise_paragraph_prompt.format(issues=issues_str))]
+    if at > 0:
+        messages.append(HumanMessage(content=f"Paragraph before (context only):\n\n{parts[positions[at - 1]]}"))
+    messages.append(HumanMessage(content=f"Paragraph to revise:\n\n{parts[position]}"))
+    if at + 1 < len(positions):
+        messages.append(HumanMessage(content=f"Paragraph after (context only):\n\n{parts[positions[at + 1]]}"))
+    return messages
+
+
+def _apply_patches(draft_package: DraftPackage, parts: List[str], patches: dict) -> DraftPackage:
+    """Splice revised paragraphs back in. Everything else stays byte-identical."""
+    parts = list(parts)
+    for position, paragraph in patches.items():
+        if not paragraph or not paragraph.strip():
+            continue
+        # Keep the whitespace around the original, e.g. the draft's final newline
+        original = parts[position]
+        leading = original[:len(original) - len(original.lstrip())]
+        trailing = original[len(original.rstrip()):]
+        parts[position] = leading + paragraph.strip() + trailing
+    return DraftPackage(
+        full_draft="".join(parts),
+        sources=draft_package.sources,
+        sources_section=draft_package.sources_section
+    )
+
+
+def _patch_draft(model, draft_package: DraftPackage, issues: List[ParagraphIssue], config: RunnableConfig = None) -> DraftPackage:
+    """Revise only the paragraphs with issues, one concurrent call per paragraph."""
+    parts, targets = _patch_plan(draft_package, issues)
+
+    def revise_paragraph(position: int):
+        messages = _revise_paragraph_messages(parts, position, targets[position])
+        try:
+            return invoke_structured(model, RevisedParagraph, messages, config).paragraph
+        except Exception as e:
+            logger.warning(f"  Keeping paragraph unchanged, revision failed: {e}")
+            return None
+
+    with get_executor_for_config(config) as executor:
+        patches = dict(zip(targets, executor.map(revise_paragraph, targets)))
+    return _apply_patches(draft_package, parts, patches)
+
+
+async def _apatch_draft(model, draft_package: DraftPackage, issues: List[ParagraphIssue], config: RunnableConfig = None) -> DraftPackage:
+    """Async version of _patch_draft."""
+    parts, targets = _patch_plan(draft_package, issues)
+
+    async def revise_paragraph(position: int):
+        messages = _revise_paragraph_messages(parts, position, targets[position])
+        try:
+            return (await ainvoke_structured(model, RevisedParagraph, messages, config)).paragraph
+        except Exception as e:
+            logger.warning(f"  Keeping paragraph unchanged, revision failed: {e}")
+            return None
+
+    patches = dict(zip(targets, await asyncio.gather(*(revise_paragraph(p) for p in targets))))
+    return _apply_patches(draft_package, parts, patches)
+
+
+def _revise_draft(model, draft_package: DraftPackage, issues: List[str],
+                  anchored: Optional[List[ParagraphIssue]], config: RunnableConfig = None) -> DraftPackage:
+    """Rewrite the draft for the issues, or only the flagged paragraphs when the issues are anchored."""
+    if anchored is not None:
+        return _patch_draft(model, draft_package, anchored, config)
+    revised = invoke_structured(model, RevisedDraft, _revision_messages(draft_package, issues), config)
+    return _apply_revision(draft_package, revised)
+
+
+async def _arevise_draft(model, draft_package: DraftPackage, issues: List[str],
+                         anchored: Optional[List[ParagraphIssue]], config: RunnableConfig = None) -> DraftPackage:
+    """Async version of _revise_draft."""
+    if anchored is not None:
+        return await _apatch_draft(model, draft_package, anchored, config)
+    revised = await ainvoke_structured(model, RevisedDraft, _revision_messages(draft_package, issues), config)
+    return _apply_revision(draft_package, revised)
+
+
+def revise_facts(state: ReporterState, config: RunnableConfig = None):
+    """Revise draft to fix factual issues."""
+    logger.info("-> revise_facts")
+
+    draft_package = state["draft_package"]
+    fact_review = state["fact_review"]
+
+    if not fact_review.issues:
+        logger.info("  No factual issues to fix, skipping revision")
+        return {}
+
+    model = _get_model(config, get_smart_model)  # Revision task: use smart model
+
+    logger.info(f"  Revising {len(fact_review.issues)} factual issues...")
+    updated_package = _revise_draft(model, draft_package, fact_review.issues, state.get("fact_issues"), config)
+
     word_count = count_words(updated_package.full_draft)
     logger.info(f"  Fact revision complete: {word_count} words")
 
     # Save revised draft
-    output_dir = _get_reporter_dir(story_brief.slug)
-    with open(output_dir / "3_after_fact_revision.md", "w") as f:
-        f.write(updated_package.to_markdown())
-    logger.info("  Saved: 3_after_fact_revision.md")
+    _save_reporter_file(state["story_brief"].slug, "3_after_fact_revision.md", updated_package.to_markdown())
 
     return {"draft_package": updated_package}
 
 
-def review_style(state: ReporterState, config: RunnableConfig = None):
-    """Review draft for style compliance, structure, voice."""
-    logger.info("-> review_style")
+async def arevise_facts(state: ReporterState, config: RunnableConfig = None):
+    """Async version of revise_facts."""
+    logger.info("-> revise_facts")
 
-    story_brief = state["story_brief"]
     draft_package = state["draft_package"]
+    fact_review = state["fact_review"]
 
-    configuration = config.get("configurable", {}) if config else {}
-    model = configuration.get("model", mini_model)  # Analytical task: use mini model
+    if not fact_review.issues:
+        logger.info("  No factual issues to fix, skipping revision")
+        return {}
+
+    model = _get_model(config, get_smart_model)
+
+    logger.info(f"  Revising {len(fact_review.issues)} factual issues...")
+    updated_package = await _arevise_draft(model, draft_package, fact_review.issues, state.get("fact_issues"), config)
+
+    word_count = count_words(updated_package.full_draft)
+    logger.info(f"  Fact revision complete: {word_count} words")
+
+    await _asave_reporter_file(state["story_brief"].slug, "3_after_fact_revision.md", updated_package.to_markdown())
+
+    return {"draft_package": updated_package}
+
+
+def _review_style_messages(state: ReporterState, config: RunnableConfig = None) -> list:
+    story_brief = state["story_brief"]
 
     # Tight context: just draft + article type (no research needed)
-    messages = [
-        SystemMessage(content=style_review_prompt),
+    return [
+        SystemMessage(content=_review_prompt(style_review_prompt, config)),
         HumanMessage(content=f"Article Type: {story_brief.article_type}"),
-        HumanMessage(content=f"Draft to Review:\n\n{draft_package.full_draft}")
+        HumanMessage(content=f"Draft to Review:\n\n{_draft_to_review(state, config)}")
     ]
 
+
+def review_style(state: ReporterState, config: RunnableConfig = None):
+    """Review draft for style compliance, structure, voice."""
+    logger.info("-> review_style")
+
+    model = _get_model(config, get_mini_model)  # Analytical task: use mini model
+
     logger.info("  Reviewing style...")
-    structured_model = model.with_structured_output(StyleReview)
-    style_review = structured_model.invoke(messages)
+    result = invoke_structured(model, _review_schema(StyleReview, config), _review_style_messages(state, config), config)
+    style_review = _as_review(result, StyleReview)
 
     logger.info(f"  Style review complete: {len(style_review.issues)} issues found")
 
     # Save style review
-    output_dir = _get_reporter_dir(story_brief.slug)
-    with open(output_dir / "4_style_review.md", "w") as f:
-        f.write(style_review.to_markdown())
-    logger.info("  Saved: 4_style_review.md")
+    _save_reporter_file(state["story_brief"].slug, "4_style_review.md", style_review.to_markdown())
+
+    return {"style_review": style_review, "style_issues": _anchored_issues(result)}
+
+
+async def areview_style(state: ReporterState, config: RunnableConfig = None):
+    """Async version of review_style."""
+    logger.info("-> review_style")
+
+    model = _get_model(config, get_mini_model)
 
-    return {"style_review": style_review}
+    logger.info("  Reviewing style...")
+    result = await ainvoke_structured(model, _review_schema(StyleReview, config), _review_style_messages(state, config), config)
+    style_review = _as_review(result, StyleReview)
+
+    logger.info(f"  Style review complete: {len(style_review.issues)} issues found")
+
+    await _asave_reporter_file(state["story_brief"].slug, "4_style_review.md", style_review.to_markdown())
+
+    return {"style_review": style_review, "style_issues": _anchored_issues(result)}
 
 
 def revise_style(state: ReporterState, config: RunnableConfig = None):
     """Revise draft to fix style issues."""
     logger.info("-> revise_style")
 
-    story_brief = state["story_brief"]
     draft_package = state["draft_package"]
     style_review = state["style_review"]
 
@@ -292,36 +857,108 @@ def revise_style(state: ReporterState, config: RunnableConfig = None):
         logger.info("  No style issues to fix, skipping revision")
         return {}
 
-    configuration = config.get("configurable", {}) if config else {}
-    model = configuration.get("model", smart_model)  # Revision task: use smart model
+    model = _get_model(config, get_smart_model)  # Revision task: use smart model
 
-    issues_str = "\n".join(f"- {issue}" for issue in style_review.issues)
-    prompt = revision_prompt.format(issues=issues_str)
+    logger.info(f"  Revising {len(style_review.issues)} style issues...")
+    updated_package = _revise_draft(model, draft_package, style_review.issues, state.get("style_issues"), config)
 
-    messages = [
-        SystemMessage(content=prompt),
-        HumanMessage(content=f"Current Draft:\n\n{draft_package.full_draft}")
-    ]
+    word_count = count_words(updated_package.full_draft)
+    logger.info(f"  Style revision complete: {word_count} words")
+
+    # Save revised draft
+    _save_reporter_file(state["story_brief"].slug, "5_after_style_revision.md", updated_package.to_markdown())
+
+    return {"draft_package": updated_package}
+
+
+async def arevise_style(state: ReporterState, config: RunnableConfig = None):
+    """Async version of revise_style."""
+    logger.info("-> revise_style")
+
+    draft_package = state["draft_package"]
+    style_review = state["style_review"]
+
+    if not style_review.issues:
+        logger.info("  No style issues to fix, skipping revision")
+        return {}
+
+    model = _get_model(config, get_smart_model)
 
     logger.info(f"  Revising {len(style_review.issues)} style issues...")
-    structured_model = model.with_structured_output(RevisedDraft)
-    revised = structured_model.invoke(messages)
+    updated_package = await _arevise_draft(model, draft_package, style_review.issues, state.get("style_issues"), config)
 
-    # Update only full_draft, preserve sources
-    updated_package = DraftPackage(
-        full_draft=revised.full_draft,
-        sources=draft_package.sources,
-        sources_section=draft_package.sources_section
+    word_count = count_words(updated_package.full_draft)
+    logger.info(f"  Style revision complete: {word_count} words")
+
+    await _asave_reporter_file(state["story_brief"].slug, "5_after_style_revision.md", updated_package.to_markdown())
+
+    return {"draft_package": updated_package}
+
+
+def _combined_issues(state: ReporterState) -> List[str]:
+    fact_review = state.get("fact_review")
+    style_review = state.get("style_review")
+    fact_issues = fact_review.issues if fact_review else []
+    style_issues = style_review.issues if style_review else []
+    return [f"[Fact] {i}" for i in fact_issues] + [f"[Style] {i}" for i in style_issues]
+
+
+def _combined_anchored_issues(state: ReporterState) -> Optional[List[ParagraphIssue]]:
+    fact_issues = state.get("fact_issues")
+    style_issues = state.get("style_issues")
+    if fact_issues is None and style_issues is None:
+        return None
+    return (
+        [ParagraphIssue(paragraph=i.paragraph, issue=f"[Fact] {i.issue}") for i in fact_issues or []]
+        + [ParagraphIssue(paragraph=i.paragraph, issue=f"[Style] {i.issue}") for i in style_issues or []]
     )
 
+
+def revise(state: ReporterState, config: RunnableConfig = None):
+    """Revise draft once for the merged fact and style issues (parallel review mode)."""
+    logger.info("-> revise")
+
+    draft_package = state["draft_package"]
+    issues = _combined_issues(state)
+
+    if not issues:
+        logger.info("  No issues to fix, skipping revision")
+        return {}
+
+    model = _get_model(config, get_smart_model)  # Revision task: use smart model
+
+    logger.info(f"  Revising {len(issues)} fact and style issues...")
+    updated_package = _revise_draft(model, draft_package, issues, _combined_anchored_issues(state), config)
+
     word_count = count_words(updated_package.full_draft)
-    logger.info(f"  Style revision complete: {word_count} words")
+    logger.info(f"  Revision complete: {word_count} words")
 
     # Save revised draft
-    output_dir = _get_reporter_dir(story_brief.slug)
-    with open(output_dir / "5_after_style_revision.md", "w") as f:
-        f.write(updated_package.to_markdown())
-    logger.info("  Saved: 5_after_style_revision.md")
+    _save_reporter_file(state["story_brief"].slug, "5_after_revision.md", updated_package.to_markdown())
+
+    return {"draft_package": updated_package}
+
+
+async def arevise(state: ReporterState, config: RunnableConfig = None):
+    """Async version of revise."""
+    logger.info("-> revise")
+
+    draft_package = state["draft_package"]
+    issues = _combined_issues(state)
+
+    if not issues:
+        logger.info("  No issues to fix, skipping revision")
+        return {}
+
+    model = _get_model(config, get_smart_model)
+
+    logger.info(f"  Revising {len(issues)} fact and style issues...")
+    updated_package = await _arevise_draft(model, draft_package, issues, _combined_anchored_issues(state), config)
+
+    word_count = count_words(updated_package.full_draft)
+    logger.info(f"  Revision complete: {word_count} words")
+
+    await _asave_reporter_file(state["story_brief"].slug, "5_after_revision.md", updated_package.to_markdown())
 
     return {"draft_package": updated_package}
 
@@ -343,32 +980,147 @@ def finalize_draft(state: ReporterState, config: RunnableConfig = None):
     return {"draft_package": draft_package}
 
 
+async def afinalize_draft(state: ReporterState, config: RunnableConfig = None):
+    """Async version of finalize_draft."""
+    logger.info("-> finalize_draft")
+
+    story_brief = state["story_brief"]
+    draft_package = state["draft_package"]
+
+    word_count = count_words(draft_package.full_draft)
+    logger.info(f"  Final word count: {word_count}")
+
+    await draft_package.asave(story_brief.slug)
+    logger.info(f"  Saved final draft to: artifacts/{story_brief.slug}/")
+
+    return {"draft_package": draft_package}
+
+
+# =============================================================================
+# ROUTING
+# =============================================================================
+
+def _review_mode(config: RunnableConfig = None) -> str:
+    configuration = config.get("configurable", {}) if config else {}
+    mode = configuration.get("review_mode", "sequential")
+    if mode not in REVIEW_MODES:
+        raise ValueError(f"Unknown review_mode '{mode}', expected one of {REVIEW_MODES}")
+    return mode
+
+
+def _revision_mode(config: RunnableConfig = None) -> str:
+    configuration = config.get("configurable", {}) if config else {}
+    mode = configuration.get("revision_mode", "full")
+    if mode not in REVISION_MODES:
+        raise ValueError(f"Unknown revision_mode '{mode}', expected one of {REVISION_MODES}")
+    return mode
+
+
+def _draft_mode(config: RunnableConfig = None) -> str:
+    configuration = config.get("configurable", {}) if config else {}
+    mode = configuration.get("draft_mode", "single")
+    if mode not in DRAFT_MODES:
+        raise ValueError(f"Unknown draft_mode '{mode}', expected one of {DRAFT_MODES}")
+    return mode
+
+
+def route_draft(state: ReporterState, config: RunnableConfig = None) -> Literal["write_draft", "outline_draft"]:
+    """Outline first in sectioned mode, for article types long enough to benefit."""
+    if _draft_mode(config) == "sectioned" and state["story_brief"].is_article_type(*SECTIONED_ARTICLE_TYPES):
+        return "outline_draft"
+    return "write_draft"
+
+
+def route_sections(state: ReporterState, config: RunnableConfig = None):
+    """Fan out one write_section task per outline section."""
+    draft_outline = state.get("draft_outline")
+    if not draft_outline or not draft_outline.sections:
+        logger.warning("  Outline has no sections, writing the draft in one call")
+        return "write_draft"
+
+    return [
+        Send("write_section", {
+            "story_brief": state["story_brief"],
+            "draft_research": state["draft_research"],
+            "draft_outline": draft_outline,
+            "index": index,
+            "section": section,
+        })
+        for index, section in enumerate(draft_outline.sections)
+    ]
+
+
+def route_reviews(state: ReporterState, config: RunnableConfig = None):
+    """Start with the fact review, or with both reviews at once in parallel mode."""
+    if _review_mode(config) == "parallel":
+        return ["review_facts", "review_style"]
+    return "review_facts"
+
+
+def after_review_facts(state: ReporterState, config: RunnableConfig = None) -> Literal["revise_facts", "revise"]:
+    return "revise" if _review_mode(config) == "parallel" else "revise_facts"
+
+
+def after_review_style(state: ReporterState, config: RunnableConfig = None) -> Literal["revise_style", "revise"]:
+    return "revise" if _review_mode(config) == "parallel" else "revise_style"
+
+
 # =============================================================================
 # GRAPH
 # =============================================================================
 
 def build_reporter_graph():
     """
-    Build the reporter graph with linear two-pass review:
+    Build the reporter graph. The drafting, review and revision flows are
+    picked at run time with the `draft_mode`, `review_mode` and
+    `revision_mode` config options. Every flow starts with select_research,
+    which ranks the research package once and stores the items the drafting
+    and review calls share (START below stands for START → select_research).
 
+    sequential (default), linear two-pass review:
     START → write_draft → review_facts → revise_facts → review_style → revise_style → finalize_draft → END
+
+    parallel, both reviews read the initial draft and one revision fixes all issues:
+    START → write_draft ─┬→ review_facts ─┬→ revise → finalize_draft → END
+                         └→ review_style ─┘
+
+    draft_mode "sectioned" drafts a Full Feature section by section instead of
+    in one call: an outline assigns research items to each ## section, the
+    sections are written concurrently, and a stitch pass smooths transitions:
+    START → outline_draft ─┬→ write_section ─┬→ stitch_draft → (reviews)
+                           └→ write_section ─┘
+
+    revision_mode "patch" keeps either review flow, but the reviews tie each
+    issue to a paragraph and the revise nodes rewrite only those paragraphs,
+    concurrently, splicing them back into the otherwise unchanged draft.
+
+    Every node has an async twin, so the graph can be run with invoke or ainvoke.
     """
     builder = StateGraph(ReporterState)
 
-    builder.add_node("write_draft", write_draft)
-    builder.add_node("review_facts", review_facts)
-    builder.add_node("revise_facts", revise_facts)
-    builder.add_node("review_style", review_style)
-    builder.add_node("revise_style", revise_style)
-    builder.add_node("finalize_draft", finalize_draft)
-
-    # Linear flow - no conditionals
-    builder.add_edge(START, "write_draft")
-    builder.add_edge("write_draft", "review_facts")
-    builder.add_edge("review_facts", "revise_facts")
+    builder.add_node("select_research", RunnableLambda(select_draft_research, afunc=aselect_draft_research))
+    builder.add_node("write_draft", RunnableLambda(write_draft, afunc=awrite_draft))
+    builder.add_node("outline_draft", RunnableLambda(outline_draft, afunc=aoutline_draft))
+    builder.add_node("write_section", RunnableLambda(write_section, afunc=awrite_section))
+    builder.add_node("stitch_draft", RunnableLambda(stitch_draft, afunc=astitch_draft))
+    builder.add_node("review_facts", RunnableLambda(review_facts, afunc=areview_facts))
+    builder.add_node("revise_facts", RunnableLambda(revise_facts, afunc=arevise_facts))
+    builder.add_node("review_style", RunnableLambda(review_style, afunc=areview_style))
+    builder.add_node("revise_style", RunnableLambda(revise_style, afunc=arevise_style))
+    builder.add_node("revise", RunnableLambda(revise, afunc=arevise))
+    builder.add_node("finalize_draft", RunnableLambda(finalize_draft, afunc=afinalize_draft))
+
+    builder.add_edge(START, "select_research")
+    builder.add_conditional_edges("select_research", route_draft, ["write_draft", "outline_draft"])
+    builder.add_conditional_edges("outline_draft", route_sections, ["write_section", "write_draft"])
+    builder.add_edge("write_section", "stitch_draft")
+    builder.add_conditional_edges("write_draft", route_reviews, ["review_facts", "review_style"])
+    builder.add_conditional_edges("stitch_draft", route_reviews, ["review_facts", "review_style"])
+    builder.add_conditional_edges("review_facts", after_review_facts, ["revise_facts", "revise"])
     builder.add_edge("revise_facts", "review_style")
-    builder.add_edge("review_style", "revise_style")
+    builder.add_conditional_edges("review_style", after_review_style, ["revise_style", "revise"])
     builder.add_edge("revise_style", "finalize_draft")
+    builder.add_edge("revise", "finalize_draft")
     builder.add_edge("finalize_draft", END)
 
     return builder.compile()
@@ -376,7 +1128,7 @@ def build_reporter_graph():
 
 if __name__ == "__main__":
     import argparse
-    from agentic_newsroom.schemas.models import StoryBrief, ResearchPackage
+    from agentic_newsroom.schemas.models import StoryBrief
     from agentic_newsroom.utils.newsroom_logging import setup_logging
 
     setup_logging()
@@ -386,6 +1138,9 @@ if __name__ == "__main__":
         parser = argparse.ArgumentParser(description="Reporter Agent")
         parser.add_argument("slug", help="The article slug")
         parser.add_argument("--mini", action="store_true", help="Use mini model instead of smart model")
+        parser.add_argument("--parallel-review", action="store_true", help="Run fact and style reviews concurrently and revise once")
+        parser.add_argument("--sectioned", action="store_true", help="Write a Full Feature section by section, in parallel")
+        parser.add_argument("--patch-revisions", action="store_true", help="Revise only the paragraphs the reviews flagged")
         args = parser.parse_args()
 
         slug = args.slug
@@ -414,7 +1169,11 @@ if __name__ == "__main__":
             "story_brief": story_brief,
             "research_package": research_package,
         }
-        config = {"configurable": {"model": model}}
+        review_mode = "parallel" if args.parallel_review else "sequential"
+        draft_mode = "sectioned" if args.sectioned else "single"
+        revision_mode = "patch" if args.patch_revisions else "full"
+        config = {"configurable": {"model": model, "review_mode": review_mode, "draft_mode": draft_mode,
+                                   "revision_mode": revision_mode}}
 
         logger.info("Starting reporter workflow")
         result = graph.invoke(initial_state, config)
@@ -1,25 +1,76 @@
-from dotenv import load_dotenv
-load_dotenv()
-
+import asyncio
+import contextvars
+import hashlib
 import logging
-from typing import Literal, List, Optional
-from pydantic import BaseModel
+import math
+import os
+import re
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, Literal, List, Optional, Union
+from pydantic import BaseModel, Field
 from langchain_core.messages import SystemMessage, AIMessage
 from langgraph.graph import START, END, StateGraph
+from langgraph.types import Send
 
 logger = logging.getLogger(__name__)
 
-from agentic_newsroom.schemas.states import ResearchState
+from agentic_newsroom.schemas.states import ResearchState, SourceState
 from agentic_newsroom.schemas.models import SearchResult, ResearchPackage, StoryBrief
-from agentic_newsroom.  tools.tavily_search import perform_search, perform_extract
-from agentic_newsroom.llm.openai import get_mini_model
+from agentic_newsroom.tools.tavily_search import perform_search, perform_extract, aperform_search, aperform_extract, SEARCH_CREDITS, EXTRACT_URLS_PER_CREDIT
+from agentic_newsroom.tools.research_index import search_local, index_pages
+from agentic_newsroom.llm.openai import get_mini_model, invoke_structured, ainvoke_structured
+from agentic_newsroom.utils.chunking import count_tokens, select_evidence, format_evidence, tokenize
+from agentic_newsroom.utils.content import clean_url, normalize_url
+from agentic_newsroom.utils.research_log import ResearchLog
 
 # --- Configuration ---
-default_model = get_mini_model()
 
-# You can override this via initial state, but this is the default cap
+# Turn cap for article types without their own budget. Set `max_turns` in the
+# initial state to override the budget's cap for one run.
 DEFAULT_MAX_TURNS = 5
 
+# Each turn takes 6 graph steps, well past LangGraph's default limit of 25
+RECURSION_LIMIT = 100
+
+# Token budget for the extracted page text analyzed per turn, shared by the turn's pages:
+# the most relevant chunks across all of them are kept. Override per run with the
+# `extract_token_budget` config option.
+EXTRACT_TOKEN_BUDGET = int(os.getenv("RESEARCH_EXTRACT_TOKEN_BUDGET", "8000"))
+
+# "sequential" runs each turn's steps one after another. "pipelined" generates the
+# next turn's queries while the current turn's pages are extracted and analyzed, and
+# throws them away if the turn ends research. Set per run with the `research_mode` config option.
+RESEARCH_MODES = ("sequential", "pipelined")
+
+
+class ResearchBudget(BaseModel):
+    """Spending limits and yield thresholds for one research run.
+
+    Research stops at the first limit reached, or once a turn (after `min_turns`)
+    adds fewer than `min_new_sources` sources and `min_new_items` items and
+    covers no new key question.
+    """
+    max_turns: int = Field(DEFAULT_MAX_TURNS, description="Hard cap on research turns")
+    min_turns: int = Field(2, description="Turns always run before the yield check applies")
+    max_tokens: int = Field(150_000, description="Estimated LLM tokens, prompts plus outputs")
+    max_credits: int = Field(50, description="Tavily credits")
+    max_seconds: float = Field(600, description="Wall time since the first turn started")
+    min_new_sources: int = Field(2, description="New unique sources a turn must add to count as productive")
+    min_new_items: int = Field(5, description="New research items a turn must add to count as productive")
+
+
+# Budgets by StoryBrief.article_type. Override fields per run with the
+# `research_budget` config option, e.g. {"max_credits": 20}.
+RESEARCH_BUDGETS = {
+    "Web Daily": ResearchBudget(max_turns=3, min_turns=1, max_tokens=50_000, max_credits=20, max_seconds=240,
+                                min_new_sources=1, min_new_items=3),
+    "Full Feature": ResearchBudget(),
+}
+
+# Queries sharing at least this fraction of their terms with an earlier query are dropped
+QUERY_SIMILARITY_THRESHOLD = 0.8
+
 
 # --- Prompts ---
 
@@ -33,11 +84,15 @@ generate_queries_prompt = """You are a senior researcher planning the next step
 {context_str}
 </Current Info>
 
+<Previous Queries>
+{previous_queries}
+</Previous Queries>
+
 <Task>
 Your goal is to dig deeper to find not just facts, but **stories, characters, and scenes**.
 1. Look at what we know (Current Info).
 2. Identify **Narrative Gaps**: Do we lack the "smell" of the place? Do we need a specific character's voice? Do we need the turning point of the event?
-3. Generate 3 targeted search queries to fill those gaps.
+3. Generate 3 targeted search queries to fill those gaps. Do not repeat or rephrase the Previous Queries.
 </Task>
 """
 
@@ -74,7 +129,7 @@ Select up to 3 URLs that seem most likely to contain **First-Person Accounts, Pr
 """
 
 
-extract_analyze_prompt = """You are a research analyst tasked to extract key facts and quotes from the sources.
+analyze_source_prompt = """You are a research analyst tasked to extract key facts and quotes from a source.
 A reporter of scientific magazine will use the facts you extract to write a full feature with strong narrative voices.
 
 
@@ -85,11 +140,12 @@ Here's the story brief:
 </Story Brief>
 
 <Task>
-We have extracted full text from several sources.
+We have extracted the full text of one source.
 1. Read the text below.
 2. Extract KEY FACTS, QUOTES, and DATA POINTS in verbatim that help write the story. (check the Important section for more details)
 3. Ignore navigation, links, images, ads, or irrelevant fluff.
 4. For every item you extract, you MUST preserve the Source URL.
+5. Summarize in one or two sentences what this source adds to the story.
 </Task>
 
 <Important>
@@ -97,17 +153,36 @@ Pay special attention to quotes the reporter may use in the article.
 These quotes must be in verbatim and attributed back to the source.
 </Important>
 
+<Extracted Content>
+{content_str}
+</Extracted Content>
+"""
+
+merge_findings_prompt = """You are the lead researcher deciding whether research for a science magazine feature is complete.
+
+<Story Brief>
+{story_brief}
+</Story Brief>
+
+<Earlier Findings>
+{context_str}
+</Earlier Findings>
+
+<This Turn>
+{turn_str}
+</This Turn>
+
 <Analysis Completion Criteria>
-You're conducting a deep investigation. Do NOT mark research as complete unless:
+We have {source_count} distinct sources so far. You're conducting a deep investigation. Do NOT mark research as complete unless:
 1. You have at least 5 distinct high-quality sources (primary sources, interviews, or academic papers).
 2. You have found specific personal quotes or anecdotes (narrative color).
 3. You have covered the full timeline mentioned in the Brief.
 If any of these are missing, set is_complete=False so we keep searching.
 </Analysis Completion Criteria>
 
-<Extracted Content>
-{content_str}
-</Extracted Content>
+<Task>
+Decide is_complete, and write summary_of_findings: what this turn added and what is still missing.
+</Task>
 """
 
 # --- Structured Outputs ---
@@ -118,69 +193,379 @@ class UrlSelection(BaseModel):
     urls: List[str]
     reasoning: str
 
-class ExtractedInfo(BaseModel):
+class SourceAnalysis(BaseModel):
     new_items: List[SearchResult]
+    summary: str
+
+class CompletenessCheck(BaseModel):
     is_complete: bool
     summary_of_findings: str
 
 
 # --- Nodes ---
 
-from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables import RunnableConfig, RunnableLambda
 
-def generate_queries_node(state: ResearchState, config: RunnableConfig = None):
-    current_turn = state.get("current_turn", 0) + 1
-    logger.info(f"→ generate_queries (turn {current_turn})")
+def _get_model(config: RunnableConfig = None):
+    configuration = config.get("configurable", {}) if config else {}
+    return configuration.get("model") or get_mini_model()
+
+def _tavily_cache(config: RunnableConfig = None):
+    """`tavily_cache` config option: False bypasses the on-disk Tavily cache."""
+    configuration = config.get("configurable", {}) if config else {}
+    return configuration.get("tavily_cache")
+
+def _research_index(config: RunnableConfig = None):
+    """`research_index` config option: False skips the local index of past research."""
+    configuration = config.get("configurable", {}) if config else {}
+    return configuration.get("research_index")
 
+def _research_mode(config: RunnableConfig = None) -> str:
+    configuration = config.get("configurable", {}) if config else {}
+    mode = configuration.get("research_mode", "sequential")
+    if mode not in RESEARCH_MODES:
+        raise ValueError(f"Unknown research_mode '{mode}', expected one of {RESEARCH_MODES}")
+    return mode
+
+def _research_budget(state: ResearchState, config: RunnableConfig = None) -> ResearchBudget:
+    """Budget for the brief's article type, with config and state overrides applied."""
+    brief = state["story_brief"]
+    budget = next((b for name, b in RESEARCH_BUDGETS.items() if brief.is_article_type(name)), ResearchBudget())
+
+    configuration = config.get("configurable", {}) if config else {}
+    overrides = dict(configuration.get("research_budget") or {})
+    if state.get("max_turns"):
+        overrides["max_turns"] = state["max_turns"]
+    return budget.model_copy(update=overrides)
+
+def _llm_tokens(messages: list, result: BaseModel) -> int:
+    """Estimated tokens of one structured call, for the research budget."""
+    return sum(count_tokens(m.content) for m in messages) + count_tokens(result.model_dump_json())
+
+def _in_progress_str(state: ResearchState) -> str:
+    """What the current turn has found before its analysis is done: snippets of the sources being read."""
+    urls = {normalize_url(url) for url in state.get("urls_to_extract", [])}
+    snippets = [
+        f"- {r.get('title')}: {r.get('content')}"
+        for r in state.get("raw_search_results", [])
+        if normalize_url(r.get("url") or "") in urls
+    ]
+    return f"Turn {state['current_turn']} (in progress), now reading:\n" + "\n".join(snippets)
+
+def _generate_queries_messages(state: ResearchState, speculative: bool = False) -> list:
     brief = state["story_brief"]
     # Grab only 5 last messages from the context for short-term memory
     # Since this is called in a loop it's assumed that messages older than 5 are not relevant
     context_msgs = state.get("context", [])
     context_str = "\n".join([m.content for m in context_msgs[-5:]])
+    if speculative:
+        context_str = "\n".join(filter(None, [context_str, _in_progress_str(state)]))
 
-    # Handle configuration
-    configuration = config.get("configurable", {}) if config else {}
-    model = configuration.get("model", default_model)
+    previous_queries = "\n".join(f"- {q}" for q in state.get("seen_queries", []))
 
     system_msg = generate_queries_prompt.format(
         story_brief=brief.model_dump_json(indent=2),
-        context_str=context_str or "No research done yet."
+        context_str=context_str or "No research done yet.",
+        previous_queries=previous_queries or "None yet."
     )
+    return [SystemMessage(content=system_msg)]
+
+def _is_near_duplicate(query: str, seen: List[set]) -> bool:
+    """True if the query's terms mostly overlap with one of the `seen` term sets (Jaccard)."""
+    terms = set(tokenize(query))
+    if not terms:
+        return True
+    return any(len(terms & other) / len(terms | other) >= QUERY_SIMILARITY_THRESHOLD for other in seen)
+
+def _new_queries(queries: List[str], seen_queries: List[str]) -> List[str]:
+    """Drop queries that repeat an earlier one, or each other."""
+    seen = [set(tokenize(q)) for q in seen_queries]
+    fresh = []
+    for query in queries:
+        if _is_near_duplicate(query, seen):
+            logger.debug(f"  Skipping repeated query: {query}")
+            continue
+        fresh.append(query)
+        seen.append(set(tokenize(query)))
+    return fresh
+
+def _queries_update(state: ResearchState, res: Queries, current_turn: int) -> dict:
+    queries = _new_queries(res.queries, state.get("seen_queries", []))
+    logger.info(f"  Generated {len(res.queries)} queries ({len(res.queries) - len(queries)} repeated)")
+    logger.debug(f"  Queries: {queries}")
+
+    update = {
+        "queries": queries,
+        "seen_queries": queries,
+        "current_turn": current_turn
+    }
+    if current_turn == 1:
+        update["started_at"] = time.time()
+    return update
+
+def _items_update(brief: StoryBrief, items: Iterable[SearchResult]) -> dict:
+    """What research items add to the totals kept in state. The items themselves only go to the research log.
+
+    A key question counts as covered once an item shares at least half its terms.
+    """
+    question_terms = [set(tokenize(q)) for q in brief.key_questions]
+    count, sources, covered = 0, {}, set()
+    for item in items:
+        count += 1
+        sources.setdefault(normalize_url(item.source))
+        item_terms = set(tokenize(item.content))
+        covered.update(i for i, terms in enumerate(question_terms) if terms and len(terms & item_terms) >= len(terms) / 2)
+    return {"item_count": count, "item_sources": list(sources), "covered_questions": sorted(covered)}
+
+def _restored_state(brief: StoryBrief, log: ResearchLog, turns: List[dict]) -> dict:
+    """Research state as it was after the last completed turn in the log."""
+    last = turns[-1]
+    log.rollback(last["turn"])
+    totals = _items_update(brief, log.iter_items(last["turn"]))
+    logger.info(f"  Resuming after turn {last['turn']} with {totals['item_count']} logged items")
+
+    return {
+        "current_turn": last["turn"],
+        **totals,
+        "context": [AIMessage(content=t["context"]) for t in turns],
+        "turn_stats": [t["stats"] for t in turns],
+        "seen_urls": last["seen_urls"],
+        "seen_queries": last["seen_queries"],
+        "spent_tokens": last["spent_tokens"],
+        "spent_credits": last["spent_credits"],
+        "is_complete": last["is_complete"],
+        "started_at": time.time()  # The time budget restarts, downtime isn't research time
+    }
+
+def _resume_update(brief: StoryBrief) -> dict:
+    log = ResearchLog(brief.slug)
+    turns = log.resumable_turns()
+    if not turns:
+        log.reset()
+        return {}
+    return _restored_state(brief, log, turns)
+
+def resume_research_node(state: ResearchState):
+    """Pick up an interrupted run from its research log, or start a fresh log."""
+    logger.info("→ resume_research")
+    return _resume_update(state["story_brief"])
+
+async def aresume_research_node(state: ResearchState):
+    logger.info("→ resume_research")
+    return await asyncio.to_thread(_resume_update, state["story_brief"])
+
+def route_resume(state: ResearchState, config: RunnableConfig = None):
+    """A resumed run continues where the loop decision left off, a fresh one starts locally."""
+    if state.get("turn_stats"):
+        return check_loop(state, config)
+    return "search_local"
+
+def _local_query(brief: StoryBrief) -> str:
+    return " ".join([brief.topic, brief.angle, *brief.key_questions])
+
+def _local_update(brief: StoryBrief, items: List[SearchResult], pages: List[dict]) -> dict:
+    """Treat local hits as turn 0: pages go through analyze_source, items are reused as is."""
+    update = {
+        "current_turn": 0,
+        **_items_update(brief, items),
+        "extracted_pages": pages,
+        # Pages we already have facts from don't need to be extracted again
+        "seen_urls": list(dict.fromkeys(normalize_url(u) for u in [*(r.source for r in items), *(p["url"] for p in pages)])),
+    }
+    if items:
+        update["source_findings"] = [{
+            "turn": 0,
+            "url": "local research index",
+            "summary": f"Reused {len(items)} items from earlier research packages.",
+            "items": len(items)
+        }]
+    return update
+
+def search_local_node(state: ResearchState, config: RunnableConfig = None):
+    """Look up past research packages and extracted pages before searching the web."""
+    logger.info("→ search_local")
+    brief = state["story_brief"]
+
+    items, pages = search_local(_local_query(brief), exclude_slug=brief.slug, use_index=_research_index(config))
+    ResearchLog(brief.slug).append_items(0, items)
+
+    return _local_update(brief, items, pages)
+
+async def asearch_local_node(state: ResearchState, config: RunnableConfig = None):
+    logger.info("→ search_local")
+    brief = state["story_brief"]
+
+    items, pages = await asyncio.to_thread(search_local, _local_query(brief), brief.slug, _research_index(config))
+    await asyncio.to_thread(ResearchLog(brief.slug).append_items, 0, items)
+
+    return _local_update(brief, items, pages)
+
+def route_local(state: ResearchState, config: RunnableConfig = None):
+    """Analyze local hits like a research turn, or go straight to the web when there are none."""
+    if not state.get("item_count") and not state.get("extracted_pages"):
+        return "generate_queries"
+    return route_sources(state, config)
+
+def _speculated_update(state: ResearchState, current_turn: int) -> dict:
+    logger.info(f"  Using {len(state['next_queries'])} queries generated during the previous turn")
+    update = _queries_update(state, Queries(queries=state["next_queries"]), current_turn)
+    update["next_queries"] = []
+    return update
+
+def generate_queries_node(state: ResearchState, config: RunnableConfig = None):
+    current_turn = state.get("current_turn", 0) + 1
+    logger.info(f"→ generate_queries (turn {current_turn})")
+
+    if state.get("next_queries"):
+        return _speculated_update(state, current_turn)
 
     # Generate
-    structured_model = model.with_structured_output(Queries)
-    res = structured_model.invoke([SystemMessage(content=system_msg)])
+    messages = _generate_queries_messages(state)
+    res = invoke_structured(_get_model(config), Queries, messages, config)
 
-    logger.info(f"  Generated {len(res.queries)} queries")
-    logger.debug(f"  Queries: {res.queries}")
+    return {**_queries_update(state, res, current_turn), "spent_tokens": _llm_tokens(messages, res)}
 
+async def agenerate_queries_node(state: ResearchState, config: RunnableConfig = None):
+    current_turn = state.get("current_turn", 0) + 1
+    logger.info(f"→ generate_queries (turn {current_turn})")
+
+    if state.get("next_queries"):
+        return _speculated_update(state, current_turn)
+
+    messages = _generate_queries_messages(state)
+    res = await ainvoke_structured(_get_model(config), Queries, messages, config)
+
+    return {**_queries_update(state, res, current_turn), "spent_tokens": _llm_tokens(messages, res)}
+
+# Pipelined mode: next-turn query generation in flight, by (slug, turn). It runs outside
+# the graph's steps, from extract_pages until merge_findings, so it is kept out of the
+# (checkpointed) state. A run resumed from a checkpoint just generates its queries again.
+_speculations: Dict[tuple, Union[Future, asyncio.Task]] = {}
+
+def _speculation_key(state: ResearchState) -> tuple:
+    return state["story_brief"].slug, state["current_turn"]
+
+def _should_speculate(state: ResearchState, config: RunnableConfig = None) -> bool:
+    """Pipelined mode only. Speculation is pointless on the last turn, so it is skipped there."""
+    last_turn = state.get("current_turn", 0) >= _research_budget(state, config).max_turns
+    return _research_mode(config) == "pipelined" and not last_turn and bool(state.get("urls_to_extract"))
+
+def _speculation_update(state: ResearchState, res: Queries) -> dict:
+    queries = _new_queries(res.queries, state.get("seen_queries", []))
+    logger.info(f"  Speculated {len(queries)} queries for turn {state['current_turn'] + 1}")
+    logger.debug(f"  Queries: {queries}")
+    return {"next_queries": queries}
+
+def _speculate(state: ResearchState, config: RunnableConfig = None) -> dict:
+    messages = _generate_queries_messages(state, speculative=True)
+    res = invoke_structured(_get_model(config), Queries, messages, config)
+    return {**_speculation_update(state, res), "spent_tokens": _llm_tokens(messages, res)}
+
+async def _aspeculate(state: ResearchState, config: RunnableConfig = None) -> dict:
+    messages = _generate_queries_messages(state, speculative=True)
+    res = await ainvoke_structured(_get_model(config), Queries, messages, config)
+    return {**_speculation_update(state, res), "spent_tokens": _llm_tokens(messages, res)}
+
+def _start_speculation(state: ResearchState, config: RunnableConfig = None):
+    """Pipelined mode: plan the next turn's queries on a background thread while this turn's
+    pages are extracted and analyzed. merge_findings joins the result."""
+    if not _should_speculate(state, config):
+        return
+    logger.info(f"  Speculating queries for turn {state['current_turn'] + 1}")
+    pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="speculate_queries")
+    # Run in a copy of the node's context, so the call reports to the run's callbacks (metrics)
+    context = contextvars.copy_context()
+    _speculations[_speculation_key(state)] = pool.submit(context.run, _speculate, state, config)
+    pool.shutdown(wait=False)  # The thread exits once the call returns
+
+def _astart_speculation(state: ResearchState, config: RunnableConfig = None):
+    """Async version of _start_speculation: a task on the running event loop."""
+    if not _should_speculate(state, config):
+        return
+    logger.info(f"  Speculating queries for turn {state['current_turn'] + 1}")
+    _speculations[_speculation_key(state)] = asyncio.create_task(_aspeculate(state, config))
+
+def _discard_speculation(speculation: Union[Future, asyncio.Task]):
+    """Cancel a speculation that is no longer needed. A call already running on a
+    thread can't be cancelled, so its result is just ignored."""
+    speculation.cancel()
+    # Mark a failure as seen, so asyncio doesn't log it as never retrieved
+    speculation.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+def _speculation_result(state: ResearchState, speculation: Union[Future, asyncio.Future]) -> dict:
+    try:
+        return speculation.result()
+    except Exception as e:
+        logger.warning(f"  Query speculation failed, turn {state['current_turn'] + 1} generates its own: {e}")
+        return {}
+
+def _join_speculation(state: ResearchState, update: dict) -> dict:
+    """Add the next turn's speculated queries to merge_findings' update. If the turn
+    ended research they are not needed, so the call isn't waited for."""
+    speculation = _speculations.pop(_speculation_key(state), None)
+    if speculation is None:
+        return update
+    if update.get("is_complete"):
+        _discard_speculation(speculation)
+        return update
+
+    joined = _speculation_result(state, speculation)
+    return {**update, **joined, "spent_tokens": update.get("spent_tokens", 0) + joined.get("spent_tokens", 0)}
+
+async def _ajoin_speculation(state: ResearchState, update: dict) -> dict:
+    speculation = _speculations.pop(_speculation_key(state), None)
+    if speculation is None:
+        return update
+    if update.get("is_complete"):
+        _discard_speculation(speculation)
+        return update
+
+    if not isinstance(speculation, asyncio.Task):
+        speculation = asyncio.wrap_future(speculation)
+    await asyncio.wait({speculation})
+    joined = _speculation_result(state, speculation)
+    return {**update, **joined, "spent_tokens": update.get("spent_tokens", 0) + joined.get("spent_tokens", 0)}
+
+def _unseen_results(state: ResearchState, raw_results: List[dict]) -> List[dict]:
+    """Drop results whose page was already extracted, or that repeat within this search."""
+    seen = set(state.get("seen_urls", []))
+    fresh = []
+    for r in raw_results:
+        url = normalize_url(r.get("url") or "")
+        if url and url not in seen:
+            seen.add(url)
+            fresh.append(r)
+    return fresh
+
+def _search_update(state: ResearchState, raw_results: List[dict]) -> dict:
+    fresh = _unseen_results(state, raw_results)
+    logger.info(f"  Found {len(raw_results)} raw results ({len(fresh)} new)")
     return {
-        "queries": res.queries,
-        "current_turn": current_turn
+        "raw_search_results": fresh,
+        "spent_credits": len(state.get("queries", [])) * SEARCH_CREDITS
     }
 
-def search_node(state: ResearchState):
+def search_node(state: ResearchState, config: RunnableConfig = None):
     logger.info("→ search_web")
     queries = state.get("queries", [])
     logger.debug(f"  Searching for {len(queries)} queries")
 
-    raw_results = perform_search(queries)
+    raw_results = perform_search(queries, use_cache=_tavily_cache(config))
 
-    logger.info(f"  Found {len(raw_results)} raw results")
-    return {
-        "raw_search_results": raw_results
-    }
+    return _search_update(state, raw_results)
 
-def curate_node(state: ResearchState, config: RunnableConfig = None):
-    logger.info("→ curate_urls")
+async def asearch_node(state: ResearchState, config: RunnableConfig = None):
+    logger.info("→ search_web")
+    queries = state.get("queries", [])
+    logger.debug(f"  Searching for {len(queries)} queries")
 
-    brief = state["story_brief"]
-    raw = state.get("raw_search_results", [])
+    raw_results = await aperform_search(queries, use_cache=_tavily_cache(config))
 
-    if not raw:
-        logger.warning("  No raw results to curate")
-        return {"urls_to_extract": []}
+    return _search_update(state, raw_results)
 
+def _curate_messages(state: ResearchState) -> list:
+    brief = state["story_brief"]
+    raw = state.get("raw_search_results", [])
     logger.debug(f"  Curating from {len(raw)} raw results")
 
     # Format snippets for LLM
@@ -189,129 +574,436 @@ def curate_node(state: ResearchState, config: RunnableConfig = None):
         # r is a dictionary representing one search result from Tavily e.g., {'url': '...', 'title': '...', 'content': '...'}).
         results_str += f"- URL: {r.get('url')}\n  Title: {r.get('title')}\n  Snippet: {r.get('content')}\n\n"
 
-    # Handle configuration
-    configuration = config.get("configurable", {}) if config else {}
-    model = configuration.get("model", default_model)
-
     system_msg = curate_sources_prompt.format(
         story_brief=brief.model_dump_json(indent=2),
         results_str=results_str
     )
+    return [SystemMessage(content=system_msg)]
+
+def _selection_update(state: ResearchState, selection: UrlSelection) -> dict:
+    # The model can still pick a page read in an earlier turn, or two variants of one URL
+    seen = set(state.get("seen_urls", []))
+    urls = []
+    for url in selection.urls:
+        normalized = normalize_url(url)
+        if normalized not in seen:
+            seen.add(normalized)
+            urls.append(url)
+
+    logger.info(f"  Selected {len(urls)} URLs for extraction")
+    logger.debug(f"  Reasoning: {selection.reasoning}")
 
-    structured_model = model.with_structured_output(UrlSelection)
-    selection = structured_model.invoke([SystemMessage(content=system_msg)])
+    return {
+        "urls_to_extract": urls
+    }
 
-    logger.info(f"  Selected {len(selection.urls)} URLs for extraction")
-    logger.debug(f"  Reasoning: {selection.reasoning}")
+def curate_node(state: ResearchState, config: RunnableConfig = None):
+    logger.info("→ curate_urls")
+
+    if not state.get("raw_search_results"):
+        logger.warning("  No raw results to curate")
+        return {"urls_to_extract": []}
+
+    messages = _curate_messages(state)
+    selection = invoke_structured(_get_model(config), UrlSelection, messages, config)
+
+    return {**_selection_update(state, selection), "spent_tokens": _llm_tokens(messages, selection)}
 
+async def acurate_node(state: ResearchState, config: RunnableConfig = None):
+    logger.info("→ curate_urls")
+
+    if not state.get("raw_search_results"):
+        logger.warning("  No raw results to curate")
+        return {"urls_to_extract": []}
+
+    messages = _curate_messages(state)
+    selection = await ainvoke_structured(_get_model(config), UrlSelection, messages, config)
+
+    return {**_selection_update(state, selection), "spent_tokens": _llm_tokens(messages, selection)}
+
+def _extract_token_budget(config: RunnableConfig = None) -> int:
+    configuration = config.get("configurable", {}) if config else {}
+    return configuration.get("extract_token_budget", EXTRACT_TOKEN_BUDGET)
+
+def _extract_update(urls: List[str], extracted_data: List[dict]) -> dict:
+    logger.info(f"  Extracted {len(extracted_data)}/{len(urls)} pages")
     return {
-        "urls_to_extract": selection.urls
+        "extracted_pages": extracted_data,
+        "seen_urls": [normalize_url(url) for url in urls],
+        "spent_credits": math.ceil(len(urls) / EXTRACT_URLS_PER_CREDIT)
     }
 
-def extract_analyze_node(state: ResearchState, config: RunnableConfig = None):
-    logger.info("→ extract_analyze")
+def extract_pages_node(state: ResearchState, config: RunnableConfig = None):
+    """Fetch the curated URLs in one Tavily call (extract is billed per 5 URLs)."""
+    logger.info("→ extract_pages")
+
+    _start_speculation(state, config)
 
-    brief = state["story_brief"]
     urls = state.get("urls_to_extract", [])
+    logger.debug(f"  Extracting content from {len(urls)} URLs")
+    extracted_data = perform_extract(urls, use_cache=_tavily_cache(config))
+    index_pages(extracted_data, state["story_brief"].slug, use_index=_research_index(config))
+
+    return _extract_update(urls, extracted_data)
+
+async def aextract_pages_node(state: ResearchState, config: RunnableConfig = None):
+    logger.info("→ extract_pages")
+
+    _astart_speculation(state, config)
 
+    urls = state.get("urls_to_extract", [])
     logger.debug(f"  Extracting content from {len(urls)} URLs")
-    extracted_data = perform_extract(urls)
+    extracted_data = await aperform_extract(urls, use_cache=_tavily_cache(config))
+    await asyncio.to_thread(index_pages, extracted_data, state["story_brief"].slug, _research_index(config))
 
-    # Format for analysis
-    content_str = ""
-    for data in extracted_data:
-        # data is dictionary representing one search result from Tavily e.g., {'url': '...', 'title': '...', 'content': '...'}).
-        raw_content = data.get('raw_content', '')
-        # Truncate massive pages to avoid token limits
-        content_str += f"--- SOURCE: {data.get('url')} ---\n{raw_content[:10000]}\n\n"
+    return _extract_update(urls, extracted_data)
 
-    # Handle configuration
-    configuration = config.get("configurable", {}) if config else {}
-    model = configuration.get("model", default_model)
+def route_sources(state: ResearchState, config: RunnableConfig = None):
+    """Fan out one analyze_source task per extracted page, with the page's chunks of the turn's evidence.
+
+    The evidence is selected once across all the pages, so the turn's token budget goes to
+    the most relevant chunks wherever they are: a short page leaves its share to the others.
+    """
+    pages = state.get("extracted_pages", [])
+    brief = state["story_brief"]
 
-    system_msg = extract_analyze_prompt.format(
+    # Pages are Tavily extract results, e.g. {'url': '...', 'raw_content': '...'}.
+    # Keep the passages most relevant to the brief instead of each page's first N characters.
+    query = " ".join([brief.topic, brief.angle, *brief.key_questions])
+    evidence = select_evidence(pages, query, _extract_token_budget(config)) if pages else []
+    by_url = {}
+    for chunk in evidence:
+        by_url.setdefault(chunk["url"], []).append(chunk)
+    if not by_url:
+        return "merge_findings"
+    if len(by_url) < len(pages):
+        logger.info(f"  Not analyzing {len(pages) - len(by_url)} pages without evidence in the budget")
+
+    return [
+        Send("analyze_source", {
+            "story_brief": brief,
+            "url": url,
+            "evidence": chunks,
+            "current_turn": state["current_turn"]
+        })
+        for url, chunks in by_url.items()
+    ]
+
+def _analyze_source_messages(state: SourceState) -> list:
+    brief = state["story_brief"]
+    content_str = format_evidence(state["evidence"])
+
+    system_msg = analyze_source_prompt.format(
         story_brief=brief.model_dump_json(indent=2),
         content_str=content_str
     )
+    return [SystemMessage(content=system_msg)]
+
+def _source_update(state: SourceState, analysis: Optional[SourceAnalysis], tokens: int = 0) -> dict:
+    url = state["url"]
+    items = analysis.new_items if analysis else []
+    logger.info(f"  {url}: {len(items)} items")
+
+    return {
+        **_items_update(state["story_brief"], items),
+        "source_findings": [{
+            "turn": state["current_turn"],
+            "url": url,
+            "summary": analysis.summary if analysis else "Analysis failed.",
+            "items": len(items)
+        }],
+        "spent_tokens": tokens
+    }
+
+def analyze_source_node(state: SourceState, config: RunnableConfig = None):
+    """Extract facts and quotes from one page. A failure only loses this page."""
+    logger.info("→ analyze_source")
+
+    messages = _analyze_source_messages(state)
+    try:
+        analysis = invoke_structured(_get_model(config), SourceAnalysis, messages, config)
+    except Exception as e:
+        logger.warning(f"  Analysis failed for {state['url']}: {e}")
+        return _source_update(state, None)
+
+    ResearchLog(state["story_brief"].slug).append_items(state["current_turn"], analysis.new_items)
+    return _source_update(state, analysis, _llm_tokens(messages, analysis))
+
+async def aanalyze_source_node(state: SourceState, config: RunnableConfig = None):
+    logger.info("→ analyze_source")
+
+    messages = _analyze_source_messages(state)
+    try:
+        analysis = await ainvoke_structured(_get_model(config), SourceAnalysis, messages, config)
+    except Exception as e:
+        logger.warning(f"  Analysis failed for {state['url']}: {e}")
+        return _source_update(state, None)
+
+    await asyncio.to_thread(ResearchLog(state["story_brief"].slug).append_items, state["current_turn"], analysis.new_items)
+    return _source_update(state, analysis, _llm_tokens(messages, analysis))
+
+def _turn_findings(state: ResearchState) -> List[dict]:
+    return [f for f in state.get("source_findings", []) if f["turn"] == state["current_turn"]]
+
+def _turn_stats(state: ResearchState) -> dict:
+    """Running totals after this turn, plus what the turn added to them."""
+    totals = {
+        "sources": len(set(state.get("item_sources", []))),
+        "items": state.get("item_count", 0),
+        "questions": len(set(state.get("covered_questions", [])))
+    }
+    previous = state.get("turn_stats") or [{}]
+    stats = {"turn": state["current_turn"], **totals}
+    for key, total in totals.items():
+        stats[f"new_{key}"] = total - previous[-1].get(key, 0)
 
-    structured_model = model.with_structured_output(ExtractedInfo)
-    analysis = structured_model.invoke([SystemMessage(content=system_msg)])
+    logger.info(f"  Turn yield: {stats['new_sources']} new sources, {stats['new_items']} new items, "
+                f"{stats['questions']}/{len(state['story_brief'].key_questions)} key questions covered")
+    return stats
 
-    logger.info(f"  Extracted {len(analysis.new_items)} new items")
-    logger.info(f"  Research complete: {analysis.is_complete}")
-    logger.debug(f"  Summary: {analysis.summary_of_findings}")
+def _no_sources_update(state: ResearchState) -> dict:
+    logger.warning("  No new sources this turn")
+    update_msg = f"Turn {state['current_turn']} Findings: No new sources found; try different angles."
+    return {"context": [AIMessage(content=update_msg)], "extracted_pages": [], "turn_stats": [_turn_stats(state)]}
+
+def _merge_findings_messages(state: ResearchState, findings: List[dict]) -> list:
+    context_msgs = state.get("context", [])
+    context_str = "\n".join([m.content for m in context_msgs[-5:]])
+    turn_str = "\n".join(f"- {f['url']} ({f['items']} items): {f['summary']}" for f in findings)
+    source_count = len(set(state.get("item_sources", [])))
+
+    system_msg = merge_findings_prompt.format(
+        story_brief=state["story_brief"].model_dump_json(indent=2),
+        context_str=context_str or "No research done yet.",
+        turn_str=turn_str,
+        source_count=source_count
+    )
+    return [SystemMessage(content=system_msg)]
+
+def _merge_update(state: ResearchState, findings: List[dict], check: CompletenessCheck) -> dict:
+    logger.info(f"  Extracted {sum(f['items'] for f in findings)} new items from {len(findings)} sources")
+    logger.info(f"  Research complete: {check.is_complete}")
+    logger.debug(f"  Summary: {check.summary_of_findings}")
 
     # Add context history so next query generations knows what we found
-    update_msg = f"Turn {state['current_turn']} Findings: {analysis.summary_of_findings}"
+    update_msg = f"Turn {state['current_turn']} Findings: {check.summary_of_findings}"
 
     return {
-        "search_results": analysis.new_items,
-        "is_complete": analysis.is_complete,
+        "is_complete": check.is_complete,
         "context": [AIMessage(content=update_msg)],
-        "is_research_complete": analysis.is_complete # Sync with state schema
+        "extracted_pages": [],  # Page text isn't needed past this turn
+        "turn_stats": [_turn_stats(state)],
+        "is_research_complete": check.is_complete # Sync with state schema
     }
 
-def finalize_research_node(state: ResearchState):
-    """Deduplicate and wrap in ResearchPackage."""
-    logger.info("→ finalize_research")
+def _turn_record(state: ResearchState, update: dict) -> dict:
+    """What resume_research needs to continue after this turn."""
+    return {
+        "turn": state["current_turn"],
+        "context": update["context"][0].content,
+        "stats": update["turn_stats"][0],
+        "is_complete": update.get("is_complete", False),
+        "seen_urls": state.get("seen_urls", []),
+        "seen_queries": state.get("seen_queries", []),
+        "spent_tokens": state.get("spent_tokens", 0) + update.get("spent_tokens", 0),
+        "spent_credits": state.get("spent_credits", 0)
+    }
 
-    raw = state.get("search_results", [])
-    logger.debug(f"  Processing {len(raw)} raw search results")
+def _merge(state: ResearchState, config: RunnableConfig = None) -> dict:
+    findings = _turn_findings(state)
+    if not findings:
+        return _no_sources_update(state)
+
+    messages = _merge_findings_messages(state, findings)
+    check = invoke_structured(_get_model(config), CompletenessCheck, messages, config)
+
+    return {**_merge_update(state, findings, check), "spent_tokens": _llm_tokens(messages, check)}
+
+async def _amerge(state: ResearchState, config: RunnableConfig = None) -> dict:
+    findings = _turn_findings(state)
+    if not findings:
+        return _no_sources_update(state)
+
+    messages = _merge_findings_messages(state, findings)
+    check = await ainvoke_structured(_get_model(config), CompletenessCheck, messages, config)
+
+    return {**_merge_update(state, findings, check), "spent_tokens": _llm_tokens(messages, check)}
+
+def merge_findings_node(state: ResearchState, config: RunnableConfig = None):
+    """Decide from the per-source summaries whether research is complete, and log the turn as done."""
+    logger.info("→ merge_findings")
+
+    update = _join_speculation(state, _merge(state, config))
+    ResearchLog(state["story_brief"].slug).complete_turn(_turn_record(state, update))
+
+    return update
+
+async def amerge_findings_node(state: ResearchState, config: RunnableConfig = None):
+    logger.info("→ merge_findings")
+
+    update = await _ajoin_speculation(state, await _amerge(state, config))
+    await asyncio.to_thread(ResearchLog(state["story_brief"].slug).complete_turn, _turn_record(state, update))
+
+    return update
+
+def _paragraph_key(paragraph: str) -> bytes:
+    """Hash of a paragraph that ignores case, punctuation and spacing."""
+    text = re.sub(r"\W+", " ", paragraph.lower()).strip()
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+def _build_research_package(results: Iterable[SearchResult]) -> ResearchPackage:
+    """Merge search results by canonical source URL into a ResearchPackage.
+
+    One pass over the results: each source collects its paragraphs in a list
+    (joined once at the end), and paragraphs already seen for that source are
+    dropped by hash. Sources keep their first spelling, minus tracking parameters,
+    and their first relevance note.
+    """
+    merged = {}
+    count = dropped = 0
+
+    for r in results:
+        count += 1
+        entry = merged.get(normalize_url(r.source))
+        if entry is None:
+            entry = merged[normalize_url(r.source)] = {"result": r, "paragraphs": [], "hashes": set()}
+        for paragraph in re.split(r"\n\s*\n", r.content):
+            paragraph = paragraph.strip()
+            if not paragraph:
+                continue
+            key = _paragraph_key(paragraph)
+            if key in entry["hashes"]:
+                dropped += 1
+                continue
+            entry["hashes"].add(key)
+            entry["paragraphs"].append(paragraph)
+
+    final_list = [
+        SearchResult(source=clean_url(e["result"].source), content="\n\n".join(e["paragraphs"]), relevance=e["result"].relevance)
+        for e in merged.values()
+    ]
+    logger.debug(f"  Processed {count} logged search results, dropped {dropped} repeated paragraphs")
+    logger.info(f"  Finalized research package with {len(final_list)} unique sources")
 
-    merged_map = {}
+    return ResearchPackage(results=final_list)
 
-    for r in raw:
-        if r.source not in merged_map:
-            merged_map[r.source] = SearchResult(source=r.source, content=r.content, relevance=r.relevance)
-        else:
-            merged_map[r.source].content += "\n\n" + r.content
+def _logged_package(state: ResearchState) -> ResearchPackage:
+    """Build the package in one pass over the research log."""
+    log = ResearchLog(state["story_brief"].slug)
+    return _build_research_package(log.iter_items(state.get("current_turn", 0)))
 
-    final_list = list(merged_map.values())
+def finalize_research_node(state: ResearchState):
+    """Deduplicate and wrap in ResearchPackage."""
+    logger.info("→ finalize_research")
 
-    package = ResearchPackage(results=final_list)
+    package = _logged_package(state)
 
     # Save artifact
     brief = state.get("story_brief")
     package.save(brief.slug)
+    ResearchLog(brief.slug).finalize()
 
-    logger.info(f"  Finalized research package with {len(final_list)} unique sources")
+    return {"research_package": package}
+
+async def afinalize_research_node(state: ResearchState):
+    """Async version of finalize_research_node."""
+    logger.info("→ finalize_research")
+
+    package = await asyncio.to_thread(_logged_package, state)
+
+    brief = state.get("story_brief")
+    await package.asave(brief.slug)
+    await asyncio.to_thread(ResearchLog(brief.slug).finalize)
 
     return {"research_package": package}
 
-def check_loop(state: ResearchState) -> Literal["generate_queries", "finalize_research"]:
+def _stop_reason(state: ResearchState, budget: ResearchBudget) -> Optional[str]:
+    """Why research should end now, or None to keep going."""
+    current_turn = state.get("current_turn", 0)
+    if state.get("is_complete") or state.get("is_research_complete"):
+        return "complete"
+    if current_turn >= budget.max_turns:
+        return f"max turns ({budget.max_turns})"
+    if state.get("spent_tokens", 0) >= budget.max_tokens:
+        return f"token budget ({state['spent_tokens']}/{budget.max_tokens})"
+    if state.get("spent_credits", 0) >= budget.max_credits:
+        return f"credit budget ({state['spent_credits']}/{budget.max_credits})"
+    if state.get("started_at") and time.time() - state["started_at"] >= budget.max_seconds:
+        return f"time budget ({budget.max_seconds:.0f}s)"
+
+    last = (state.get("turn_stats") or [None])[-1]
+    if last and current_turn >= budget.min_turns and (
+        last["new_sources"] < budget.min_new_sources
+        and last["new_items"] < budget.min_new_items
+        and last["new_questions"] <= 0
+    ):
+        return f"low yield ({last['new_sources']} new sources, {last['new_items']} new items)"
+    return None
+
+def check_loop(state: ResearchState, config: RunnableConfig = None) -> Literal["generate_queries", "finalize_research"]:
     """Decide if we should continue checking or stop."""
     current_turn = state.get("current_turn", 0)
-    max_turns = state.get("max_turns", DEFAULT_MAX_TURNS)
-    is_complete = state.get("is_complete") or state.get("is_research_complete")
+    budget = _research_budget(state, config)
+    reason = _stop_reason(state, budget)
 
-    if is_complete or current_turn >= max_turns:
-        reason = "complete" if is_complete else f"max turns ({max_turns})"
+    if reason:
         logger.info(f"→ check_loop: Ending research ({reason})")
+        if state.get("next_queries"):
+            logger.info(f"  Discarding {len(state['next_queries'])} speculated queries")
         return "finalize_research" # GO TO FINALIZER
 
-    logger.info(f"→ check_loop: Continuing research (turn {current_turn}/{max_turns})")
+    logger.info(f"→ check_loop: Continuing research (turn {current_turn}/{budget.max_turns})")
     return "generate_queries"
 
 
 def build_research_assistant_graph():
+    """Build the research loop. Each node has a sync and async implementation,
+    so the compiled graph supports both invoke/stream and ainvoke/astream.
+
+    resume_research first restores an interrupted run from artifacts/<slug>/research/.
+    Otherwise, before the first turn, search_local looks up the local index of past research.
+    Its hits are analyzed as turn 0 (analyze_source → merge_findings → check_loop),
+    so a topic earlier stories covered well may not need the web at all.
+
+    The `research_mode` config option picks the turn layout:
+
+    sequential (default):
+    generate_queries → search_web → curate_urls → extract_pages → analyze_source (per page) → merge_findings → check_loop
+
+    pipelined, the next turn's queries are planned while pages are extracted and analyzed:
+    generate_queries → search_web → curate_urls → extract_pages → analyze_source (per page) → merge_findings → check_loop
+                                                  └─────────── speculate_queries ───────────┘
+    extract_pages starts the speculative query generation in the background, outside the graph's
+    steps, and merge_findings joins it, so a slow speculative call never holds up extraction or analysis.
+    """
     builder = StateGraph(ResearchState)
 
     # Add Nodes
-    builder.add_node("generate_queries", generate_queries_node)
-    builder.add_node("search_web", search_node)
-    builder.add_node("curate_urls", curate_node)
-    builder.add_node("extract_analyze", extract_analyze_node)
-    builder.add_node("finalize_research", finalize_research_node) 
+    builder.add_node("resume_research", RunnableLambda(resume_research_node, afunc=aresume_research_node))
+    builder.add_node("search_local", RunnableLambda(search_local_node, afunc=asearch_local_node))
+    builder.add_node("generate_queries", RunnableLambda(generate_queries_node, afunc=agenerate_queries_node))
+    builder.add_node("search_web", RunnableLambda(search_node, afunc=asearch_node))
+    builder.add_node("curate_urls", RunnableLambda(curate_node, afunc=acurate_node))
+    builder.add_node("extract_pages", RunnableLambda(extract_pages_node, afunc=aextract_pages_node))
+    builder.add_node("analyze_source", RunnableLambda(analyze_source_node, afunc=aanalyze_source_node), input_schema=SourceState)
+    builder.add_node("merge_findings", RunnableLambda(merge_findings_node, afunc=amerge_findings_node))
+    builder.add_node("finalize_research", RunnableLambda(finalize_research_node, afunc=afinalize_research_node))
 
     # Add Edges
-    builder.add_edge(START, "generate_queries")
+    builder.add_edge(START, "resume_research")
+    builder.add_conditional_edges("resume_research", route_resume, ["search_local", "generate_queries", "finalize_research"])
+    builder.add_conditional_edges("search_local", route_local, ["analyze_source", "merge_findings", "generate_queries"])
     builder.add_edge("generate_queries", "search_web")
     builder.add_edge("search_web", "curate_urls")
-    builder.add_edge("curate_urls", "extract_analyze")
+    builder.add_edge("curate_urls", "extract_pages")
+
+    # Map: one analysis per page, Reduce: one completeness check
+    builder.add_conditional_edges("extract_pages", route_sources, ["analyze_source", "merge_findings"])
+    builder.add_edge("analyze_source", "merge_findings")
 
     # Conditional Edge
     builder.add_conditional_edges(
-        "extract_analyze", 
+        "merge_findings", 
         check_loop,
         ["generate_queries", "finalize_research"] 
     )
@@ -319,7 +1011,7 @@ def build_research_assistant_graph():
     # Final Edge
     builder.add_edge("finalize_research", END)
 
-    return builder.compile()
+    return builder.compile().with_config(recursion_limit=RECURSION_LIMIT)
 
 
 if __name__ == "__main__":
@@ -332,7 +1024,9 @@ if __name__ == "__main__":
 
         parser = argparse.ArgumentParser(description="Research Assistant Agent")
         parser.add_argument("slug", help="The article slug")
-        parser.add_argument("--turns", type=int, default=DEFAULT_MAX_TURNS, help="Max research turns")
+        parser.add_argument("--turns", type=int, help="Max research turns (default: from the article type's budget)")
+        parser.add_argument("--no-cache", action="store_true", help="Bypass the on-disk Tavily result cache")
+        parser.add_argument("--pipelined", action="store_true", help="Plan the next turn's queries while pages are extracted")
         args = parser.parse_args()
 
         slug = args.slug
@@ -356,14 +1050,17 @@ if __name__ == "__main__":
             "story_brief": story_brief,
             "max_turns": args.turns,
             "current_turn": 0,
-            "context": [],
-            "search_results": []
+            "context": []
         }
 
-        logger.info(f"Starting research workflow (max_turns={args.turns})")
+        logger.info(f"Starting research workflow (max_turns={args.turns or 'budget'})")
 
         # Increase recursion limit to support many turns
-        config = {"recursion_limit": 100}
+        config = {"recursion_limit": RECURSION_LIMIT, "configurable": {}}
+        if args.no_cache:
+            config["configurable"]["tavily_cache"] = False
+        if args.pipelined:
+            config["configurable"]["research_mode"] = "pipelined"
         result = graph.invoke(initial_state, config=config)
 
         # Save package
@@ -0,0 +1,5 @@
+"""Offline benchmarks for the newsroom workflow."""
+
+from agentic_newsroom.benchmarks.fakes import FakeChatModel, offline_clients, offline_models
+
+__all__ = ["FakeChatModel", "offline_clients", "offline_models"]
@@ -0,0 +1,350 @@
+"""
+Offline stand-ins for the LLM, Tavily and the image API.
+
+FakeChatModel answers every structured-output call with a canned but valid
+instance of the requested schema after a simulated latency, so the full
+workflow runs without network access or API keys. Token usage is estimated
+from message sizes and reported like a real model's, so run metrics still work.
+
+offline_clients() swaps the Tavily and OpenAI image clients for local fakes
+for the duration of a `with` block, and offline_models() does the same for the
+smart and mini chat models.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import Any, Iterator, AsyncIterator, List, Optional
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.runnables import RunnableLambda
+from pydantic import PrivateAttr
+
+from agentic_newsroom.agents import assignment_editor, copy_editor, editor_in_chief, graphic_desk, reporter, research_assistant
+from agentic_newsroom.tools import tavily_search
+
+# Smallest valid PNG (1x1 transparent pixel)
+FAKE_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
+)
+
+FAKE_PARAGRAPH = (
+    "The dragon blood trees of Socotra grow nowhere else on Earth. Their umbrella crowns "
+    "shade the soil beneath them, and their red resin has been traded for two thousand years."
+)
+
+# Providers only cache prompt prefixes from this length on (OpenAI: 1024 tokens)
+PROMPT_CACHE_MIN_TOKENS = 1024
+
+# Characters per streamed chunk when the model is streamed
+STREAM_CHUNK_CHARS = 16
+
+FAKE_IMAGE_PROMPT = "A realistic photograph of a benchmark subject, wide shot, natural light."
+
+# Article types the fake assignment editor can assign (see prompts.common.article_types)
+ARTICLE_TYPES = ("Web Daily", "Full Feature")
+
+RUBRIC = {"accuracy": 3, "attribution": 3, "completeness": 3, "compliance": 3, "structure": 3, "voice": 3}
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:10]
+
+
+def _estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token)."""
+    return max(1, len(text) // 4)
+
+
+def _draft(paragraphs: int = 8) -> str:
+    sections = [f"## Section {i}\n\n{FAKE_PARAGRAPH}" for i in range(1, paragraphs + 1)]
+    return "\n\n".join(sections)
+
+
+def _canned(schema_name: str, prompt: str, article_type: str = "Web Daily") -> dict:
+    """Canned output for a schema, derived deterministically from the prompt."""
+    key = _digest(prompt)
+    urls = re.findall(r"URL: (\S+)", prompt)
+
+    if schema_name == "StoryBrief":
+        return {
+            "topic": f"Benchmark topic {key}",
+            "angle": "How a benchmark article comes together",
+            "category": "Science",
+            "article_type": article_type,
+            "key_questions": ["What is it?", "Why does it matter?", "What happens next?"],
+            "slug": f"bench-{key}",
+            "people_in_graphics": "Do not include any people in the hero image.",
+        }
+    if schema_name == "Queries":
+        return {"queries": [f"benchmark {aspect} {key}" for aspect in ("history", "science", "people")]}
+    if schema_name == "UrlSelection":
+        return {"urls": urls[:3], "reasoning": "Most relevant results"}
+    if schema_name == "SourceAnalysis":
+        items = [{"source": f"https://example.com/{key}/{i}", "content": FAKE_PARAGRAPH, "relevance": "On topic"} for i in range(3)]
+        return {"new_items": items, "summary": "Background and one quote"}
+    if schema_name == "CompletenessCheck":
+        return {"is_complete": False, "summary_of_findings": "Partial coverage so far"}
+    if schema_name == "DraftPackage":
+        return {"full_draft": _draft(), "sources": ["https://example.com/source"], "sources_section": "Sources: example.com."}
+    if schema_name == "DraftOutline":
+        sections = [{"heading": f"Section {i}", "purpose": "One aspect of the story", "research_items": [i], "target_words": 300}
+                    for i in range(1, 6)]
+        return {"sections": sections}
+    if schema_name == "DraftSection":
+        return {"text": f"{FAKE_PARAGRAPH}\n\n{FAKE_PARAGRAPH}", "sources": ["https://example.com/source"]}
+    if schema_name == "StitchEdits":
+        return {"openings": [{"section": 2, "paragraph": FAKE_PARAGRAPH}], "sources_section": "Sources: example.com."}
+    if schema_name in ("FactReview", "StyleReview"):
+        return {"issues": ["Paragraph 2: tighten the wording"], "rubric": RUBRIC}
+    if schema_name == "AnchoredReview":
+        return {"issues": [{"paragraph": 2, "issue": "Tighten the wording"}], "rubric": RUBRIC}
+    if schema_name == "RevisedParagraph":
+        return {"paragraph": FAKE_PARAGRAPH}
+    if schema_name == "RevisedDraft":
+        return {"full_draft": _draft()}
+    if schema_name == "FinalArticle":
+        return {"title": f"Benchmark Article {key}", "subtitle": "A fake article", "article": _draft()}
+    if schema_name == "PublicationApproval":
+        return {"approved": True, "notes": []}
+    raise ValueError(f"FakeChatModel has no canned output for schema '{schema_name}'")
+
+
+def _prompt_text(messages: Any) -> str:
+    if isinstance(messages, str):
+        return messages
+    return "\n".join(str(m.content) for m in messages if isinstance(m, BaseMessage))
+
+
+class FakeChatModel(BaseChatModel):
+    """Chat model returning canned outputs after a simulated latency.
+
+    Prompt caching is simulated too: a call whose leading messages match an
+    earlier call's, over at least PROMPT_CACHE_MIN_TOKENS tokens, reports them
+    as cached input tokens, like a provider with automatic prefix caching.
+    Each instance has its own cache, as each provider model does, so use one
+    instance per model (see offline_models) to see the hits a real run gets.
+
+    Structured-output calls answer with the canned output as JSON text, so when
+    the model is streamed (e.g. with LangGraph's "messages" stream mode) the
+    chunks look like a real model's structured output arriving token by token.
+
+    Args:
+        latency: Seconds each call takes.
+        jitter: Extra random latency, uniform in [0, jitter] seconds.
+        seed: Seed for the jitter, so runs are repeatable.
+        article_type: Article type of the story briefs, one of ARTICLE_TYPES.
+    """
+
+    model_name: str = "fake-model"
+    latency: float = 0.0
+    jitter: float = 0.0
+    seed: int = 0
+    article_type: str = "Web Daily"
+    _rng: random.Random = PrivateAttr(default=None)
+    _prefixes: set = PrivateAttr(default_factory=set)
+    _prefixes_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def model_post_init(self, __context: Any):
+        self._rng = random.Random(self.seed)
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake"
+
+    def _delay(self) -> float:
+        return self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+
+    def _cached_tokens(self, messages: List[BaseMessage]) -> int:
+        """Tokens of the longest leading run of messages already sent in an earlier call."""
+        digest = hashlib.sha256()
+        prefixes, tokens = [], 0
+        for message in messages:
+            digest.update(f"{message.type}\0{message.content}\0".encode("utf-8"))
+            tokens += _estimate_tokens(str(message.content))
+            prefixes.append((digest.hexdigest(), tokens))
+
+        with self._prefixes_lock:
+            cached = max((n for key, n in prefixes if key in self._prefixes), default=0)
+            self._prefixes.update(key for key, _ in prefixes)
+        return cached if cached >= PROMPT_CACHE_MIN_TOKENS else 0
+
+    def _usage(self, messages: List[BaseMessage], content: str) -> dict:
+        prompt = _prompt_text(messages)
+        return {
+            "input_tokens": _estimate_tokens(prompt),
+            "output_tokens": _estimate_tokens(content),
+            "total_tokens": _estimate_tokens(prompt) + _estimate_tokens(content),
+            "input_token_details": {"cache_read": self._cached_tokens(messages)},
+        }
+
+    def _result(self, messages: List[BaseMessage], content: str) -> ChatResult:
+        usage = self._usage(messages, content)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=content, usage_metadata=usage))])
+
+    def _chunks(self, messages: List[BaseMessage], content: str) -> List[ChatGenerationChunk]:
+        pieces = [content[i:i + STREAM_CHUNK_CHARS] for i in range(0, len(content), STREAM_CHUNK_CHARS)] or [""]
+        chunks = [ChatGenerationChunk(message=AIMessageChunk(content=piece)) for piece in pieces]
+        # Usage arrives with the last chunk, as with OpenAI's stream_options
+        chunks[-1] = ChatGenerationChunk(message=AIMessageChunk(content=pieces[-1], usage_metadata=self._usage(messages, content)))
+        return chunks
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager=None,
+                  content: str = FAKE_IMAGE_PROMPT, **kwargs) -> ChatResult:
+        time.sleep(self._delay())
+        return self._result(messages, content)
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager=None,
+                         content: str = FAKE_IMAGE_PROMPT, **kwargs) -> ChatResult:
+        await asyncio.sleep(self._delay())
+        return self._result(messages, content)
+
+    def _stream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager=None,
+                content: str = FAKE_IMAGE_PROMPT, **kwargs) -> Iterator[ChatGenerationChunk]:
+        chunks = self._chunks(messages, content)
+        for chunk in chunks:
+            time.sleep(self._delay() / len(chunks))
+            if run_manager:
+                run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None, run_manager=None,
+                       content: str = FAKE_IMAGE_PROMPT, **kwargs) -> AsyncIterator[ChatGenerationChunk]:
+        chunks = self._chunks(messages, content)
+        for chunk in chunks:
+            await asyncio.sleep(self._delay() / len(chunks))
+            if run_manager:
+                await run_manager.on_llm_new_token(chunk.text, chunk=chunk)
+            yield chunk
+
+    def with_structured_output(self, schema, **kwargs):
+        # Go through invoke/ainvoke so callbacks see a normal chat model run
+        def parse(messages):
+            canned = _canned(schema.__name__, _prompt_text(messages), self.article_type)
+            self.invoke(messages, content=json.dumps(canned))
+            return schema.model_validate(canned)
+
+        async def aparse(messages):
+            canned = _canned(schema.__name__, _prompt_text(messages), self.article_type)
+            await self.ainvoke(messages, content=json.dumps(canned))
+            return schema.model_validate(canned)
+
+        return RunnableLambda(parse, afunc=aparse)
+
+
+class FakeTavilyClient:
+    """Local TavilyClient stand-in with deterministic results."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+
+    def _search(self, query: str) -> dict:
+        key = _digest(query)
+        results = [
+            {"url": f"https://example.com/{key}/{i}", "title": f"Result {i} for {query}", "content": FAKE_PARAGRAPH}
+            for i in range(tavily_search.MAX_RESULTS)
+        ]
+        return {"results": results, "usage": {"credits": tavily_search.SEARCH_CREDITS}}
+
+    def _extract(self, urls: List[str]) -> dict:
+        results = [{"url": url, "raw_content": (FAKE_PARAGRAPH + "\n\n") * 40} for url in urls]
+        return {"results": results, "usage": {"credits": -(-len(urls) // tavily_search.EXTRACT_URLS_PER_CREDIT)}}
+
+    def search(self, query: str, **kwargs) -> dict:
+        time.sleep(self.latency)
+        return self._search(query)
+
+    def extract(self, urls: List[str], **kwargs) -> dict:
+        time.sleep(self.latency)
+        return self._extract(urls)
+
+
+class FakeAsyncTavilyClient(FakeTavilyClient):
+    """Local AsyncTavilyClient stand-in."""
+
+    async def search(self, query: str, **kwargs) -> dict:
+        await asyncio.sleep(self.latency)
+        return self._search(query)
+
+    async def extract(self, urls: List[str], **kwargs) -> dict:
+        await asyncio.sleep(self.latency)
+        return self._extract(urls)
+
+
+def _image_response():
+    return SimpleNamespace(data=[SimpleNamespace(b64_json=base64.b64encode(FAKE_PNG).decode("ascii"))])
+
+
+class FakeImageClient:
+    """Stand-in for the OpenAI client's `images.generate`."""
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.images = self
+
+    def generate(self, **kwargs):
+        time.sleep(self.latency)
+        return _image_response()
+
+
+class FakeAsyncImageClient(FakeImageClient):
+    """Stand-in for the AsyncOpenAI client's `images.generate`."""
+
+    async def generate(self, **kwargs):
+        await asyncio.sleep(self.latency)
+        return _image_response()
+
+
+@contextmanager
+def _patched(patches: dict):
+    """Set (module, name) -> value for the duration of the block."""
+    originals = {target: getattr(*target) for target in patches}
+    for (module, name), fake in patches.items():
+        setattr(module, name, fake)
+    try:
+        yield
+    finally:
+        for (module, name), original in originals.items():
+            setattr(module, name, original)
+
+
+@contextmanager
+def offline_clients(latency: float = 0.0):
+    """Route Tavily and image API calls to local fakes inside the block.
+
+    Pass `tavily_cache: False` and `research_index: False` in the run config
+    as well, otherwise cached results and past research from real runs are
+    served instead of the fakes (and fake pages end up in the local index).
+    """
+    with _patched({
+        (tavily_search, "get_tavily_client"): lambda: FakeTavilyClient(latency),
+        (tavily_search, "get_async_tavily_client"): lambda: FakeAsyncTavilyClient(latency),
+        (graphic_desk, "get_openai_client"): lambda: FakeImageClient(latency),
+        (graphic_desk, "get_async_openai_client"): lambda: FakeAsyncImageClient(latency),
+    }):
+        yield
+
+
+@contextmanager
+def offline_models(smart: BaseChatModel, mini: BaseChatModel):
+    """Serve get_smart_model() and get_mini_model() from the given models inside the block.
+
+    Unlike the `model` config option, which sends every call to one model,
+    each node keeps the model tier it uses in production.
+    """
+    factories = {"get_smart_model": lambda *args, **kwargs: smart, "get_mini_model": lambda *args, **kwargs: mini}
+    agents = (assignment_editor, research_assistant, reporter, copy_editor, graphic_desk, editor_in_chief)
+    with _patched({
+        (module, name): factory
+        for module in agents for name, factory in factories.items() if hasattr(module, name)
+    }):
+        yield
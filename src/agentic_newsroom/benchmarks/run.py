@@ -0,0 +1,190 @@
+"""
+Offline benchmark for the full newsroom workflow.
+
+Runs N generated article ideas through build_newsroom_workflow() with the
+fakes from benchmarks.fakes, so it needs no network or API keys, and reports
+throughput, per-article latency percentiles and peak RSS. Use it to measure
+framework overhead and catch regressions in concurrency or I/O handling.
+
+    python -m agentic_newsroom.benchmarks.run --articles 20 --concurrency 4 --latency 0.05
+"""
+
+import asyncio
+import io
+import json
+import logging
+import math
+import shutil
+import sys
+import time
+from typing import List, Optional
+
+from agentic_newsroom.benchmarks.fakes import ARTICLE_TYPES, FakeChatModel, offline_clients, offline_models
+from agentic_newsroom.schemas.base import get_project_root
+from agentic_newsroom.workflows.batch import run_batch, arun_batch
+from agentic_newsroom.workflows.newsroom_workflow import build_newsroom_workflow
+
+logger = logging.getLogger(__name__)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile; 0.0 for an empty list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB, or None where unsupported."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _cleanup(slugs: List[str]):
+    artifacts_dir = get_project_root() / "artifacts"
+    for slug in slugs:
+        if slug and slug.startswith("bench-"):
+            shutil.rmtree(artifacts_dir / slug, ignore_errors=True)
+
+
+def run_benchmark(
+    articles: int = 10,
+    concurrency: int = 4,
+    latency: float = 0.0,
+    jitter: float = 0.0,
+    tool_latency: float = 0.0,
+    use_async: bool = False,
+    review_mode: str = "sequential",
+    revision_mode: str = "full",
+    draft_mode: str = "single",
+    research_mode: str = "sequential",
+    article_type: str = "Web Daily",
+    keep_artifacts: bool = False,
+) -> dict:
+    """Run `articles` fake articles through the workflow and return a report.
+
+    Args:
+        articles: Number of articles to produce.
+        concurrency: Max articles in flight at once.
+        latency: Simulated seconds per LLM call.
+        jitter: Extra random LLM latency, uniform in [0, jitter] seconds.
+        tool_latency: Simulated seconds per Tavily or image API call.
+        use_async: Drive the workflow with ainvoke on one event loop instead of threads.
+        review_mode: Reporter review flow, "sequential" or "parallel".
+        revision_mode: Reporter revision flow, "full" or "patch".
+        draft_mode: Reporter drafting flow, "single" or "sectioned" (sectioned only applies to Full Features).
+        research_mode: Research turn layout, "sequential" or "pipelined".
+        article_type: Article type of every story brief, one of ARTICLE_TYPES.
+        keep_artifacts: Keep the artifacts/bench-* directories written by the run.
+    """
+    # One fake per model tier, so prompt cache hits are only counted where production gets them
+    smart = FakeChatModel(model_name="fake-smart", latency=latency, jitter=jitter, article_type=article_type)
+    mini = FakeChatModel(model_name="fake-mini", latency=latency, jitter=jitter, seed=1, article_type=article_type)
+    config = {"configurable": {"review_mode": review_mode, "revision_mode": revision_mode, "draft_mode": draft_mode,
+                               "research_mode": research_mode, "tavily_cache": False, "llm_cache": False, "research_index": False}}
+    ideas = [json.dumps({"id": i, "article_idea": f"Benchmark article {i}"}) for i in range(articles)]
+    output = io.StringIO()
+    workflow = build_newsroom_workflow()
+
+    with offline_clients(tool_latency), offline_models(smart, mini):
+        start = time.perf_counter()
+        if use_async:
+            counts = asyncio.run(arun_batch(ideas, output, concurrency=concurrency, workflow=workflow, config=config))
+        else:
+            counts = run_batch(ideas, output, concurrency=concurrency, workflow=workflow, config=config)
+        elapsed = time.perf_counter() - start
+
+    results = [json.loads(line) for line in output.getvalue().splitlines()]
+    latencies = [r["elapsed_s"] for r in results if r["status"] == "ok"]
+    if not keep_artifacts:
+        _cleanup([r.get("slug") for r in results])
+
+    return {
+        "articles": articles,
+        "ok": counts["ok"],
+        "errors": counts["error"],
+        "concurrency": concurrency,
+        "mode": "async" if use_async else "threads",
+        "review_mode": review_mode,
+        "revision_mode": revision_mode,
+        "draft_mode": draft_mode,
+        "research_mode": research_mode,
+        "article_type": article_type,
+        "llm_latency_s": latency,
+        "tool_latency_s": tool_latency,
+        "wall_time_s": round(elapsed, 3),
+        "throughput_per_min": round(counts["ok"] / elapsed * 60, 2) if elapsed else 0.0,
+        "latency_p50_s": percentile(latencies, 50),
+        "latency_p95_s": percentile(latencies, 95),
+        "latency_max_s": max(latencies, default=0.0),
+        "tokens": sum(r["tokens"] for r in results if r["status"] == "ok"),
+        "cached_tokens": sum(r["cached_tokens"] for r in results if r["status"] == "ok"),
+        "peak_rss_mb": round(rss, 1) if (rss := peak_rss_mb()) is not None else None,
+        "failures": [r["error"] for r in results if r["status"] == "error"],
+    }
+
+
+def format_report(report: dict) -> str:
+    lines = [
+        f"Articles:    {report['ok']}/{report['articles']} {report['article_type']} ok ({report['mode']}, concurrency={report['concurrency']}, "
+        f"draft={report['draft_mode']}, review={report['review_mode']}, revision={report['revision_mode']}, research={report['research_mode']})",
+        f"Latency:     LLM {report['llm_latency_s']}s/call, tools {report['tool_latency_s']}s/call",
+        f"Wall time:   {report['wall_time_s']:.2f}s",
+        f"Throughput:  {report['throughput_per_min']:.1f} articles/min",
+        f"Per article: p50 {report['latency_p50_s']:.2f}s, p95 {report['latency_p95_s']:.2f}s, max {report['latency_max_s']:.2f}s",
+        f"Tokens:      {report['tokens']:,} ({report['cached_tokens']:,} cached input)",
+        f"Peak RSS:    {report['peak_rss_mb']} MB",
+    ]
+    for failure in report["failures"]:
+        lines.append(f"Failed:      {failure}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Offline benchmark of the full newsroom workflow")
+    parser.add_argument("--articles", type=int, default=10, help="Number of articles to run (default: 10)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Max articles in flight (default: 4)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated seconds per LLM call")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random seconds per LLM call")
+    parser.add_argument("--tool-latency", type=float, default=0.0, help="Simulated seconds per Tavily/image call")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="Use ainvoke on one event loop")
+    parser.add_argument("--parallel-review", action="store_true", help="Reporter runs fact and style reviews concurrently")
+    parser.add_argument("--patch-revisions", action="store_true", help="Reporter revises only the flagged paragraphs")
+    parser.add_argument("--sectioned-draft", action="store_true",
+                        help="Reporter drafts Full Features section by section (implies --article-type 'Full Feature')")
+    parser.add_argument("--pipelined-research", action="store_true", help="Research plans the next turn while pages are extracted")
+    parser.add_argument("--article-type", choices=ARTICLE_TYPES,
+                        help="Article type of the story briefs (default: Web Daily, or Full Feature with --sectioned-draft)")
+    parser.add_argument("--keep-artifacts", action="store_true", help="Keep the artifacts/bench-* directories")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+    if args.sectioned_draft and args.article_type == "Web Daily":
+        parser.error("--sectioned-draft only applies to Full Features")
+
+    report = run_benchmark(
+        articles=args.articles,
+        concurrency=args.concurrency,
+        latency=args.latency,
+        jitter=args.jitter,
+        tool_latency=args.tool_latency,
+        use_async=args.use_async,
+        review_mode="parallel" if args.parallel_review else "sequential",
+        revision_mode="patch" if args.patch_revisions else "full",
+        draft_mode="sectioned" if args.sectioned_draft else "single",
+        research_mode="pipelined" if args.pipelined_research else "sequential",
+        article_type=args.article_type or ("Full Feature" if args.sectioned_draft else "Web Daily"),
+        keep_artifacts=args.keep_artifacts,
+    )
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+    # Every flow has at least one Reporter call that reuses the draft's research prefix on the same model
+    if report["ok"] and not report["cached_tokens"]:
+        sys.exit("No cached input tokens: the Reporter's calls no longer share a prompt-cache prefix")
@@ -1,9 +1,159 @@
+import asyncio
 import os
+import logging
+import threading
+from functools import lru_cache
+from typing import Optional, Sequence, Type, TypeVar
+
 from langchain.chat_models import init_chat_model
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.runnables import RunnableConfig
+from pydantic import BaseModel
+
+from agentic_newsroom.utils.cache import SqliteCache, get_cache_dir, make_key
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+
+# Models are created on first use and shared afterwards, so importing an agent
+# needs no API key and every node reuses the same client connection pool.
 
+@lru_cache(maxsize=None)
 def get_mini_model(reasoning_effort: str = "minimal") -> BaseChatModel:
     return init_chat_model(model="openai:gpt-5-mini", reasoning_effort=reasoning_effort)
 
+@lru_cache(maxsize=None)
 def get_smart_model(reasoning_effort: str = "minimal") -> BaseChatModel:
-    return init_chat_model(model="openai:gpt-5", reasoning_effort=reasoning_effort)
\ No newline at end of file
+    return init_chat_model(model="openai:gpt-5", reasoning_effort=reasoning_effort)
+
+
+# =============================================================================
+# RESPONSE CACHE
+# =============================================================================
+#
+# Opt-in cache for LLM calls, enabled with LLM_CACHE=1 or the `llm_cache`
+# config option. Entries are keyed on model name, reasoning effort, the
+# serialized messages and the output schema, so re-running a pipeline after
+# changing only a downstream agent replays the upstream calls from disk.
+#
+# `llm_cache` may be a bool, or a dict of node name -> bool with "*" as the
+# default for nodes not listed, e.g. {"*": True, "write_draft": False}.
+
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE", "0") == "1"
+LLM_CACHE_TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL_HOURS", "720")) * 3600
+LLM_CACHE_MAX_BYTES = int(float(os.getenv("LLM_CACHE_MAX_MB", "200")) * 1024 * 1024)
+
+_cache: Optional[SqliteCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> SqliteCache:
+    """Return the shared LLM response cache, opening it on first use."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = SqliteCache(
+                    get_cache_dir() / "llm.sqlite",
+                    ttl_seconds=LLM_CACHE_TTL_SECONDS,
+                    max_bytes=LLM_CACHE_MAX_BYTES,
+                )
+    return _cache
+
+
+def _cache_enabled(config: Optional[RunnableConfig]) -> bool:
+    setting = (config or {}).get("configurable", {}).get("llm_cache")
+    if setting is None:
+        return LLM_CACHE_ENABLED
+    if isinstance(setting, dict):
+        node = (config or {}).get("metadata", {}).get("langgraph_node")
+        return bool(setting.get(node, setting.get("*", LLM_CACHE_ENABLED)))
+    return bool(setting)
+
+
+def _cache_key(model: BaseChatModel, messages: Sequence[BaseMessage], schema: Optional[Type[BaseModel]]) -> str:
+    model_name = getattr(model, "model_name", None) or getattr(model, "model", None) or type(model).__name__
+    reasoning_effort = getattr(model, "reasoning_effort", None)
+    serialized = [{"type": m.type, "content": m.content} for m in messages]
+    schema_json = schema.model_json_schema() if schema else None
+    return make_key(model_name, reasoning_effort, serialized, schema_json)
+
+
+def _node_name(config: Optional[RunnableConfig]) -> str:
+    return (config or {}).get("metadata", {}).get("langgraph_node", "llm")
+
+
+def invoke_structured(
+    model: BaseChatModel,
+    schema: Type[T],
+    messages: Sequence[BaseMessage],
+    config: Optional[RunnableConfig] = None,
+) -> T:
+    """`model.with_structured_output(schema).invoke(messages)`, through the response cache."""
+    if not _cache_enabled(config):
+        return model.with_structured_output(schema).invoke(messages)
+
+    key = _cache_key(model, messages, schema)
+    cached = get_llm_cache().get(key)
+    if cached is not None:
+        logger.info(f"  LLM cache hit ({_node_name(config)})")
+        return schema.model_validate(cached)
+
+    result = model.with_structured_output(schema).invoke(messages)
+    get_llm_cache().set(key, result.model_dump(mode="json"))
+    return result
+
+
+async def ainvoke_structured(
+    model: BaseChatModel,
+    schema: Type[T],
+    messages: Sequence[BaseMessage],
+    config: Optional[RunnableConfig] = None,
+) -> T:
+    """Async version of invoke_structured."""
+    if not _cache_enabled(config):
+        return await model.with_structured_output(schema).ainvoke(messages)
+
+    key = _cache_key(model, messages, schema)
+    cached = await asyncio.to_thread(get_llm_cache().get, key)
+    if cached is not None:
+        logger.info(f"  LLM cache hit ({_node_name(config)})")
+        return schema.model_validate(cached)
+
+    result = await model.with_structured_output(schema).ainvoke(messages)
+    await asyncio.to_thread(get_llm_cache().set, key, result.model_dump(mode="json"))
+    return result
+
+
+def invoke_text(model: BaseChatModel, messages: Sequence[BaseMessage], config: Optional[RunnableConfig] = None) -> str:
+    """`model.invoke(messages).content`, through the response cache."""
+    if not _cache_enabled(config):
+        return model.invoke(messages).content
+
+    key = _cache_key(model, messages, None)
+    cached = get_llm_cache().get(key)
+    if cached is not None:
+        logger.info(f"  LLM cache hit ({_node_name(config)})")
+        return cached
+
+    content = model.invoke(messages).content
+    get_llm_cache().set(key, content)
+    return content
+
+
+async def ainvoke_text(model: BaseChatModel, messages: Sequence[BaseMessage], config: Optional[RunnableConfig] = None) -> str:
+    """Async version of invoke_text."""
+    if not _cache_enabled(config):
+        return (await model.ainvoke(messages)).content
+
+    key = _cache_key(model, messages, None)
+    cached = await asyncio.to_thread(get_llm_cache().get, key)
+    if cached is not None:
+        logger.info(f"  LLM cache hit ({_node_name(config)})")
+        return cached
+
+    content = (await model.ainvoke(messages)).content
+    await asyncio.to_thread(get_llm_cache().set, key, content)
+    return content
@@ -1,3 +1,4 @@
+import asyncio
 import re
 from pathlib import Path
 from pydantic import BaseModel
@@ -52,6 +53,10 @@ class NewsroomModel(BaseModel):
         self.save_json(slug)
         self.save_markdown(slug)
 
+    async def asave(self, slug: str):
+        """Save both versions without blocking the event loop."""
+        await asyncio.to_thread(self.save, slug)
+
     @classmethod
     def load(cls, slug: str):
         """Load instance from JSON file using slug."""
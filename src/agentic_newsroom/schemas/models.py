@@ -26,6 +26,12 @@ class StoryBrief(NewsroomModel):
         description="Instructions for people in the hero image. Default: 'Do not include any people in the hero image.' or custom instructions if explicitly requested."
     )
 
+    def is_article_type(self, *names: str) -> bool:
+        """True if the article type is one of `names`, ignoring case and anything
+        written after the name, e.g. "Full Feature (1500-2000 words)"."""
+        article_type = self.article_type.strip().lower()
+        return any(article_type.startswith(name.lower()) for name in names)
+
     def to_markdown(self) -> str:
         """Convert StoryBrief to markdown format."""
         lines = [
@@ -220,6 +226,65 @@ class RevisedDraft(BaseModel):
     full_draft: str = Field(..., description="The revised article text")
 
 
+class ParagraphIssue(BaseModel):
+    """A review issue tied to the paragraph that has to change to fix it."""
+    paragraph: int = Field(..., description="Number of the paragraph, as marked in the draft ([P3] is 3)")
+    issue: str = Field(..., description="The specific problem in that paragraph")
+
+    def __str__(self) -> str:
+        return f"Paragraph {self.paragraph}: {self.issue}"
+
+
+class AnchoredReview(BaseModel):
+    """Output from fact or style reviewer in patch revision mode - issues anchored to paragraphs"""
+    issues: List[ParagraphIssue] = Field(..., description="Specific issues to fix, each in one paragraph (empty if none)")
+    rubric: ReviewRubric = Field(..., description="Quality scores for recording")
+
+
+class RevisedParagraph(BaseModel):
+    """Output from patch revision - one updated paragraph"""
+    paragraph: str = Field(..., description="The revised paragraph text")
+
+
+class SectionPlan(BaseModel):
+    """One ## section of a draft outline."""
+    heading: str = Field(..., description="The section heading, without the ## prefix")
+    purpose: str = Field(..., description="What the section covers and how it moves the story forward")
+    research_items: List[int] = Field(..., description="Numbers of the research items the section draws on")
+    target_words: int = Field(..., description="Target length of the section in words")
+
+
+class DraftOutline(BaseModel):
+    """Section plan for writing a draft one section at a time (sectioned draft mode)."""
+    sections: List[SectionPlan] = Field(..., description="The article's sections in reading order")
+
+    def to_markdown(self) -> str:
+        md = "# Draft Outline\n\n"
+        for i, section in enumerate(self.sections, 1):
+            md += f"## {i}. {section.heading}\n\n"
+            md += f"{section.purpose}\n\n"
+            md += f"**Target:** {section.target_words} words\n\n"
+            md += f"**Research items:** {', '.join(str(n) for n in section.research_items) or 'none'}\n\n"
+        return md
+
+
+class DraftSection(BaseModel):
+    """Output from writing one section of a sectioned draft."""
+    text: str = Field(..., description="The section body, without its ## heading")
+    sources: List[str] = Field(..., description="Full URLs of the sources the section used")
+
+
+class SectionOpening(BaseModel):
+    section: int = Field(..., description="Number of the section whose opening paragraph is replaced")
+    paragraph: str = Field(..., description="The rewritten opening paragraph")
+
+
+class StitchEdits(BaseModel):
+    """Output from the stitch pass that joins separately written sections."""
+    openings: List[SectionOpening] = Field(..., description="Rewritten opening paragraphs, only where a transition needs smoothing")
+    sources_section: str = Field(..., description="Prose paragraph describing sources for end of article")
+
+
 class FinalArticle(NewsroomModel):
     """The polished, publication-ready article from the Copy Editor."""
     title: str = Field(..., description="The article headline")
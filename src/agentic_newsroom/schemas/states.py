@@ -2,7 +2,7 @@
 import operator
 from typing import TypedDict, Optional, List, Annotated
 from langchain_core.messages import BaseMessage
-from agentic_newsroom.schemas.models import StoryBrief, SearchResult, ResearchPackage, DraftPackage, RevisionNotes, FinalArticle, FactReview, StyleReview, PublicationApproval
+from agentic_newsroom.schemas.models import StoryBrief, SearchResult, ResearchPackage, DraftPackage, RevisionNotes, FinalArticle, FactReview, StyleReview, PublicationApproval, DraftOutline, SectionPlan, ParagraphIssue
 
 
 class NewsroomState(TypedDict):
@@ -32,36 +32,86 @@ class ResearchState(TypedDict):
     queries: List[str]
     raw_search_results: List[dict] # Snippets from Tavily Search
     urls_to_extract: List[str]     # URLs chosen by curation
+
+    next_queries: List[str]        # Speculated during the previous turn (pipelined mode)
+
+    # Everything already run or read in earlier turns, so later turns only spend on new material
+    seen_queries: Annotated[List[str], operator.add]
+    seen_urls: Annotated[List[str], operator.add]  # normalized, see utils.content.normalize_url
+
+    # Pages extracted this turn, each analyzed by its own analyze_source task
+    extracted_pages: List[dict]
+    source_findings: Annotated[List[dict], operator.add]  # {"turn", "url", "summary", "items"} per analyzed page
     
-    # Result Accumulator
-    search_results: Annotated[List[SearchResult], operator.add]
+    # Running totals of the research items. The items themselves are only kept in the
+    # research log (utils.research_log), so checkpoints don't grow with every turn.
+    item_count: Annotated[int, operator.add]
+    item_sources: Annotated[List[str], operator.add]      # normalized source URL of each update's items
+    covered_questions: Annotated[List[int], operator.add]  # indexes of key questions some item covers
 
     # Final trimmed package
     research_package: ResearchPackage 
     
     # Loop Control
     current_turn: int
-    max_turns: int
+    max_turns: int                 # Optional override of the article type's budget
     is_complete: bool
 
+    # Budget accounting (see research_assistant.ResearchBudget)
+    started_at: float
+    spent_tokens: Annotated[int, operator.add]   # Estimated LLM tokens, prompts and outputs
+    spent_credits: Annotated[int, operator.add]  # Tavily credits, counting cache hits as if billed
+    turn_stats: Annotated[List[dict], operator.add]  # Yield of each turn, see _turn_stats
+
+
+class SourceState(TypedDict):
+    """Input of one analyze_source task in the research assistant (sent per extracted page)."""
+    story_brief: StoryBrief
+    url: str
+    evidence: List[dict]  # The page's chunks of the turn's evidence, see utils.chunking.select_evidence
+    current_turn: int
+
 
 class ReporterState(TypedDict):
     """State for the Reporter subgraph.
 
-    Flow: write_draft → review_facts → revise_facts → review_style → revise_style → finalize_draft
+    Every flow starts with select_research.
+    Flow (sequential): write_draft → review_facts → revise_facts → review_style → revise_style → finalize_draft
+    Flow (parallel):   write_draft → [review_facts, review_style] → revise → finalize_draft
+    Sectioned drafting replaces write_draft with outline_draft → [write_section, ...] → stitch_draft
     """
     # Inputs
     story_brief: StoryBrief
     research_package: ResearchPackage
 
+    # The research items the draft and its reviews share, ranked once by select_research
+    draft_research: Optional[ResearchPackage]
+
     # Reviews (for recording)
     fact_review: Optional[FactReview]
     style_review: Optional[StyleReview]
 
+    # Patch revision mode: the reviews' issues anchored to paragraph numbers
+    fact_issues: Optional[List[ParagraphIssue]]
+    style_issues: Optional[List[ParagraphIssue]]
+
+    # Sectioned draft mode: the outline, and each section as it is written
+    draft_outline: Optional[DraftOutline]
+    draft_sections: Annotated[List[dict], operator.add]  # {"index", "heading", "section"} per written section
+
     # Output
     draft_package: Optional[DraftPackage]
 
 
+class SectionTaskState(TypedDict):
+    """Input of one write_section task in the reporter (sent per outline section)."""
+    story_brief: StoryBrief
+    draft_research: ResearchPackage
+    draft_outline: DraftOutline
+    index: int
+    section: SectionPlan
+
+
 class CopyEditorState(TypedDict):
     """State for the Copy Editor subgraph."""
 
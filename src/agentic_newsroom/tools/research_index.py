@@ -0,0 +1,207 @@
+"""
+Local full-text index over past research, for reuse across articles.
+
+The items of every saved research package (artifacts/*/research_package.json)
+and chunks of every page the research assistant extracted are indexed in
+`.cache/research_index.sqlite` with SQLite FTS5 and ranked with its built-in
+BM25. The research assistant searches it before the web, so recurring beats
+start from what earlier stories already found and only search for the gaps.
+
+Packages are indexed incrementally by file modification time, so the index
+also picks up artifacts written by other processes. Set RESEARCH_INDEX=0, or
+pass use_index=False / the `research_index: False` config option, to skip it.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import List, Optional
+
+from agentic_newsroom.schemas.base import get_project_root
+from agentic_newsroom.schemas.models import SearchResult
+from agentic_newsroom.utils.cache import get_cache_dir
+from agentic_newsroom.utils.chunking import split_chunks, strip_boilerplate, tokenize
+from agentic_newsroom.utils.content import normalize_url
+
+logger = logging.getLogger(__name__)
+
+INDEX_ENABLED = os.getenv("RESEARCH_INDEX", "1") != "0"
+
+# How much local material one lookup may contribute
+MAX_LOCAL_ITEMS = int(os.getenv("RESEARCH_INDEX_MAX_ITEMS", "15"))
+MAX_LOCAL_PAGES = int(os.getenv("RESEARCH_INDEX_MAX_PAGES", "3"))
+
+# A hit must share at least this many distinct terms with the query
+MIN_SHARED_TERMS = 3
+
+_index: Optional["ResearchIndex"] = None
+_index_lock = threading.Lock()
+
+
+def _match_expression(query: str) -> str:
+    """FTS5 query matching any of the query's content words."""
+    terms = dict.fromkeys(tokenize(query))
+    return " OR ".join(f'"{term}"' for term in terms)
+
+
+class ResearchIndex:
+    """FTS5 index of research items and extracted page chunks.
+
+    Args:
+        path: SQLite file to use.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE VIRTUAL TABLE IF NOT EXISTS docs USING fts5(
+                content, relevance,
+                kind UNINDEXED, source UNINDEXED, slug UNINDEXED, position UNINDEXED,
+                tokenize = 'porter unicode61'
+            )"""
+        )
+        # What has been indexed: "package:<slug>" with its file mtime, "page:<normalized url>"
+        self._conn.execute("CREATE TABLE IF NOT EXISTS indexed (name TEXT PRIMARY KEY, mtime REAL NOT NULL)")
+        self._conn.commit()
+
+    def _indexed_mtime(self, name: str) -> Optional[float]:
+        row = self._conn.execute("SELECT mtime FROM indexed WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def add_package(self, slug: str, results: List[SearchResult], mtime: float = 0.0):
+        """Index (or re-index) the items of one article's research package."""
+        with self._lock:
+            self._conn.execute("DELETE FROM docs WHERE kind = 'item' AND slug = ?", (slug,))
+            self._conn.executemany(
+                "INSERT INTO docs (content, relevance, kind, source, slug, position) VALUES (?, ?, 'item', ?, ?, ?)",
+                [(r.content, r.relevance, r.source, slug, i) for i, r in enumerate(results)],
+            )
+            self._conn.execute("INSERT OR REPLACE INTO indexed (name, mtime) VALUES (?, ?)", (f"package:{slug}", mtime))
+            self._conn.commit()
+
+    def add_pages(self, pages: List[dict], slug: str = ""):
+        """Index cleaned chunks of Tavily extract results. Pages already indexed are skipped."""
+        added = 0
+        with self._lock:
+            for page in pages:
+                url = page.get("url")
+                if not url or self._indexed_mtime(f"page:{normalize_url(url)}") is not None:
+                    continue
+                chunks = split_chunks(strip_boilerplate(page.get("raw_content") or ""))
+                self._conn.executemany(
+                    "INSERT INTO docs (content, relevance, kind, source, slug, position) VALUES (?, '', 'page', ?, ?, ?)",
+                    [(chunk, url, slug, i) for i, chunk in enumerate(chunks)],
+                )
+                self._conn.execute("INSERT OR REPLACE INTO indexed (name, mtime) VALUES (?, 0)", (f"page:{normalize_url(url)}",))
+                added += 1
+            self._conn.commit()
+        if added:
+            logger.debug(f"  Indexed {added} extracted pages")
+
+    def sync_packages(self, artifacts_dir: Optional[Path] = None):
+        """Index research packages that are new or changed since they were last indexed."""
+        artifacts_dir = artifacts_dir or get_project_root() / "artifacts"
+        for path in sorted(artifacts_dir.glob("*/research_package.json")):
+            slug = path.parent.name
+            mtime = path.stat().st_mtime
+            with self._lock:
+                indexed = self._indexed_mtime(f"package:{slug}")
+            if indexed is not None and indexed >= mtime:
+                continue
+            try:
+                results = [SearchResult(**r) for r in json.loads(path.read_text())["results"]]
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.warning(f"  Skipping unreadable research package {path}: {e}")
+                continue
+            self.add_package(slug, results, mtime)
+            logger.debug(f"  Indexed research package '{slug}' ({len(results)} items)")
+
+    def search(self, query: str, kind: str, limit: int, exclude_slug: Optional[str] = None) -> List[dict]:
+        """Best-ranked documents of one kind ("item" or "page") for the query.
+
+        Hits sharing fewer than MIN_SHARED_TERMS content words with the query
+        are dropped, so a single common word doesn't count as a match.
+        """
+        expression = _match_expression(query)
+        if not expression:
+            return []
+
+        query_terms = set(tokenize(query))
+        min_shared = min(MIN_SHARED_TERMS, len(query_terms))
+        sql = "SELECT content, relevance, source, slug, position, bm25(docs) FROM docs WHERE docs MATCH ? AND kind = ?"
+        params = [expression, kind]
+        if exclude_slug:
+            sql += " AND slug != ?"
+            params.append(exclude_slug)
+        sql += " ORDER BY bm25(docs) LIMIT ?"
+        params.append(limit * 4)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        hits = []
+        for content, relevance, source, slug, position, rank in rows:
+            if len(query_terms & set(tokenize(content))) < min_shared:
+                continue
+            hits.append({"content": content, "relevance": relevance, "source": source, "slug": slug,
+                         "position": position, "score": -rank})
+            if len(hits) == limit:
+                break
+        return hits
+
+
+def get_research_index() -> ResearchIndex:
+    """Return the shared index, opening it on first use."""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = ResearchIndex(get_cache_dir() / "research_index.sqlite")
+    return _index
+
+
+def _use_index(use_index: Optional[bool]) -> bool:
+    return INDEX_ENABLED if use_index is None else use_index
+
+
+def search_local(query: str, exclude_slug: Optional[str] = None, use_index: Optional[bool] = None) -> tuple:
+    """Look up past research for a query, skipping what `exclude_slug` itself indexed.
+
+    Returns (items, pages): SearchResult items from earlier research packages,
+    and extracted pages rebuilt from their best-matching chunks in the same
+    shape as Tavily extract results ({'url', 'raw_content'}).
+    """
+    if not _use_index(use_index):
+        return [], []
+
+    index = get_research_index()
+    index.sync_packages()
+
+    items = [
+        SearchResult(source=hit["source"], content=hit["content"], relevance=hit["relevance"])
+        for hit in index.search(query, "item", MAX_LOCAL_ITEMS, exclude_slug)
+    ]
+
+    # Group page chunks by page, best page first, chunks back in reading order
+    chunks_by_url = {}
+    for hit in index.search(query, "page", MAX_LOCAL_PAGES * 5, exclude_slug):
+        chunks_by_url.setdefault(hit["source"], []).append(hit)
+    pages = [
+        {"url": url, "raw_content": "\n\n".join(c["content"] for c in sorted(chunks, key=lambda c: c["position"]))}
+        for url, chunks in list(chunks_by_url.items())[:MAX_LOCAL_PAGES]
+    ]
+
+    logger.info(f"  Local research index: {len(items)} items, {len(pages)} pages")
+    return items, pages
+
+
+def index_pages(pages: List[dict], slug: str = "", use_index: Optional[bool] = None):
+    """Add freshly extracted pages to the index."""
+    if _use_index(use_index) and pages:
+        get_research_index().add_pages(pages, slug)
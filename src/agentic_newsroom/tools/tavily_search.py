@@ -3,50 +3,317 @@ Tavily web search tool for the Agentic Newsroom.
 
 This module provides a wrapper around the Tavily search API
 for performing web searches during research.
+
+The sync and async Tavily clients are created lazily on first use and then
+shared, so HTTP keep-alive connections and TLS sessions survive across
+research turns and articles.
+
+Search results (per query) and extracted pages (per requested URL, normalized) are cached on disk
+in `.cache/tavily.sqlite`, so re-running or resuming an article doesn't pay
+for the same calls again. Set TAVILY_CACHE=0, or pass use_cache=False, to
+bypass the cache.
+
+Every API call reports the Tavily credits it used through record_usage(), so
+they show up in the run's metrics.
 """
 
+import asyncio
+import logging
+import math
 import os
-from typing import List, Dict, Any, Union
-from tavily import TavilyClient
-
-def perform_search(queries: List[str]) -> List[dict]:
-     """Search Tavily and return raw results (url + title + content snippet)."""
-     api_key = os.getenv("TAVILY_API_KEY")
-     if not api_key:
-         raise Exception("TAVILY_API_KEY environment variable is not set")
-     tavily = TavilyClient(api_key=api_key)
-
-     print(f"🔎 Searching for: {queries}")
-     aggregated= []
-     for query in queries:
-        try:
-            resp = tavily.search(query, search_depth="advanced", max_results=3)
-            results = resp.get("results", [])
-            aggregated.extend(results)
-        except Exception as e:
-            print(f"Search failed for '{query}': {e}")
-     
-     return aggregated
-
-def perform_extract(urls: List[str]) -> List[dict]:
-    """Scrape full content from URLs."""
-    if not urls:
-        return []
-    
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from tavily import TavilyClient, AsyncTavilyClient
+
+from agentic_newsroom.utils.cache import SqliteCache, get_cache_dir, make_key
+from agentic_newsroom.utils.content import normalize_url
+from agentic_newsroom.utils.metrics import record_usage
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on searches in flight at once for a single perform_search call
+MAX_CONCURRENT_SEARCHES = max(1, int(os.getenv("TAVILY_MAX_CONCURRENT_SEARCHES", "3")))
+
+# Shared connection pool settings
+POOL_SIZE = max(1, int(os.getenv("TAVILY_POOL_SIZE", "10")))
+SEARCH_TIMEOUT = float(os.getenv("TAVILY_SEARCH_TIMEOUT", "60"))
+EXTRACT_TIMEOUT = float(os.getenv("TAVILY_EXTRACT_TIMEOUT", "30"))
+
+# Search parameters (part of the cache key)
+SEARCH_DEPTH = "advanced"
+MAX_RESULTS = 3
+
+# Credit costs, used when a response doesn't report its usage
+SEARCH_CREDITS = 2 if SEARCH_DEPTH == "advanced" else 1
+EXTRACT_URLS_PER_CREDIT = 5
+
+# On-disk result cache
+CACHE_ENABLED = os.getenv("TAVILY_CACHE", "1") != "0"
+CACHE_TTL_SECONDS = float(os.getenv("TAVILY_CACHE_TTL_HOURS", "168")) * 3600
+CACHE_MAX_BYTES = int(float(os.getenv("TAVILY_CACHE_MAX_MB", "500")) * 1024 * 1024)
+
+_client: Optional[TavilyClient] = None
+_cache: Optional[SqliteCache] = None
+_client_lock = threading.Lock()
+# httpx.AsyncClient connections are bound to the event loop that opened them,
+# so there is one async client per running loop
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncTavilyClient]" = weakref.WeakKeyDictionary()
+
+
+def _get_api_key() -> str:
     api_key = os.getenv("TAVILY_API_KEY")
     if not api_key:
         raise Exception("TAVILY_API_KEY environment variable is not set")
-    tavily = TavilyClient(api_key=api_key)
-    
-    print(f"🌐 Extracting from {len(urls)} URLs...")
+    return api_key
+
+
+def get_tavily_client() -> TavilyClient:
+    """Return the shared sync client, creating it on first use.
+
+    Backed by a single requests.Session whose pool holds up to POOL_SIZE
+    connections, which is safe to share between the search worker threads.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _client = TavilyClient(api_key=_get_api_key(), session=session)
+    return _client
+
+
+def get_tavily_cache() -> SqliteCache:
+    """Return the shared on-disk result cache, opening it on first use."""
+    global _cache
+    if _cache is None:
+        with _client_lock:
+            if _cache is None:
+                _cache = SqliteCache(
+                    get_cache_dir() / "tavily.sqlite",
+                    ttl_seconds=CACHE_TTL_SECONDS,
+                    max_bytes=CACHE_MAX_BYTES,
+                )
+    return _cache
+
+
+def get_async_tavily_client() -> AsyncTavilyClient:
+    """Return the async client for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=POOL_SIZE, max_keepalive_connections=POOL_SIZE),
+            timeout=httpx.Timeout(SEARCH_TIMEOUT),
+        )
+        client = AsyncTavilyClient(api_key=_get_api_key(), client=http_client)
+        _async_clients[loop] = client
+    return client
+
+def _search_key(query: str) -> str:
+    return make_key("search", query, SEARCH_DEPTH, MAX_RESULTS)
+
+def _extract_key(url: str) -> str:
+    return make_key("extract", normalize_url(url))
+
+def _use_cache(use_cache: Optional[bool]) -> bool:
+    return CACHE_ENABLED if use_cache is None else use_cache
+
+def _credits(resp: dict, default: int) -> int:
+    return (resp.get("usage") or {}).get("credits", default)
+
+def _record_searches(credits: List[int]):
+    """Report the credits of the searches that hit the API (cache hits and failures are 0)."""
+    calls = sum(1 for c in credits if c)
+    if calls:
+        record_usage("tavily_search", calls=calls, credits=sum(credits))
+
+def _record_extract(resp: dict, fetched: int):
+    default = math.ceil(fetched / EXTRACT_URLS_PER_CREDIT)
+    record_usage("tavily_extract", urls=fetched, credits=_credits(resp, default))
+
+def _search_one(tavily: TavilyClient, query: str, use_cache: bool) -> tuple:
+    """Run one search and return (results, credits used).
+
+    Failures are logged and yield no results.
+    """
+    if use_cache:
+        cached = get_tavily_cache().get(_search_key(query))
+        if cached is not None:
+            return cached, 0
+
+    try:
+        resp = tavily.search(query, search_depth=SEARCH_DEPTH, max_results=MAX_RESULTS, timeout=SEARCH_TIMEOUT, include_usage=True)
+    except Exception as e:
+        logger.warning(f"Search failed for '{query}': {e}")
+        return [], 0
+
+    results = resp.get("results", [])
+    if use_cache:
+        get_tavily_cache().set(_search_key(query), results)
+    return results, _credits(resp, SEARCH_CREDITS)
+
+def perform_search(queries: List[str], use_cache: Optional[bool] = None) -> List[dict]:
+    """Search Tavily and return raw results (url + title + content snippet).
+
+    Queries run concurrently (at most MAX_CONCURRENT_SEARCHES at once) and
+    results are aggregated in query order.
+    """
+    if not queries:
+        return []
+
+    use_cache = _use_cache(use_cache)
+    tavily = get_tavily_client()
+
+    logger.info(f"🔎 Searching for: {queries}")
+    workers = min(len(queries), MAX_CONCURRENT_SEARCHES)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        per_query = list(pool.map(lambda q: _search_one(tavily, q, use_cache), queries))
+
+    # Reported from this thread: the pool threads don't carry the run context
+    _record_searches([credits for _, credits in per_query])
+    return [result for results, _ in per_query for result in results]
+
+def _split_cached(urls: List[str], use_cache: bool) -> tuple:
+    """Return (cached results, urls still to fetch)."""
+    if not use_cache:
+        return [], list(urls)
+
+    cache = get_tavily_cache()
+    hits, misses = [], []
+    for url in urls:
+        cached = cache.get(_extract_key(url))
+        if cached is not None:
+            hits.append(cached)
+        else:
+            misses.append(url)
+    return hits, misses
+
+def _requested_results(urls: List[str], resp: dict) -> List[tuple]:
+    """Pair each extracted page with the URL it was requested as.
+
+    Tavily may return a page under another URL than the requested one (after a
+    redirect, say). Pages are matched by normalized URL first; the rest keep the
+    request order, which Tavily preserves, once the failed URLs are left out.
+    """
+    requested = {normalize_url(url): url for url in urls}
+    failed = {normalize_url(r.get("url", "")) for r in resp.get("failed_results", [])}
+
+    pairs, unmatched = [], []
+    for result in resp.get("results", []):
+        url = requested.pop(normalize_url(result.get("url", "")), None)
+        if url:
+            pairs.append((url, result))
+        else:
+            unmatched.append(result)
+
+    remaining = [url for key, url in requested.items() if key not in failed]
+    if len(remaining) == len(unmatched):
+        pairs.extend(zip(remaining, unmatched))
+    else:
+        logger.debug(f"  Can't tell which URLs {len(unmatched)} extracted pages were requested as, not caching them")
+    return pairs
+
+def _store_extracted(urls: List[str], resp: dict):
+    """Cache the extracted pages under their requested URLs, where the next lookup expects them."""
+    cache = get_tavily_cache()
+    for url, result in _requested_results(urls, resp):
+        cache.set(_extract_key(url), result)
+
+def perform_extract(urls: List[str], use_cache: Optional[bool] = None) -> List[dict]:
+    """Scrape full content from URLs."""
+    if not urls:
+        return []
+
+    use_cache = _use_cache(use_cache)
+    cached, missing = _split_cached(urls, use_cache)
+    if not missing:
+        logger.info(f"🌐 Extracting from {len(urls)} URLs (all cached)...")
+        return cached
+
+    tavily = get_tavily_client()
+
+    logger.info(f"🌐 Extracting from {len(urls)} URLs ({len(cached)} cached)...")
     try:
         # extract_depth="advanced" handles popups/layouts better if available, standard is fine too
-        resp = tavily.extract(urls=urls)
-        return resp.get("results", [])
+        resp = tavily.extract(urls=missing, timeout=EXTRACT_TIMEOUT, include_usage=True)
     except Exception as e:
-        print(f"Extract failed: {e}")
+        logger.warning(f"Extract failed: {e}")
+        return cached
+
+    results = resp.get("results", [])
+    _record_extract(resp, len(results))
+    if use_cache:
+        _store_extracted(missing, resp)
+    return cached + results
+
+async def aperform_search(queries: List[str], use_cache: Optional[bool] = None) -> List[dict]:
+    """Async version of perform_search using the async Tavily client."""
+    if not queries:
         return []
 
+    use_cache = _use_cache(use_cache)
+    tavily = get_async_tavily_client()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
+
+    async def search_one(query: str) -> tuple:
+        if use_cache:
+            cached = await asyncio.to_thread(get_tavily_cache().get, _search_key(query))
+            if cached is not None:
+                return cached, 0
+
+        async with semaphore:
+            try:
+                resp = await tavily.search(query, search_depth=SEARCH_DEPTH, max_results=MAX_RESULTS, timeout=SEARCH_TIMEOUT, include_usage=True)
+            except Exception as e:
+                logger.warning(f"Search failed for '{query}': {e}")
+                return [], 0
+
+        results = resp.get("results", [])
+        if use_cache:
+            await asyncio.to_thread(get_tavily_cache().set, _search_key(query), results)
+        return results, _credits(resp, SEARCH_CREDITS)
+
+    logger.info(f"🔎 Searching for: {queries}")
+    per_query = await asyncio.gather(*(search_one(q) for q in queries))
+
+    _record_searches([credits for _, credits in per_query])
+    return [result for results, _ in per_query for result in results]
+
+async def aperform_extract(urls: List[str], use_cache: Optional[bool] = None) -> List[dict]:
+    """Async version of perform_extract using the async Tavily client."""
+    if not urls:
+        return []
+
+    use_cache = _use_cache(use_cache)
+    cached, missing = await asyncio.to_thread(_split_cached, urls, use_cache)
+    if not missing:
+        logger.info(f"🌐 Extracting from {len(urls)} URLs (all cached)...")
+        return cached
+
+    tavily = get_async_tavily_client()
+
+    logger.info(f"🌐 Extracting from {len(urls)} URLs ({len(cached)} cached)...")
+    try:
+        resp = await tavily.extract(urls=missing, timeout=EXTRACT_TIMEOUT, include_usage=True)
+    except Exception as e:
+        logger.warning(f"Extract failed: {e}")
+        return cached
+
+    results = resp.get("results", [])
+    _record_extract(resp, len(results))
+    if use_cache:
+        await asyncio.to_thread(_store_extracted, missing, resp)
+    return cached + results
+
 if __name__ == "__main__":
     from pathlib import Path
     from dotenv import load_dotenv
@@ -0,0 +1,124 @@
+"""
+Persistent key-value cache backed by a single SQLite file.
+
+Values are JSON-serialized and zlib-compressed. Entries expire after a TTL and
+the total compressed size is capped, evicting least recently used entries
+first. One instance can be shared between threads; SQLite's own locking makes
+the file safe to share between processes.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Optional
+
+from agentic_newsroom.schemas.base import get_project_root
+
+
+def get_cache_dir() -> Path:
+    """Directory holding the cache files, created on demand."""
+    cache_dir = get_project_root() / ".cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def make_key(*parts: Any) -> str:
+    """Content-addressed key: SHA-256 of the JSON-encoded parts."""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SqliteCache:
+    """TTL + LRU cache stored in a SQLite file.
+
+    Args:
+        path: SQLite file to use.
+        ttl_seconds: Entries older than this are treated as missing. None keeps them forever.
+        max_bytes: Cap on the total compressed size; LRU entries are evicted past it.
+    """
+
+    def __init__(self, path: Path, ttl_seconds: Optional[float] = None, max_bytes: Optional[int] = None):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS cache (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS cache_accessed_at ON cache (accessed_at)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, created_at FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+
+            value, created_at = row
+            if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+
+            self._conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+
+        return json.loads(zlib.decompress(value).decode("utf-8"))
+
+    def set(self, key: str, value: Any):
+        """Store a JSON-serializable value and evict LRU entries past the size cap."""
+        blob = zlib.compress(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, size, created_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, blob, len(blob), now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """Drop expired entries, then least recently used ones until under max_bytes."""
+        if self.ttl_seconds is not None:
+            self._conn.execute("DELETE FROM cache WHERE created_at < ?", (time.time() - self.ttl_seconds,))
+
+        if self.max_bytes is None:
+            return
+
+        (total,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()
+        if total <= self.max_bytes:
+            return
+
+        rows = self._conn.execute("SELECT key, size FROM cache ORDER BY accessed_at ASC").fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM cache WHERE key = ?", evicted)
+
+    def clear(self):
+        """Remove every entry."""
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()
+        return count
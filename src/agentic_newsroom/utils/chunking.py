@@ -0,0 +1,205 @@
+"""
+Token-aware evidence selection for extracted web pages.
+
+Pages are cleaned of navigation boilerplate, split into chunks of roughly
+CHUNK_TOKENS tokens along paragraph boundaries, scored against the story's
+key questions with BM25, and the best chunks across all pages are packed into
+a fixed token budget. Compared to cutting each page at a fixed length, this
+keeps the relevant parts of long sources and gives predictable prompt sizes.
+"""
+
+import logging
+import math
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, List
+
+logger = logging.getLogger(__name__)
+
+CHUNK_TOKENS = 300
+
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have how in is it its of on or that the their "
+    "there these this to was were what when where which who why will with does did do can".split()
+)
+
+# Lines that are almost always page chrome rather than content
+BOILERPLATE_PATTERNS = re.compile(
+    r"(cookie|subscribe|sign in|sign up|log in|newsletter|all rights reserved|privacy policy|"
+    r"terms of (use|service)|skip to (main )?content|share (on|this)|follow us|advertisement)",
+    re.IGNORECASE,
+)
+MARKDOWN_LINK = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+@lru_cache(maxsize=1)
+def get_token_counter() -> Callable[[str], int]:
+    """Token counter for the OpenAI models, or a ~4 chars/token estimate.
+
+    tiktoken downloads its encoding on first use, so without network access
+    (or without tiktoken) the estimate is used instead.
+    """
+    try:
+        import tiktoken
+
+        encoding = tiktoken.get_encoding("o200k_base")
+    except Exception:
+        logger.debug("tiktoken encoding unavailable, estimating tokens from length")
+        return lambda text: max(1, len(text) // 4)
+    return lambda text: len(encoding.encode(text, disallowed_special=()))
+
+
+def count_tokens(text: str) -> int:
+    return get_token_counter()(text)
+
+
+def _is_boilerplate(line: str, seen: set) -> bool:
+    if line.startswith("#"):
+        return False
+    text = MARKDOWN_LINK.sub(r"\1", line).strip()
+    if not text or line in seen:
+        return True
+    words = text.split()
+    # Mostly links: menus, breadcrumbs, related-article lists
+    if len(MARKDOWN_LINK.findall(line)) >= 2 and len(text) < 0.6 * len(line):
+        return True
+    # Short fragments without sentence punctuation: nav items, buttons, captions
+    if len(words) < 6 and not re.search(r"[.!?:]$", text):
+        return True
+    return len(words) < 20 and bool(BOILERPLATE_PATTERNS.search(text))
+
+
+def strip_boilerplate(text: str) -> str:
+    """Drop navigation, link lists, cookie banners and repeated lines from page text."""
+    seen = set()
+    kept = []
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line:
+            kept.append("")
+            continue
+        if not _is_boilerplate(line, seen):
+            kept.append(line)
+        seen.add(line)
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(kept)).strip()
+
+
+def _split_long(paragraph: str, max_tokens: int) -> Iterator[str]:
+    """Split a paragraph that exceeds max_tokens on sentence boundaries."""
+    current, current_tokens = [], 0
+    for sentence in SENTENCE_END.split(paragraph):
+        tokens = count_tokens(sentence)
+        if current and current_tokens + tokens > max_tokens:
+            yield " ".join(current)
+            current, current_tokens = [], 0
+        current.append(sentence)
+        current_tokens += tokens
+    if current:
+        yield " ".join(current)
+
+
+def split_chunks(text: str, max_tokens: int = CHUNK_TOKENS) -> Iterator[str]:
+    """Yield chunks of at most ~max_tokens tokens, merging whole paragraphs."""
+    current, current_tokens = [], 0
+    for paragraph in re.split(r"\n\s*\n", text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        tokens = count_tokens(paragraph)
+        pieces = [(paragraph, tokens)] if tokens <= max_tokens else [(p, count_tokens(p)) for p in _split_long(paragraph, max_tokens)]
+        for piece, piece_tokens in pieces:
+            if current and current_tokens + piece_tokens > max_tokens:
+                yield "\n\n".join(current)
+                current, current_tokens = [], 0
+            current.append(piece)
+            current_tokens += piece_tokens
+    if current:
+        yield "\n\n".join(current)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased content words of `text`, without stopwords."""
+    return [t for t in re.findall(r"[a-z0-9]+", text.lower()) if t not in STOPWORDS and len(t) > 1]
+
+
+def bm25_scorer(documents: List[str], k1: float = 1.5, b: float = 0.75) -> Callable[[str], List[float]]:
+    """Index `documents` once and return a function scoring them all against a query with BM25."""
+    doc_terms = [Counter(tokenize(doc)) for doc in documents]
+    lengths = [sum(counts.values()) for counts in doc_terms]
+    avg_len = (sum(lengths) / len(documents) if documents else 0.0) or 1.0
+    doc_freq = Counter(term for counts in doc_terms for term in counts)
+
+    def score(query: str) -> List[float]:
+        query_terms = set(tokenize(query))
+        if not documents or not query_terms:
+            return [0.0] * len(documents)
+
+        scores = []
+        for counts, length in zip(doc_terms, lengths):
+            total = 0.0
+            for term in query_terms:
+                tf = counts.get(term, 0)
+                if not tf:
+                    continue
+                idf = math.log(1 + (len(documents) - doc_freq[term] + 0.5) / (doc_freq[term] + 0.5))
+                total += idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * length / avg_len))
+            scores.append(total)
+        return scores
+
+    return score
+
+
+def bm25_scores(query: str, documents: List[str], k1: float = 1.5, b: float = 0.75) -> List[float]:
+    """BM25 score of each document against the query terms."""
+    return bm25_scorer(documents, k1, b)(query)
+
+
+def iter_page_chunks(pages: Iterable[dict], max_tokens: int = CHUNK_TOKENS) -> Iterator[dict]:
+    """Stream cleaned chunks from Tavily extract results, one page at a time."""
+    for page in pages:
+        text = strip_boilerplate(page.get("raw_content") or "")
+        for position, chunk in enumerate(split_chunks(text, max_tokens)):
+            yield {"url": page.get("url"), "position": position, "text": chunk, "tokens": count_tokens(chunk)}
+
+
+def select_evidence(pages: Iterable[dict], query: str, token_budget: int, max_tokens: int = CHUNK_TOKENS) -> List[dict]:
+    """Pick the chunks most relevant to `query` that fit in `token_budget`.
+
+    Each page's best chunk is considered first so every source gets a chance
+    to be represented, then the remaining budget goes to the highest-scoring
+    chunks overall. Selected chunks are returned grouped by page, in page order.
+    """
+    chunks = list(iter_page_chunks(pages, max_tokens))
+    for chunk, score in zip(chunks, bm25_scores(query, [c["text"] for c in chunks])):
+        chunk["score"] = score
+
+    by_score = sorted(chunks, key=lambda c: c["score"], reverse=True)
+    best_per_page = {}
+    for chunk in by_score:
+        best_per_page.setdefault(chunk["url"], chunk)
+
+    selected, used = {}, 0
+    for chunk in [*best_per_page.values(), *by_score]:
+        key = (chunk["url"], chunk["position"])
+        if key in selected or used + chunk["tokens"] > token_budget:
+            continue
+        selected[key] = chunk
+        used += chunk["tokens"]
+
+    page_order = {url: i for i, url in enumerate(dict.fromkeys(c["url"] for c in chunks))}
+    selected = sorted(selected.values(), key=lambda c: (page_order[c["url"]], c["position"]))
+    logger.info(f"  Selected {len(selected)}/{len(chunks)} chunks ({used}/{token_budget} tokens) from {len(best_per_page)} pages")
+    return selected
+
+
+def format_evidence(chunks: List[dict]) -> str:
+    """Render selected chunks as source-labelled blocks for a prompt."""
+    blocks, current_url = [], None
+    for chunk in chunks:
+        if chunk["url"] != current_url:
+            current_url = chunk["url"]
+            blocks.append(f"--- SOURCE: {current_url} ---")
+        blocks.append(chunk["text"])
+    return "\n\n".join(blocks)
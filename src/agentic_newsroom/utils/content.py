@@ -1,4 +1,8 @@
 import re
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Query parameters that only track the click and never change the page
+TRACKING_PARAMS = re.compile(r"^(utm_\w+|fbclid|gclid|mc_cid|mc_eid|ref|ref_src|cmpid|icid)$", re.IGNORECASE)
 
 def count_words(text: str) -> int:
     """
@@ -15,6 +19,37 @@ def count_words(text: str) -> int:
     return len(text.split())
 
 
+def _without_tracking(query: str) -> list:
+    return [(k, v) for k, v in parse_qsl(query, keep_blank_values=True) if not TRACKING_PARAMS.match(k)]
+
+
+def clean_url(url: str) -> str:
+    """
+    URL without tracking query parameters and fragment, otherwise unchanged.
+    """
+    parts = urlsplit(url.strip())
+    if not parts.netloc:
+        return url.strip()
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(_without_tracking(parts.query)), ""))
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical form of a URL for deduplication.
+
+    Drops the scheme, `www.`/`m.` host prefixes, fragments, tracking query
+    parameters and trailing slashes, so http/https, mobile and tracked
+    variants of the same page compare equal.
+    """
+    parts = urlsplit(url.strip())
+    if not parts.netloc:
+        return url.strip()
+    host = re.sub(r"^(www\d?|m|mobile)\.", "", parts.netloc.lower())
+    query = urlencode(sorted(_without_tracking(parts.query)))
+    path = re.sub(r"/+$", "", parts.path)
+    return urlunsplit(("", host, path, query, "")).lstrip("/")
+
+
 if __name__ == "__main__":
     
     test_text = """
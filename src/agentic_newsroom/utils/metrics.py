@@ -0,0 +1,350 @@
+"""
+Per-node run metrics: wall time, LLM token usage, Tavily credits, image calls
+and an estimated cost.
+
+Attach a MetricsCollector as a callback to any workflow or agent run:
+
+    metrics = MetricsCollector()
+    result = workflow.invoke(state, {"callbacks": [metrics]})
+    metrics.save(result["story_brief"].slug)
+    print(format_breakdown(metrics.summary()))
+
+LangGraph node runs are recognised from the callback metadata
+(`langgraph_node` and `langgraph_checkpoint_ns`), so nodes inside the agent subgraphs are
+attributed to the pipeline stage that ran them. Usage that LangChain callbacks
+can't see (Tavily, the image API) is reported by the tool code through
+record_usage().
+
+With `otel=True` and the `opentelemetry-api` package installed, every node and
+LLM call is also emitted as an OpenTelemetry span. Spans go to whatever tracer
+provider the application configured; without one they are no-ops.
+"""
+
+import json
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler, dispatch_custom_event
+
+from agentic_newsroom.schemas.base import get_project_root
+
+logger = logging.getLogger(__name__)
+
+# Name of the custom event carrying non-LLM usage
+USAGE_EVENT = "newsroom_usage"
+
+# USD per 1M tokens: (input, cached input, output). Matched by model name prefix.
+LLM_PRICES = {
+    "gpt-5": (1.25, 0.125, 10.00),
+    "gpt-5-mini": (0.25, 0.025, 2.00),
+    "gpt-5-nano": (0.05, 0.005, 0.40),
+}
+
+# USD per 1536x1024 image by quality
+IMAGE_PRICES = {"low": 0.016, "medium": 0.063, "high": 0.25}
+
+# USD per Tavily API credit (pay-as-you-go)
+TAVILY_CREDIT_PRICE = 0.008
+
+COUNTERS = (
+    "calls",
+    "wall_time_s",
+    "llm_calls",
+    "input_tokens",
+    "cached_input_tokens",
+    "output_tokens",
+    "reasoning_tokens",
+    "tavily_searches",
+    "tavily_extracted_urls",
+    "tavily_credits",
+    "images",
+    "cost_usd",
+)
+
+
+def record_usage(kind: str, **data: Any):
+    """Report tool usage (e.g. Tavily credits) to the metrics of the current run.
+
+    Does nothing when called outside a LangChain run, so tools keep working
+    when used on their own.
+    """
+    try:
+        dispatch_custom_event(USAGE_EVENT, {"kind": kind, **data})
+    except RuntimeError:
+        # No parent run to attach the event to
+        pass
+
+
+def llm_cost(model: str, input_tokens: int, cached_input_tokens: int, output_tokens: int) -> float:
+    """Estimated USD cost of one LLM call; 0 for models missing from LLM_PRICES."""
+    matches = [name for name in LLM_PRICES if model and model.startswith(name)]
+    if not matches:
+        return 0.0
+    input_price, cached_price, output_price = LLM_PRICES[max(matches, key=len)]
+    uncached = input_tokens - cached_input_tokens
+    return (uncached * input_price + cached_input_tokens * cached_price + output_tokens * output_price) / 1_000_000
+
+
+def _new_bucket() -> dict:
+    bucket = {name: 0 for name in COUNTERS}
+    bucket["wall_time_s"] = 0.0
+    bucket["cost_usd"] = 0.0
+    bucket["models"] = []
+    return bucket
+
+
+def _location(metadata: Optional[dict]) -> tuple:
+    """(namespace, stage, node) for a run, from LangGraph's callback metadata.
+
+    The namespace is unique per node task, e.g. "reporter:<id>|write_draft:<id>";
+    its first segment is the top-level pipeline stage.
+    """
+    metadata = metadata or {}
+    node = metadata.get("langgraph_node")
+    namespace = metadata.get("langgraph_checkpoint_ns") or ""
+    stage = namespace.split("|")[0].split(":")[0] or node
+    return namespace, stage, node
+
+
+def _get_tracer():
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        logger.warning("opentelemetry-api is not installed; spans are disabled")
+        return None
+    return trace.get_tracer("agentic_newsroom")
+
+
+class MetricsCollector(BaseCallbackHandler):
+    """Callback handler aggregating metrics per stage and per node.
+
+    Safe to share between the threads LangGraph runs parallel nodes on.
+    """
+
+    def __init__(self, otel: bool = False):
+        self._lock = threading.Lock()
+        self._stages: Dict[str, dict] = {}
+        self._nodes: Dict[UUID, dict] = {}
+        self._open_namespaces: Dict[str, UUID] = {}
+        self._llm_runs: Dict[UUID, dict] = {}
+        self._spans: Dict[str, Any] = {}
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+        self._tracer = _get_tracer() if otel else None
+
+    # --- Buckets ---
+
+    def _buckets(self, stage: Optional[str], node: Optional[str]) -> list:
+        """Stage bucket plus, for nodes inside a subgraph, the node's own bucket."""
+        stage = stage or "other"
+        stage_bucket = self._stages.setdefault(stage, {**_new_bucket(), "nodes": {}})
+        if not node or node == stage:
+            return [stage_bucket]
+        return [stage_bucket, stage_bucket["nodes"].setdefault(node, _new_bucket())]
+
+    def _add(self, stage: Optional[str], node: Optional[str], **amounts):
+        for bucket in self._buckets(stage, node):
+            for name, amount in amounts.items():
+                bucket[name] += amount
+
+    # --- Spans ---
+
+    def _start_span(self, name: str, parent_namespace: Optional[str], attributes: dict):
+        if self._tracer is None:
+            return None
+        from opentelemetry import trace
+
+        parent = self._spans.get(parent_namespace) if parent_namespace else None
+        context = trace.set_span_in_context(parent) if parent is not None else None
+        return self._tracer.start_span(name, context=context, attributes=attributes)
+
+    @staticmethod
+    def _end_span(span, error: Optional[BaseException] = None, **attributes):
+        if span is None:
+            return
+        for key, value in attributes.items():
+            span.set_attribute(key, value)
+        if error is not None:
+            span.record_exception(error)
+            from opentelemetry.trace import Status, StatusCode
+
+            span.set_status(Status(StatusCode.ERROR, str(error)))
+        span.end()
+
+    # --- Node runs ---
+
+    def on_chain_start(self, serialized, inputs, *, run_id: UUID, parent_run_id=None, tags=None, metadata=None, **kwargs):
+        namespace, stage, node = _location(metadata)
+        # Only the node's own run (runnables inside the node share its namespace),
+        # and not LangGraph's internal __start__ routing step
+        if not node or node.startswith("__") or kwargs.get("name") != node:
+            return
+
+        with self._lock:
+            if namespace in self._open_namespaces:
+                return
+            now = time.perf_counter()
+            if self._started_at is None:
+                self._started_at = now
+            parent_namespace = namespace.rsplit("|", 1)[0] if "|" in namespace else None
+            span = self._start_span(node, parent_namespace, {"newsroom.stage": stage, "newsroom.node": node})
+            if span is not None:
+                self._spans[namespace] = span
+            self._open_namespaces[namespace] = run_id
+            self._nodes[run_id] = {"namespace": namespace, "stage": stage, "node": node, "start": now, "span": span}
+
+    def _finish_node(self, run_id: UUID, error: Optional[BaseException] = None):
+        with self._lock:
+            run = self._nodes.pop(run_id, None)
+            if run is None:
+                return
+            now = time.perf_counter()
+            self._finished_at = now
+            elapsed = now - run["start"]
+            self._open_namespaces.pop(run["namespace"], None)
+            self._spans.pop(run["namespace"], None)
+            # A stage's own run already spans its nodes, so time goes to one bucket only
+            bucket = self._buckets(run["stage"], run["node"])[-1]
+            bucket["calls"] += 1
+            bucket["wall_time_s"] += elapsed
+        self._end_span(run["span"], error, **{"newsroom.wall_time_s": elapsed})
+
+    def on_chain_end(self, outputs, *, run_id: UUID, **kwargs):
+        self._finish_node(run_id)
+
+    def on_chain_error(self, error, *, run_id: UUID, **kwargs):
+        self._finish_node(run_id, error)
+
+    # --- LLM calls ---
+
+    def _start_llm(self, serialized, run_id: UUID, metadata: Optional[dict], kwargs: dict):
+        namespace, stage, node = _location(metadata)
+        invocation_params = kwargs.get("invocation_params") or {}
+        model = (metadata or {}).get("ls_model_name") or invocation_params.get("model") or invocation_params.get("model_name")
+        with self._lock:
+            span = self._start_span("llm", namespace, {"newsroom.stage": stage or "", "newsroom.node": node or "", "llm.model": model or ""})
+            self._llm_runs[run_id] = {"stage": stage, "node": node, "model": model, "span": span}
+
+    def on_chat_model_start(self, serialized, messages, *, run_id: UUID, parent_run_id=None, tags=None, metadata=None, **kwargs):
+        self._start_llm(serialized, run_id, metadata, kwargs)
+
+    def on_llm_start(self, serialized, prompts, *, run_id: UUID, parent_run_id=None, tags=None, metadata=None, **kwargs):
+        self._start_llm(serialized, run_id, metadata, kwargs)
+
+    def on_llm_end(self, response, *, run_id: UUID, **kwargs):
+        with self._lock:
+            run = self._llm_runs.pop(run_id, None)
+        if run is None:
+            return
+
+        model = (response.llm_output or {}).get("model_name") or run["model"]
+        input_tokens = cached = output_tokens = reasoning = 0
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None) or {}
+                input_tokens += usage.get("input_tokens", 0)
+                output_tokens += usage.get("output_tokens", 0)
+                cached += (usage.get("input_token_details") or {}).get("cache_read", 0) or 0
+                reasoning += (usage.get("output_token_details") or {}).get("reasoning", 0) or 0
+
+        cost = llm_cost(model, input_tokens, cached, output_tokens)
+        with self._lock:
+            self._add(
+                run["stage"], run["node"],
+                llm_calls=1, input_tokens=input_tokens, cached_input_tokens=cached,
+                output_tokens=output_tokens, reasoning_tokens=reasoning, cost_usd=cost,
+            )
+            for bucket in self._buckets(run["stage"], run["node"]):
+                if model and model not in bucket["models"]:
+                    bucket["models"].append(model)
+
+        self._end_span(
+            run["span"],
+            **{"llm.model": model or "", "llm.input_tokens": input_tokens, "llm.cached_input_tokens": cached,
+               "llm.output_tokens": output_tokens, "llm.reasoning_tokens": reasoning},
+        )
+
+    def on_llm_error(self, error, *, run_id: UUID, **kwargs):
+        with self._lock:
+            run = self._llm_runs.pop(run_id, None)
+        if run is not None:
+            self._end_span(run["span"], error)
+
+    # --- Tool usage ---
+
+    def on_custom_event(self, name: str, data: Any, *, run_id: UUID, tags=None, metadata=None, **kwargs):
+        if name != USAGE_EVENT:
+            return
+        _, stage, node = _location(metadata)
+        kind = data.get("kind")
+
+        with self._lock:
+            if kind == "tavily_search":
+                credits = data.get("credits", 0)
+                self._add(stage, node, tavily_searches=data.get("calls", 0), tavily_credits=credits,
+                          cost_usd=credits * TAVILY_CREDIT_PRICE)
+            elif kind == "tavily_extract":
+                credits = data.get("credits", 0)
+                self._add(stage, node, tavily_extracted_urls=data.get("urls", 0), tavily_credits=credits,
+                          cost_usd=credits * TAVILY_CREDIT_PRICE)
+            elif kind == "image":
+                self._add(stage, node, images=1, cost_usd=IMAGE_PRICES.get(data.get("quality"), 0.0))
+                for bucket in self._buckets(stage, node):
+                    if data.get("model") and data["model"] not in bucket["models"]:
+                        bucket["models"].append(data["model"])
+
+    # --- Output ---
+
+    def summary(self) -> dict:
+        """Metrics as a JSON-serializable dict: totals plus per-stage and per-node buckets."""
+        with self._lock:
+            stages = json.loads(json.dumps(self._stages))
+            started, finished = self._started_at, self._finished_at
+
+        total = _new_bucket()
+        for stage in stages.values():
+            for name in COUNTERS:
+                total[name] += stage[name]
+            total["models"] += [m for m in stage["models"] if m not in total["models"]]
+        # Parallel stages overlap, so the run's wall time isn't the sum of the stages
+        total["wall_time_s"] = (finished - started) if started is not None and finished is not None else 0.0
+
+        for bucket in [total, *stages.values(), *(n for s in stages.values() for n in s["nodes"].values())]:
+            bucket["wall_time_s"] = round(bucket["wall_time_s"], 3)
+            bucket["cost_usd"] = round(bucket["cost_usd"], 6)
+
+        return {"total": total, "stages": stages}
+
+    def save(self, slug: str) -> str:
+        """Write the summary to artifacts/<slug>/metrics.json and return the path."""
+        path = get_project_root() / "artifacts" / slug / "metrics.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.summary(), indent=2), encoding="utf-8")
+        logger.info(f"  Metrics saved to: artifacts/{slug}/metrics.json")
+        return str(path)
+
+
+def format_breakdown(summary: dict) -> str:
+    """Render a summary() as a per-stage / per-node text table."""
+    header = (
+        f"{'Stage / node':<32}{'Time (s)':>10}{'LLM':>6}{'Tokens in':>12}{'Cached in':>12}{'Tokens out':>12}"
+        f"{'Tavily cr.':>12}{'Images':>8}{'Cost ($)':>10}"
+    )
+
+    def row(label: str, b: dict) -> str:
+        return (
+            f"{label:<32}{b['wall_time_s']:>10.1f}{b['llm_calls']:>6}{b['input_tokens']:>12,}{b['cached_input_tokens']:>12,}"
+            f"{b['output_tokens']:>12,}{b['tavily_credits']:>12}{b['images']:>8}{b['cost_usd']:>10.4f}"
+        )
+
+    lines = [header, "-" * len(header)]
+    for stage, bucket in summary["stages"].items():
+        lines.append(row(stage, bucket))
+        for node, node_bucket in bucket["nodes"].items():
+            lines.append(row(f"  {node}", node_bucket))
+    lines.append("-" * len(header))
+    lines.append(row("TOTAL", summary["total"]))
+    return "\n".join(lines)
@@ -0,0 +1,61 @@
+"""
+Relevance-filtered research context for the reporter.
+
+A research package from a long research run can be tens of thousands of
+tokens, most of it unrelated to any single key question. Rather than putting
+the whole package in every reporter prompt, select_research ranks its items
+with BM25 against a set of queries (the key questions when drafting, the key
+questions and draft paragraphs when fact-checking) and packs the top items of
+each query into a token budget. A package that already fits is used whole.
+"""
+
+import logging
+import os
+from typing import List
+
+from agentic_newsroom.schemas.models import SearchResult
+from agentic_newsroom.utils.chunking import bm25_scorer, count_tokens
+
+logger = logging.getLogger(__name__)
+
+RESEARCH_TOKEN_BUDGET = int(os.getenv("REPORTER_RESEARCH_TOKEN_BUDGET", "12000"))
+
+
+def _item_text(item: SearchResult) -> str:
+    return f"{item.source}\n{item.relevance}\n{item.content}"
+
+
+def select_research(results: List[SearchResult], queries: List[str], per_query: int, token_budget: int) -> List[SearchResult]:
+    """Pick the research items most relevant to the queries that fit in `token_budget`.
+
+    Each query contributes up to `per_query` items that match it at all. The
+    budget is filled round-robin by rank, every query's best item before any
+    query's second best, so one broad query can't crowd out the others.
+    Selected items are returned in package order.
+    """
+    texts = [_item_text(item) for item in results]
+    tokens = [count_tokens(text) for text in texts]
+    total = sum(tokens)
+    if total <= token_budget:
+        return list(results)
+
+    score = bm25_scorer(texts)
+    rankings = []
+    for query in queries:
+        scores = score(query)
+        ranked = sorted((i for i, s in enumerate(scores) if s > 0), key=lambda i: scores[i], reverse=True)
+        rankings.append(ranked[:per_query])
+
+    selected, used = set(), 0
+    for rank in range(per_query):
+        for ranked in rankings:
+            if rank >= len(ranked) or ranked[rank] in selected:
+                continue
+            i = ranked[rank]
+            if used + tokens[i] > token_budget:
+                continue
+            selected.add(i)
+            used += tokens[i]
+
+    logger.info(f"  Research context: {len(selected)}/{len(results)} items ({used}/{total} tokens) for {len(queries)} queries")
+    return [results[i] for i in sorted(selected)]
@@ -0,0 +1,99 @@
+"""
+Append-only on-disk log of a research run, under artifacts/<slug>/research/.
+
+items.jsonl receives every SearchResult as soon as its source is analyzed,
+tagged with the turn that found it. turns.jsonl receives one record when a
+turn completes, and a final marker once the research package is saved.
+
+Only items of completed turns count. A run killed mid-turn therefore resumes
+from the last completed turn and redoes the interrupted one, and the package
+can be built by streaming the log instead of holding every item in memory.
+"""
+
+import json
+import logging
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from agentic_newsroom.schemas.base import get_project_root
+from agentic_newsroom.schemas.models import SearchResult
+
+logger = logging.getLogger(__name__)
+
+# Parallel analyze_source tasks append to the same file
+_file_locks = defaultdict(threading.Lock)
+
+
+def _read_jsonl(path: Path) -> Iterator[dict]:
+    """Yield records, skipping a line left incomplete by a crash."""
+    if not path.exists():
+        return
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"  Skipping incomplete line in {path}")
+
+
+class ResearchLog:
+    """Research log of one article.
+
+    Args:
+        slug: The article slug.
+    """
+
+    def __init__(self, slug: str):
+        self.dir = get_project_root() / "artifacts" / slug / "research"
+        self.items_path = self.dir / "items.jsonl"
+        self.turns_path = self.dir / "turns.jsonl"
+
+    def _append(self, path: Path, records: List[dict]):
+        if not records:
+            return
+        self.dir.mkdir(parents=True, exist_ok=True)
+        lines = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records)
+        with _file_locks[str(path)]:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(lines)
+
+    def reset(self):
+        """Start a fresh log."""
+        for path in (self.items_path, self.turns_path):
+            path.unlink(missing_ok=True)
+
+    def rollback(self, last_turn: int):
+        """Drop items logged by turns after `last_turn`, i.e. by a turn that never completed."""
+        kept = [r for r in _read_jsonl(self.items_path) if r.get("turn", 0) <= last_turn]
+        tmp_path = self.items_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(r, ensure_ascii=False) + "\n" for r in kept)
+        tmp_path.replace(self.items_path)
+
+    def append_items(self, turn: int, items: List[SearchResult]):
+        self._append(self.items_path, [{"turn": turn, **item.model_dump()} for item in items])
+
+    def complete_turn(self, record: dict):
+        """Mark a turn complete. `record` holds what's needed to resume after it."""
+        self._append(self.turns_path, [record])
+
+    def finalize(self):
+        """Mark the research as finished, so the next run starts over."""
+        self._append(self.turns_path, [{"finalized": True}])
+
+    def resumable_turns(self) -> List[dict]:
+        """Records of the completed turns of an unfinished run, oldest first."""
+        turns = list(_read_jsonl(self.turns_path))
+        if any(t.get("finalized") for t in turns):
+            return []
+        return turns
+
+    def iter_items(self, last_turn: Optional[int] = None) -> Iterator[SearchResult]:
+        """Stream the logged items, up to and including `last_turn` if given."""
+        for record in _read_jsonl(self.items_path):
+            turn = record.pop("turn", 0)
+            if last_turn is not None and turn > last_turn:
+                continue
+            yield SearchResult(**record)
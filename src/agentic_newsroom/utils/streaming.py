@@ -0,0 +1,150 @@
+"""
+Live console output for a streamed workflow run.
+
+StreamPrinter consumes what `workflow.stream(..., stream_mode=STREAM_MODES,
+subgraphs=True)` yields: it prints a line as each pipeline stage and each node
+inside an agent finishes, and echoes the article text of write_draft and
+polish_article while the model is still generating it.
+
+Those nodes request structured output, so their tokens arrive as JSON. The
+text field's string value is decoded incrementally as the JSON grows (a
+partial-JSON parser would re-read the whole response on every token). The
+nodes still parse the complete response into a DraftPackage or FinalArticle
+when the call finishes, so streaming changes nothing downstream.
+"""
+
+import json
+import re
+import sys
+from typing import Any, TextIO
+
+from langchain_core.messages import BaseMessage
+
+STREAM_MODES = ["updates", "messages"]
+
+# Nodes whose text is echoed as it is generated, with the output field holding it
+STREAMED_FIELDS = {
+    "write_draft": "full_draft",
+    "polish_article": "article",
+}
+
+
+def _json_text(message: BaseMessage) -> str:
+    """The JSON text carried by a streamed chunk: tool call arguments, or the content."""
+    tool_call_chunks = getattr(message, "tool_call_chunks", None)
+    if tool_call_chunks:
+        return "".join(chunk.get("args") or "" for chunk in tool_call_chunks)
+    if isinstance(message.content, str):
+        return message.content
+    return "".join(
+        block.get("text", "") for block in message.content
+        if isinstance(block, dict) and block.get("type") == "text"
+    )
+
+
+class FieldReader:
+    """Decode one string field of a JSON object while the JSON is still arriving.
+
+    Args:
+        field: Name of the field to read.
+    """
+
+    def __init__(self, field: str):
+        self._start = re.compile(r'"%s"\s*:\s*"' % re.escape(field))
+        self._buffer = ""
+        self._pos = None  # where decoding continues, once the field's value has started
+        self.done = False
+
+    def feed(self, text: str) -> str:
+        """Add more JSON text and return the newly decoded part of the field's value."""
+        self._buffer += text
+        if self.done:
+            return ""
+        if self._pos is None:
+            match = self._start.search(self._buffer)
+            if not match:
+                return ""
+            self._pos = match.end()
+
+        decoded, buffer, pos = [], self._buffer, self._pos
+        while pos < len(buffer):
+            char = buffer[pos]
+            if char == '"':
+                self.done = True
+                break
+            if char != "\\":
+                decoded.append(char)
+                pos += 1
+                continue
+            # Escape sequence: wait until it is complete. A high surrogate needs its low half too.
+            length = 6 if buffer[pos + 1:pos + 2] == "u" else 2
+            if length == 6 and buffer[pos + 2:pos + 4].lower() in ("d8", "d9", "da", "db"):
+                length = 12
+            if pos + length > len(buffer):
+                break
+            decoded.append(json.loads(f'"{buffer[pos:pos + length]}"'))
+            pos += length
+        self._pos = pos
+        return "".join(decoded)
+
+
+class StreamPrinter:
+    """Print progress and streamed article text from workflow stream chunks.
+
+    Args:
+        out: Where to print (default: stdout).
+    """
+
+    def __init__(self, out: TextIO = None):
+        self.out = out or sys.stdout
+        self._readers = {}  # message id -> FieldReader of the message's text field
+        self._open_node = None  # node whose text is being printed, if any
+
+    def _write(self, text: str):
+        self.out.write(text)
+        self.out.flush()
+
+    def _close_text(self):
+        if self._open_node:
+            self._write("\n\n")
+            self._open_node = None
+
+    def handle(self, chunk: tuple):
+        """Handle one (namespace, mode, data) item of the stream."""
+        namespace, mode, data = chunk
+        if mode == "updates":
+            self._on_update(namespace, data)
+        elif mode == "messages":
+            message, metadata = data
+            self._on_message(message, metadata)
+
+    def _on_update(self, namespace: tuple, update: Any):
+        if not isinstance(update, dict):
+            return
+        for node in update:
+            if node.startswith("__"):
+                continue
+            self._close_text()
+            if namespace:
+                # e.g. ("reporter:<task id>",) for a node of the reporter's graph
+                agent = namespace[-1].split(":")[0]
+                self._write(f"      {agent} / {node} done\n")
+            else:
+                self._write(f"   -> {node} complete\n")
+
+    def _on_message(self, message: BaseMessage, metadata: dict):
+        node = metadata.get("langgraph_node")
+        field = STREAMED_FIELDS.get(node)
+        if field is None:
+            return
+
+        reader = self._readers.setdefault(message.id or node, FieldReader(field))
+        text = reader.feed(_json_text(message))
+        if not text:
+            return
+
+        if self._open_node != node:
+            self._close_text()
+            self._write(f"\n--- {node} ---\n\n")
+            self._open_node = node
+        self._write(text)
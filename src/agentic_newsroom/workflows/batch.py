@@ -0,0 +1,224 @@
+"""
+Batch runner for the newsroom workflow.
+
+Reads article ideas as JSONL, runs each one through the full pipeline with a
+bounded number of concurrent workflows and streams one JSONL result line per
+idea as soon as it finishes. A failing idea is reported as an error line and
+never stops the rest of the batch.
+
+Input lines may be either a JSON object with an `article_idea` field (plus an
+optional `id`) or a bare JSON string:
+
+    {"id": "socotra", "article_idea": "The dragon blood trees of Socotra Island"}
+    "Deep sea hydrothermal vents and their unique ecosystems"
+"""
+
+import asyncio
+import json
+import logging
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, Optional, TextIO
+
+from agentic_newsroom.utils.metrics import MetricsCollector
+from agentic_newsroom.workflows.newsroom_workflow import build_newsroom_workflow
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 4
+
+
+def read_ideas(lines: Iterable[str]) -> Iterator[dict]:
+    """Parse JSONL input into idea records.
+
+    Every non-empty line yields a record with its 1-based `line` number.
+    Lines that can't be parsed yield a record with an `error` instead of an
+    `article_idea`, so they are reported in the output rather than dropped.
+    """
+    for line_no, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield {"line": line_no, "id": None, "error": f"Invalid JSON: {e}"}
+            continue
+
+        if isinstance(data, str):
+            data = {"article_idea": data}
+
+        if not isinstance(data, dict) or not str(data.get("article_idea") or "").strip():
+            yield {"line": line_no, "id": None, "error": "Missing 'article_idea'"}
+            continue
+
+        yield {"line": line_no, "id": data.get("id"), "article_idea": data["article_idea"]}
+
+
+def _summarize(record: dict, result: dict, elapsed: float, metrics: MetricsCollector) -> dict:
+    """Build the output line for a finished workflow run and save its metrics."""
+    story_brief = result.get("story_brief")
+    final_article = result.get("final_article")
+    approval = result.get("approval")
+    total = metrics.summary()["total"]
+    if story_brief:
+        metrics.save(story_brief.slug)
+
+    return {
+        "line": record["line"],
+        "id": record["id"],
+        "article_idea": record["article_idea"],
+        "status": "ok",
+        "slug": story_brief.slug if story_brief else None,
+        "title": final_article.title if final_article else None,
+        "approved": approval.approved if approval else None,
+        "hero_image_path": result.get("hero_image_path"),
+        "elapsed_s": round(elapsed, 2),
+        "tokens": total["input_tokens"] + total["output_tokens"],
+        "cached_tokens": total["cached_input_tokens"],
+        "cost_usd": round(total["cost_usd"], 4),
+    }
+
+
+def _failure(record: dict, error: str, elapsed: float = 0.0) -> dict:
+    """Build the output line for an idea that failed or couldn't be parsed."""
+    return {
+        "line": record["line"],
+        "id": record["id"],
+        "article_idea": record.get("article_idea"),
+        "status": "error",
+        "error": error,
+        "elapsed_s": round(elapsed, 2),
+    }
+
+
+def _with_metrics(config: Optional[dict], otel: bool) -> tuple:
+    """Attach a fresh MetricsCollector to a copy of `config`."""
+    metrics = MetricsCollector(otel=otel)
+    config = config or {}
+    return {**config, "callbacks": [*(config.get("callbacks") or []), metrics]}, metrics
+
+
+def run_idea(workflow, record: dict, config: Optional[dict] = None, otel: bool = False) -> dict:
+    """Run a single idea through the workflow and return its output line."""
+    if "error" in record:
+        return _failure(record, record["error"])
+
+    config, metrics = _with_metrics(config, otel)
+
+    logger.info(f"[line {record['line']}] Starting: {record['article_idea'][:80]}")
+    start = time.perf_counter()
+    try:
+        result = workflow.invoke({"article_idea": record["article_idea"]}, config)
+    except Exception as e:
+        elapsed = time.perf_counter() - start
+        logger.exception(f"[line {record['line']}] Failed after {elapsed:.1f}s")
+        return _failure(record, f"{type(e).__name__}: {e}", elapsed)
+
+    elapsed = time.perf_counter() - start
+    logger.info(f"[line {record['line']}] Finished in {elapsed:.1f}s")
+    return _summarize(record, result, elapsed, metrics)
+
+
+async def arun_idea(workflow, record: dict, config: Optional[dict] = None, otel: bool = False) -> dict:
+    """Async version of run_idea using the workflow's ainvoke path."""
+    if "error" in record:
+        return _failure(record, record["error"])
+
+    config, metrics = _with_metrics(config, otel)
+
+    logger.info(f"[line {record['line']}] Starting: {record['article_idea'][:80]}")
+    start = time.perf_counter()
+    try:
+        result = await workflow.ainvoke({"article_idea": record["article_idea"]}, config)
+    except Exception as e:
+        elapsed = time.perf_counter() - start
+        logger.exception(f"[line {record['line']}] Failed after {elapsed:.1f}s")
+        return _failure(record, f"{type(e).__name__}: {e}", elapsed)
+
+    elapsed = time.perf_counter() - start
+    logger.info(f"[line {record['line']}] Finished in {elapsed:.1f}s")
+    return _summarize(record, result, elapsed, metrics)
+
+
+def run_batch(
+    lines: Iterable[str],
+    output: TextIO,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    workflow=None,
+    config: Optional[dict] = None,
+    otel: bool = False,
+) -> dict:
+    """Run every idea in `lines` and stream JSONL results to `output`.
+
+    Results are written in completion order, one line per idea, and flushed
+    immediately so a partially finished batch is still usable. Each article's
+    metrics are saved to artifacts/<slug>/metrics.json.
+
+    Returns:
+        Counts of `total`, `ok` and `error` results.
+    """
+    workflow = workflow or build_newsroom_workflow()
+    write_lock = threading.Lock()
+    counts = {"total": 0, "ok": 0, "error": 0}
+
+    def process(record: dict):
+        out = run_idea(workflow, record, config, otel)
+        with write_lock:
+            output.write(json.dumps(out, ensure_ascii=False) + "\n")
+            output.flush()
+            counts["total"] += 1
+            counts[out["status"]] += 1
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        # Consume results so unexpected errors in process() surface here
+        for _ in pool.map(process, read_ideas(lines)):
+            pass
+
+    logger.info(f"Batch complete: {counts['ok']} ok, {counts['error']} failed, {counts['total']} total")
+    return counts
+
+
+async def arun_batch(
+    lines: Iterable[str],
+    output: TextIO,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    workflow=None,
+    config: Optional[dict] = None,
+    otel: bool = False,
+) -> dict:
+    """Async version of run_batch.
+
+    All ideas share one event loop; a semaphore caps how many workflows are
+    in flight, so concurrency is no longer bounded by a thread per article.
+    """
+    workflow = workflow or build_newsroom_workflow()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    counts = {"total": 0, "ok": 0, "error": 0}
+
+    async def process(record: dict):
+        async with semaphore:
+            out = await arun_idea(workflow, record, config, otel)
+        # Single-threaded event loop: no lock needed around the write
+        output.write(json.dumps(out, ensure_ascii=False) + "\n")
+        output.flush()
+        counts["total"] += 1
+        counts[out["status"]] += 1
+
+    await asyncio.gather(*(process(record) for record in read_ideas(lines)))
+
+    logger.info(f"Batch complete: {counts['ok']} ok, {counts['error']} failed, {counts['total']} total")
+    return counts
+
+
+def open_input(path: str) -> TextIO:
+    """Open a batch input path, with '-' meaning stdin."""
+    return sys.stdin if path == "-" else open(path, "r", encoding="utf-8")
+
+
+def open_output(path: Optional[str]) -> TextIO:
+    """Open a batch output path, with '-' or None meaning stdout."""
+    return sys.stdout if path in (None, "-") else open(path, "a", encoding="utf-8")
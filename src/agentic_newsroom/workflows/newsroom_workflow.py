@@ -1,101 +1,293 @@
+from contextlib import contextmanager, asynccontextmanager
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+from langchain_core.runnables import RunnableLambda
 from langgraph.graph import START, END, StateGraph
+from agentic_newsroom.schemas import models
+from agentic_newsroom.schemas.base import get_project_root
+from agentic_newsroom.schemas.models import StoryBrief, ResearchPackage, DraftPackage, FinalArticle, PublicationApproval
 from agentic_newsroom.schemas.states import NewsroomState
 from agentic_newsroom.agents.assignment_editor import build_assignment_editor_graph
-from agentic_newsroom.agents.research_assistant import build_research_assistant_graph, DEFAULT_MAX_TURNS
+from agentic_newsroom.agents.research_assistant import build_research_assistant_graph
 from agentic_newsroom.agents.reporter import build_reporter_graph
 from agentic_newsroom.agents.copy_editor import build_copy_editor_graph
 from agentic_newsroom.agents.graphic_desk import build_graphic_desk_graph
 from agentic_newsroom.agents.editor_in_chief import build_editor_in_chief_graph
 
-# Build subgraphs
-assignment_editor_graph = build_assignment_editor_graph()
-research_assistant_graph = build_research_assistant_graph()
-reporter_graph = build_reporter_graph()
-copy_editor_graph = build_copy_editor_graph()
-graphic_desk_graph = build_graphic_desk_graph()
-editor_in_chief_graph = build_editor_in_chief_graph()
+# Subgraphs are compiled lazily, the first time a stage runs
+SUBGRAPH_BUILDERS = {
+    "assignment_editor": build_assignment_editor_graph,
+    "research_assistant": build_research_assistant_graph,
+    "reporter": build_reporter_graph,
+    "copy_editor": build_copy_editor_graph,
+    "graphic_desk": build_graphic_desk_graph,
+    "editor_in_chief": build_editor_in_chief_graph,
+}
+
+
+@lru_cache(maxsize=None)
+def get_subgraph(name: str):
+    """Compile an agent's graph on first use and reuse it afterwards."""
+    return SUBGRAPH_BUILDERS[name]()
 
 
 def run_assignment_editor(state: NewsroomState):
     """Run assignment editor to create story brief from article idea."""
-    result = assignment_editor_graph.invoke(state)
+    result = get_subgraph("assignment_editor").invoke(state)
     return {"story_brief": result["story_brief"]}
 
 
-def run_research_assistant(state: NewsroomState):
-    """Run research assistant to gather material for the story."""
-    initial_research_state = {
+async def arun_assignment_editor(state: NewsroomState):
+    result = await get_subgraph("assignment_editor").ainvoke(state)
+    return {"story_brief": result["story_brief"]}
+
+
+def _research_state(state: NewsroomState) -> dict:
+    return {
         "story_brief": state["story_brief"],
-        "max_turns": DEFAULT_MAX_TURNS,
         "current_turn": 0,
-        "context": [],
-        "search_results": []
+        "context": []
     }
-    result = research_assistant_graph.invoke(initial_research_state)
+
+
+def run_research_assistant(state: NewsroomState):
+    """Run research assistant to gather material for the story."""
+    result = get_subgraph("research_assistant").invoke(_research_state(state))
     return {"research_package": result["research_package"]}
 
 
-def run_reporter(state: NewsroomState):
-    """Run reporter to write the article draft."""
-    reporter_state = {
+async def arun_research_assistant(state: NewsroomState):
+    result = await get_subgraph("research_assistant").ainvoke(_research_state(state))
+    return {"research_package": result["research_package"]}
+
+
+def _reporter_state(state: NewsroomState) -> dict:
+    return {
         "story_brief": state["story_brief"],
         "research_package": state["research_package"],
     }
-    result = reporter_graph.invoke(reporter_state)
+
+
+def run_reporter(state: NewsroomState):
+    """Run reporter to write the article draft."""
+    result = get_subgraph("reporter").invoke(_reporter_state(state))
     return {"draft_package": result["draft_package"]}
 
 
-def run_copy_editor(state: NewsroomState):
-    """Run copy editor to polish the draft into final article."""
-    copy_editor_state = {
+async def arun_reporter(state: NewsroomState):
+    result = await get_subgraph("reporter").ainvoke(_reporter_state(state))
+    return {"draft_package": result["draft_package"]}
+
+
+def _copy_editor_state(state: NewsroomState) -> dict:
+    return {
         "story_brief": state["story_brief"],
         "draft_package": state["draft_package"]
     }
-    result = copy_editor_graph.invoke(copy_editor_state)
+
+
+def run_copy_editor(state: NewsroomState):
+    """Run copy editor to polish the draft into final article."""
+    result = get_subgraph("copy_editor").invoke(_copy_editor_state(state))
     return {"final_article": result["final_article"]}
 
 
-def run_graphic_desk(state: NewsroomState):
-    """Run graphic desk to generate hero image."""
-    graphic_state = {
+async def arun_copy_editor(state: NewsroomState):
+    result = await get_subgraph("copy_editor").ainvoke(_copy_editor_state(state))
+    return {"final_article": result["final_article"]}
+
+
+def _final_article_state(state: NewsroomState) -> dict:
+    return {
         "story_brief": state["story_brief"],
         "final_article": state["final_article"]
     }
-    result = graphic_desk_graph.invoke(graphic_state)
+
+
+def run_graphic_desk(state: NewsroomState):
+    """Run graphic desk to generate hero image."""
+    result = get_subgraph("graphic_desk").invoke(_final_article_state(state))
+    return {"hero_image_path": result.get("hero_image_path")}
+
+
+async def arun_graphic_desk(state: NewsroomState):
+    result = await get_subgraph("graphic_desk").ainvoke(_final_article_state(state))
     return {"hero_image_path": result.get("hero_image_path")}
 
 
 def run_editor_in_chief(state: NewsroomState):
     """Run editor in chief to review and approve the article."""
-    eic_state = {
-        "story_brief": state["story_brief"],
-        "final_article": state["final_article"]
-    }
-    result = editor_in_chief_graph.invoke(eic_state)
+    result = get_subgraph("editor_in_chief").invoke(_final_article_state(state))
+    return {"approval": result["approval"]}
+
+
+async def arun_editor_in_chief(state: NewsroomState):
+    result = await get_subgraph("editor_in_chief").ainvoke(_final_article_state(state))
     return {"approval": result["approval"]}
 
 
-def build_newsroom_workflow():
+# Pipeline stages in run order, with the state key each one produces
+STAGE_OUTPUTS = {
+    "assignment_editor": "story_brief",
+    "research_assistant": "research_package",
+    "reporter": "draft_package",
+    "copy_editor": "final_article",
+    "graphic_desk": "hero_image_path",
+    "editor_in_chief": "approval",
+}
+STAGES = list(STAGE_OUTPUTS)
+
+# Stages that run in parallel after copy_editor
+FINAL_STAGES = ("graphic_desk", "editor_in_chief")
+
+
+def route_start(state: NewsroomState):
+    """Enter the pipeline at the first stage whose output isn't in the state yet.
+
+    A fresh run starts at assignment_editor; a resumed run skips every stage
+    whose output was preloaded from artifacts.
+    """
+    for stage in STAGES:
+        if stage in FINAL_STAGES:
+            break
+        if not state.get(STAGE_OUTPUTS[stage]):
+            return stage
+
+    pending = [stage for stage in FINAL_STAGES if not state.get(STAGE_OUTPUTS[stage])]
+    return pending or END
+
+
+def _load_hero_image_path(slug: str) -> str:
+    image_path = get_project_root() / "artifacts" / slug / "graphics" / "hero_image.png"
+    if not image_path.exists():
+        raise FileNotFoundError(f"No hero image found for slug '{slug}' at {image_path}")
+    return str(image_path)
+
+
+STAGE_LOADERS = {
+    "assignment_editor": StoryBrief.load,
+    "research_assistant": ResearchPackage.load,
+    "reporter": DraftPackage.load,
+    "copy_editor": FinalArticle.load,
+    "graphic_desk": _load_hero_image_path,
+    "editor_in_chief": PublicationApproval.load,
+}
+
+
+def load_resume_state(slug: str, from_stage: Optional[str] = None) -> dict:
+    """Build a workflow input from the artifacts saved under artifacts/<slug>/.
+
+    Stages are loaded in order until the first missing artifact (or until
+    `from_stage`, which is then recomputed along with everything after it).
+    Outputs of stages that will be recomputed are set to None explicitly so
+    they also replace any values left in a checkpointed thread.
+
+    Raises:
+        FileNotFoundError: If there is no story brief for the slug.
+        ValueError: If `from_stage` isn't a known stage.
+    """
+    if from_stage is not None and from_stage not in STAGES:
+        raise ValueError(f"Unknown stage '{from_stage}', expected one of {STAGES}")
+    if from_stage == "assignment_editor":
+        raise ValueError("Cannot resume from assignment_editor: the original article idea isn't saved")
+
+    state = {key: None for key in STAGE_OUTPUTS.values()}
+    stop = STAGES.index(from_stage) if from_stage else len(STAGES)
+
+    for stage in STAGES[:stop]:
+        try:
+            state[STAGE_OUTPUTS[stage]] = STAGE_LOADERS[stage](slug)
+        except FileNotFoundError:
+            if stage == "assignment_editor":
+                raise
+            # Later sequential stages depend on this one, so stop here. The
+            # parallel final stages don't depend on each other.
+            if stage not in FINAL_STAGES:
+                break
+
+    state["article_idea"] = state["story_brief"].topic
+    return state
+
+
+def get_checkpoint_path() -> Path:
+    """SQLite file holding the workflow checkpoints."""
+    artifacts_dir = get_project_root() / "artifacts"
+    artifacts_dir.mkdir(parents=True, exist_ok=True)
+    return artifacts_dir / "checkpoints.sqlite"
+
+
+def _checkpoint_serde():
+    """Checkpoint serializer that may load the newsroom's own schema types."""
+    from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+    allowed = [
+        (models.__name__, name)
+        for name, obj in vars(models).items()
+        if isinstance(obj, type) and obj.__module__ == models.__name__
+    ]
+    return JsonPlusSerializer(allowed_msgpack_modules=allowed)
+
+
+@contextmanager
+def sqlite_checkpointer(path: Optional[Path] = None):
+    """Open a SQLite-backed checkpointer for sync runs."""
+    import sqlite3
+    from langgraph.checkpoint.sqlite import SqliteSaver
+
+    conn = sqlite3.connect(str(path or get_checkpoint_path()), check_same_thread=False)
+    try:
+        yield SqliteSaver(conn, serde=_checkpoint_serde())
+    finally:
+        conn.close()
+
+
+@asynccontextmanager
+async def async_sqlite_checkpointer(path: Optional[Path] = None):
+    """Open a SQLite-backed checkpointer for async runs."""
+    import aiosqlite
+    from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+    async with aiosqlite.connect(str(path or get_checkpoint_path())) as conn:
+        yield AsyncSqliteSaver(conn, serde=_checkpoint_serde())
+
+
+def build_newsroom_workflow(checkpointer=None):
     """
     Build the full newsroom workflow:
 
-    START → assignment_editor → research_assistant → reporter → copy_editor → graphic_desk → editor_in_chief → END
+    START → assignment_editor → research_assistant → reporter → copy_editor ─┬→ graphic_desk ────┬→ END
+                                                                             └→ editor_in_chief ─┘
+
+    graphic_desk and editor_in_chief only read story_brief and final_article,
+    so they fan out after copy_editor and run in the same superstep. Each writes
+    its own key (hero_image_path / approval), so the default last-value
+    channels merge both updates without conflict and the run ends once both
+    branches have finished.
+
+    Every stage has a sync and an async runner, so the compiled workflow can be
+    driven with invoke/stream or ainvoke/astream.
+
+    START routes to the first stage whose output is missing, so a state built
+    by load_resume_state() continues where an earlier run stopped. Pass a
+    `checkpointer` (see sqlite_checkpointer) to persist progress per thread_id.
     """
     builder = StateGraph(NewsroomState)
 
-    builder.add_node("assignment_editor", run_assignment_editor)
-    builder.add_node("research_assistant", run_research_assistant)
-    builder.add_node("reporter", run_reporter)
-    builder.add_node("copy_editor", run_copy_editor)
-    builder.add_node("graphic_desk", run_graphic_desk)
-    builder.add_node("editor_in_chief", run_editor_in_chief)
+    builder.add_node("assignment_editor", RunnableLambda(run_assignment_editor, afunc=arun_assignment_editor))
+    builder.add_node("research_assistant", RunnableLambda(run_research_assistant, afunc=arun_research_assistant))
+    builder.add_node("reporter", RunnableLambda(run_reporter, afunc=arun_reporter))
+    builder.add_node("copy_editor", RunnableLambda(run_copy_editor, afunc=arun_copy_editor))
+    builder.add_node("graphic_desk", RunnableLambda(run_graphic_desk, afunc=arun_graphic_desk))
+    builder.add_node("editor_in_chief", RunnableLambda(run_editor_in_chief, afunc=arun_editor_in_chief))
 
-    builder.add_edge(START, "assignment_editor")
+    builder.add_conditional_edges(START, route_start, STAGES + [END])
     builder.add_edge("assignment_editor", "research_assistant")
     builder.add_edge("research_assistant", "reporter")
     builder.add_edge("reporter", "copy_editor")
     builder.add_edge("copy_editor", "graphic_desk")
-    builder.add_edge("graphic_desk", "editor_in_chief")
+    builder.add_edge("copy_editor", "editor_in_chief")
+    builder.add_edge("graphic_desk", END)
     builder.add_edge("editor_in_chief", END)
 
-    return builder.compile()
\ No newline at end of file
+    return builder.compile(checkpointer=checkpointer)
@@ -0,0 +1,106 @@
+"""Pipelined research mode: the speculative query call runs beside extraction and analysis."""
+
+import asyncio
+import logging
+import shutil
+import time
+
+import pytest
+
+from agentic_newsroom.agents import research_assistant
+from agentic_newsroom.benchmarks import FakeChatModel, offline_clients, offline_models
+from agentic_newsroom.schemas.base import get_project_root
+from agentic_newsroom.schemas.models import StoryBrief
+
+LLM_LATENCY = 0.05
+SPECULATION_LATENCY = 1.0
+
+CONFIG = {"configurable": {"research_mode": "pipelined", "tavily_cache": False, "research_index": False}}
+
+
+@pytest.fixture
+def brief():
+    brief = StoryBrief(
+        topic="Dragon's blood trees of Socotra", angle="Why seedlings stopped surviving",
+        category="Science", article_type="Web Daily", key_questions=["Why are seedlings dying?"],
+        slug="test-pipelined-research", people_in_graphics="none",
+    )
+    yield brief
+    shutil.rmtree(get_project_root() / "artifacts" / brief.slug, ignore_errors=True)
+
+
+@pytest.fixture
+def timeline(monkeypatch):
+    """Slow down the speculative call and record when extraction starts and each analysis ends."""
+    events = {"extract_start": [], "analyzed": []}
+
+    def slow(speculate):
+        def sync_version(state, config=None):
+            time.sleep(SPECULATION_LATENCY)
+            return speculate(state, config)
+        return sync_version
+
+    def aslow(aspeculate):
+        async def async_version(state, config=None):
+            await asyncio.sleep(SPECULATION_LATENCY)
+            return await aspeculate(state, config)
+        return async_version
+
+    def timed(node, key, at_start):
+        def sync_version(state, config=None):
+            if at_start:
+                events[key].append(time.perf_counter())
+            update = node(state, config)
+            if not at_start:
+                events[key].append(time.perf_counter())
+            return update
+        return sync_version
+
+    def atimed(node, key, at_start):
+        async def async_version(state, config=None):
+            if at_start:
+                events[key].append(time.perf_counter())
+            update = await node(state, config)
+            if not at_start:
+                events[key].append(time.perf_counter())
+            return update
+        return async_version
+
+    monkeypatch.setattr(research_assistant, "_speculate", slow(research_assistant._speculate))
+    monkeypatch.setattr(research_assistant, "_aspeculate", aslow(research_assistant._aspeculate))
+    monkeypatch.setattr(research_assistant, "extract_pages_node",
+                        timed(research_assistant.extract_pages_node, "extract_start", True))
+    monkeypatch.setattr(research_assistant, "aextract_pages_node",
+                        atimed(research_assistant.aextract_pages_node, "extract_start", True))
+    monkeypatch.setattr(research_assistant, "analyze_source_node",
+                        timed(research_assistant.analyze_source_node, "analyzed", False))
+    monkeypatch.setattr(research_assistant, "aanalyze_source_node",
+                        atimed(research_assistant.aanalyze_source_node, "analyzed", False))
+    return events
+
+
+def _run(brief: StoryBrief, use_async: bool) -> dict:
+    graph = research_assistant.build_research_assistant_graph()
+    state = {"story_brief": brief, "max_turns": 2, "current_turn": 0, "context": []}
+    smart = FakeChatModel(model_name="fake-smart", latency=LLM_LATENCY)
+    mini = FakeChatModel(model_name="fake-mini", latency=LLM_LATENCY)
+    with offline_clients(), offline_models(smart, mini):
+        if use_async:
+            return asyncio.run(graph.ainvoke(state, config=CONFIG))
+        return graph.invoke(state, config=CONFIG)
+
+
+@pytest.mark.parametrize("use_async", [False, True], ids=["sync", "async"])
+def test_speculation_does_not_gate_extraction_or_analysis(brief, timeline, caplog, use_async):
+    caplog.set_level(logging.INFO, logger=research_assistant.__name__)
+
+    result = _run(brief, use_async)
+
+    # Turn 1 speculates the queries of turn 2, the last turn, which doesn't speculate
+    first_turn_start = timeline["extract_start"][0]
+    second_turn_start = timeline["extract_start"][1]
+    first_turn_analyzed = max(t for t in timeline["analyzed"] if t < second_turn_start)
+    assert first_turn_analyzed - first_turn_start < SPECULATION_LATENCY / 2
+
+    assert "Using 3 queries generated during the previous turn" in caplog.text
+    assert result["research_package"].results
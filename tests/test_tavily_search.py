@@ -0,0 +1,77 @@
+"""Extracted pages are cached under the URL they were requested as."""
+
+import asyncio
+from typing import List
+
+import pytest
+
+from agentic_newsroom.benchmarks.fakes import FakeAsyncTavilyClient, FakeTavilyClient
+from agentic_newsroom.tools import tavily_search
+from agentic_newsroom.utils.cache import SqliteCache
+
+# Requested URL -> URL Tavily reports the page under (None: the extract fails)
+REDIRECTS = {
+    "http://example.com/story?utm_source=feed": "https://www.example.com/story/",
+    "https://short.example/abc": "https://news.example.org/2024/long-article-title",
+    "https://example.com/gone": None,
+    "https://example.com/plain": "https://example.com/plain",
+}
+
+
+class RedirectingTavilyClient(FakeTavilyClient):
+    """Fake client that reports pages under their final URL and counts the URLs it fetches."""
+
+    def __init__(self):
+        super().__init__()
+        self.fetched: List[str] = []
+
+    def _extract(self, urls: List[str]) -> dict:
+        self.fetched += urls
+        resp = super()._extract([REDIRECTS[url] for url in urls if REDIRECTS[url]])
+        resp["failed_results"] = [{"url": url, "error": "Not found"} for url in urls if not REDIRECTS[url]]
+        return resp
+
+
+class AsyncRedirectingTavilyClient(RedirectingTavilyClient, FakeAsyncTavilyClient):
+    pass
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path, request):
+    client = AsyncRedirectingTavilyClient() if request.param else RedirectingTavilyClient()
+    cache = SqliteCache(tmp_path / "tavily.sqlite")
+    monkeypatch.setattr(tavily_search, "get_tavily_cache", lambda: cache)
+    monkeypatch.setattr(tavily_search, "get_tavily_client", lambda: client)
+    monkeypatch.setattr(tavily_search, "get_async_tavily_client", lambda: client)
+    return client
+
+
+def _extract(urls: List[str], use_async: bool) -> List[dict]:
+    if use_async:
+        return asyncio.run(tavily_search.aperform_extract(urls, use_cache=True))
+    return tavily_search.perform_extract(urls, use_cache=True)
+
+
+@pytest.mark.parametrize("client", [False, True], ids=["sync", "async"], indirect=True)
+def test_pages_returned_under_another_url_are_cached(client):
+    use_async = isinstance(client, FakeAsyncTavilyClient)
+    urls = list(REDIRECTS)
+
+    first = _extract(urls, use_async)
+    assert len(first) == 3
+    assert client.fetched == urls
+
+    # Every page that was extracted is served from the cache, only the failed URL is fetched again
+    client.fetched.clear()
+    second = _extract(urls, use_async)
+    assert client.fetched == ["https://example.com/gone"]
+    assert sorted(r["url"] for r in second) == sorted(r["url"] for r in first)
+
+
+@pytest.mark.parametrize("client", [False], ids=["sync"], indirect=True)
+def test_lookup_ignores_url_variants(client):
+    _extract(["https://example.com/plain"], use_async=False)
+
+    client.fetched.clear()
+    _extract(["http://www.example.com/plain/?utm_campaign=x"], use_async=False)
+    assert client.fetched == []